@@ -7,16 +7,27 @@ Generates a box-and-whisker plot of annual meteorite counts (Fell + Found),
 using the same strict year filtering as all other EDA Phase I scripts.
 """
 
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.catalog import load_catalog  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+
 # ---------------------------------------------------------------------
 # 1. Load CSV
 # ---------------------------------------------------------------------
 INPUT_CSV = Path("Meteorite_Landings.csv")
-df = pd.read_csv(INPUT_CSV)
+# Only `year` and `fall` are needed; the year range is applied while parsing
+QUERY = {
+    "columns": ["year", "fall"],
+    "where": [("year", "between", (1000, 3000))],
+}
+df = load_catalog(INPUT_CSV, typed=True, **QUERY)
 
 # ---------------------------------------------------------------------
 # 2. STRICT year validation (identical to histogram + QQ scripts)
@@ -29,7 +40,8 @@ df["year"] = df["year"].astype(int)
 # ---------------------------------------------------------------------
 # 3. Count per year
 # ---------------------------------------------------------------------
-year_counts = df.groupby("year")["fall"].count().sort_index()
+with step("groupby year", rows=len(df)):
+    year_counts = df.groupby("year")["fall"].count().sort_index()
 counts = year_counts.values
 
 print(f"YEARS INCLUDED: {len(year_counts)}")
@@ -39,33 +51,37 @@ print(f"MIN/YEAR COUNT: {counts.min()}, MAX/YEAR COUNT: {counts.max()}")
 # ---------------------------------------------------------------------
 # 4. Box Plot
 # ---------------------------------------------------------------------
-plt.figure(figsize=(8, 6))
+OUTPUT_PNG = Path("0_EDA_phase_I_boxplot_fall_counts.png")
+FIGURE = Artifact(OUTPUT_PNG, counts)
+if not FIGURE.restore():
+    plt.figure(figsize=(8, 6))
 
-plt.boxplot(counts, vert=True, patch_artist=True,
-            boxprops=dict(facecolor="#80c4ff", color="black"),
-            medianprops=dict(color="red", linewidth=2),
-            whiskerprops=dict(color="black"),
-            capprops=dict(color="black"),
-            flierprops=dict(color="black", markeredgecolor="black"))
+    plt.boxplot(counts, vert=True, patch_artist=True,
+                boxprops=dict(facecolor="#80c4ff", color="black"),
+                medianprops=dict(color="red", linewidth=2),
+                whiskerprops=dict(color="black"),
+                capprops=dict(color="black"),
+                flierprops=dict(color="black", markeredgecolor="black"))
 
-plt.title("Box-and-Whisker Plot — Raw Meteorite Landings data\nAnnual Meteorite Landings (Fell + Found)")
-plt.ylabel("Annual Meteorite Count")
-plt.xlabel("Distribution")
+    plt.title("Box-and-Whisker Plot — Raw Meteorite Landings data\nAnnual Meteorite Landings (Fell + Found)")
+    plt.ylabel("Annual Meteorite Count")
+    plt.xlabel("Distribution")
 
-# ---------------------------------------------------------------------
-# 5. Figure Stub
-# ---------------------------------------------------------------------
-plt.figtext(
-    0.02, -0.03,
-    "Figure 4. Box-and-whisker plot of annual meteorite counts.",
-    ha="left",
-    fontsize=10
-)
+    # ---------------------------------------------------------------------
+    # 5. Figure Stub
+    # ---------------------------------------------------------------------
+    plt.figtext(
+        0.02, -0.03,
+        "Figure 4. Box-and-whisker plot of annual meteorite counts.",
+        ha="left",
+        fontsize=10
+    )
 
-plt.tight_layout()
+    plt.tight_layout()
 
-OUTPUT_PNG = Path("0_EDA_phase_I_boxplot_fall_counts.png")
-plt.savefig(OUTPUT_PNG, dpi=300, bbox_inches="tight")
-plt.close()
+    with step("savefig"):
+        plt.savefig(OUTPUT_PNG, dpi=300, bbox_inches="tight")
+    plt.close()
+    FIGURE.store()
 
-print(f"✔ Box plot saved to: {OUTPUT_PNG.resolve()}")
+    print(f"✔ Box plot saved to: {OUTPUT_PNG.resolve()}")
@@ -11,16 +11,27 @@ Generates TWO histograms of annual meteorite counts (Fell + Found):
 Both use strict year filtering identical to the QQ-plot script.
 """
 
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.catalog import load_catalog  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+
 # ---------------------------------------------------------------------
 # 1. Load CSV
 # ---------------------------------------------------------------------
 INPUT_CSV = Path("Meteorite_Landings.csv")
-df = pd.read_csv(INPUT_CSV)
+# Only `year` and `fall` are needed; the year range is applied while parsing
+QUERY = {
+    "columns": ["year", "fall"],
+    "where": [("year", "between", (1000, 3000))],
+}
+df = load_catalog(INPUT_CSV, typed=True, **QUERY)
 
 # ---------------------------------------------------------------------
 # 2. STRICT year validation (matches QQ plot)
@@ -33,7 +44,8 @@ df["year"] = df["year"].astype(int)
 # ---------------------------------------------------------------------
 # 3. Counts per year
 # ---------------------------------------------------------------------
-year_counts = df.groupby("year")["fall"].count().sort_index()
+with step("groupby year", rows=len(df)):
+    year_counts = df.groupby("year")["fall"].count().sort_index()
 counts = year_counts.values
 
 print(f"YEARS INCLUDED: {len(year_counts)}")
@@ -43,53 +55,61 @@ print(f"MIN/YEAR COUNT: {counts.min()}, MAX/YEAR COUNT: {counts.max()}")
 # =====================================================================
 #  FIRST HISTOGRAM (normal y-axis)
 # =====================================================================
-plt.figure(figsize=(8, 6))
-
-plt.hist(counts, bins=20, color="#2a6fdb", edgecolor="black", alpha=0.85)
-plt.title("Histogram — Annual Meteorite Landings (Fell + Found)")
-plt.xlabel("Annual Meteorite Count")
-plt.ylabel("Frequency")
-
-# Stub text (Figure label)
-plt.figtext(
-    0.02, -0.03,
-    "Figure 2. Histogram of annual meteorite counts from the Meteorite Landings dataset.",
-    ha="left",
-    fontsize=10
-)
-
-plt.tight_layout()
 OUTPUT_STD = Path("0_EDA_phase_I_histogram_standard.png")
-plt.savefig(OUTPUT_STD, dpi=300, bbox_inches="tight")
-plt.close()
-
-print(f"✔ Standard histogram saved to: {OUTPUT_STD.resolve()}")
+FIGURE_STD = Artifact(OUTPUT_STD, counts)
+if not FIGURE_STD.restore():
+    plt.figure(figsize=(8, 6))
 
+    plt.hist(counts, bins=20, color="#2a6fdb", edgecolor="black", alpha=0.85)
+    plt.title("Histogram — Annual Meteorite Landings (Fell + Found)")
+    plt.xlabel("Annual Meteorite Count")
+    plt.ylabel("Frequency")
 
-# =====================================================================
-#  SECOND HISTOGRAM (log-scaled y-axis)
-# =====================================================================
-plt.figure(figsize=(8, 6))
+    # Stub text (Figure label)
+    plt.figtext(
+        0.02, -0.03,
+        "Figure 2. Histogram of annual meteorite counts from the Meteorite Landings dataset.",
+        ha="left",
+        fontsize=10
+    )
 
-plt.hist(counts, bins=20, color="#4caf50", edgecolor="black", alpha=0.85)
-plt.yscale("log")   # LOG SCALE
+    plt.tight_layout()
+    with step("savefig standard"):
+        plt.savefig(OUTPUT_STD, dpi=300, bbox_inches="tight")
+    plt.close()
+    FIGURE_STD.store()
 
-# UPDATED title and y-label
-plt.title("Histogram — Annual Meteorite Landings (Log-Scaled Frequencies)")
-plt.xlabel("Annual Meteorite Count")
-plt.ylabel("Log(Frequency of Years)")
+    print(f"✔ Standard histogram saved to: {OUTPUT_STD.resolve()}")
 
-# Stub text (Figure label)
-plt.figtext(
-    0.02, -0.03,
-    "Figure 3. Histogram of annual meteorite counts with log-scaled frequencies.",
-    ha="left",
-    fontsize=10
-)
 
-plt.tight_layout()
+# =====================================================================
+#  SECOND HISTOGRAM (log-scaled y-axis)
+# =====================================================================
 OUTPUT_LOG = Path("0_EDA_phase_I_histogram_logscale.png")
-plt.savefig(OUTPUT_LOG, dpi=300, bbox_inches="tight")
-plt.close()
-
-print(f"✔ Log-scale histogram saved to: {OUTPUT_LOG.resolve()}")
+FIGURE_LOG = Artifact(OUTPUT_LOG, counts)
+if not FIGURE_LOG.restore():
+    plt.figure(figsize=(8, 6))
+
+    plt.hist(counts, bins=20, color="#4caf50", edgecolor="black", alpha=0.85)
+    plt.yscale("log")   # LOG SCALE
+
+    # UPDATED title and y-label
+    plt.title("Histogram — Annual Meteorite Landings (Log-Scaled Frequencies)")
+    plt.xlabel("Annual Meteorite Count")
+    plt.ylabel("Log(Frequency of Years)")
+
+    # Stub text (Figure label)
+    plt.figtext(
+        0.02, -0.03,
+        "Figure 3. Histogram of annual meteorite counts with log-scaled frequencies.",
+        ha="left",
+        fontsize=10
+    )
+
+    plt.tight_layout()
+    with step("savefig logscale"):
+        plt.savefig(OUTPUT_LOG, dpi=300, bbox_inches="tight")
+    plt.close()
+    FIGURE_LOG.store()
+
+    print(f"✔ Log-scale histogram saved to: {OUTPUT_LOG.resolve()}")
@@ -10,22 +10,35 @@ Output:
     master_table.html
 """
 
+import sys
 import pandas as pd
 from pathlib import Path
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.catalog import load_catalog  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+
 # ---------------------------------------------------------------------
 # 1. INPUT CSV
 # ---------------------------------------------------------------------
 INPUT_CSV = Path("Meteorite_Landings.csv")
 OUTPUT_HTML = Path("master_table.html")
 
-df = pd.read_csv(INPUT_CSV)
+df = load_catalog(INPUT_CSV)
 
 # Dataset dimensions
 rows, cols = df.shape
 dataset_banner = f"Dataset Size: {rows:,} rows × {cols:,} columns"
 
+# ---------------------------------------------------------------------
+# Unchanged input → reuse the cached table (artifacts.py)
+# ---------------------------------------------------------------------
+TABLE = Artifact(OUTPUT_HTML, df)
+if TABLE.restore():
+    sys.exit(0)
+
 # ---------------------------------------------------------------------
 # 2. DESCRIPTION MAP (clean ASCII-safe text)
 # ---------------------------------------------------------------------
@@ -180,6 +193,8 @@ html_bottom = """
 # ---------------------------------------------------------------------
 # 6. Write HTML file
 # ---------------------------------------------------------------------
-OUTPUT_HTML.write_text(html_top + html_mid + html_bottom, encoding="utf-8")
+with step("write html"):
+    OUTPUT_HTML.write_text(html_top + html_mid + html_bottom, encoding="utf-8")
+TABLE.store()
 
 print(f"✔ Master table written to: {OUTPUT_HTML.resolve()}")
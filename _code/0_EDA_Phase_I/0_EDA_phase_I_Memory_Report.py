@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+0_EDA_phase_I_Memory_Report.py
+
+Prints the resident memory of the raw catalog under three loads:
+    1. pandas defaults (object / float64 columns)
+    2. the declared typed schema (meteorite_eda.catalog.CATALOG_SCHEMA)
+    3. the typed schema without the redundant GeoLocation column
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.catalog import memory_report  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+
+# ---------------------------------------------------------------------
+# 1. Build report
+# ---------------------------------------------------------------------
+INPUT_CSV = Path("Meteorite_Landings.csv")
+with step("memory report"):
+    report = memory_report(INPUT_CSV)
+
+raw_total = report.loc["TOTAL", "raw bytes"]
+typed_total = report.loc["TOTAL", "typed bytes"]
+lean_total = report.loc["TOTAL", "lean bytes"]
+
+# ---------------------------------------------------------------------
+# 2. Print (bytes → MB)
+# ---------------------------------------------------------------------
+for col in ["raw bytes", "typed bytes", "lean bytes"]:
+    report[col] = report[col].map(lambda v: f"{v / 1e6:.3f} MB")
+
+print(report.to_string())
+print()
+print(f"Typed schema:          {typed_total / raw_total * 100:.1f}% of raw")
+print(f"Typed, no GeoLocation: {lean_total / raw_total * 100:.1f}% of raw")
@@ -7,15 +7,27 @@ Creates an Outlier Summary Table (HTML) for annual meteorite counts.
 Uses strict year filtering and consistent formatting with Phase I deliverables.
 """
 
+import sys
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.catalog import catalog_columns, load_catalog  # noqa: E402
+from meteorite_eda.moments import Moments  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+
 # ---------------------------------------------------------------------
 # 1. Load CSV
 # ---------------------------------------------------------------------
 INPUT_CSV = Path("Meteorite_Landings.csv")
-df = pd.read_csv(INPUT_CSV)
+# Only `year` and `fall` are needed; the year range is applied while parsing
+QUERY = {
+    "columns": ["year", "fall"],
+    "where": [("year", "between", (1000, 3000))],
+}
+df = load_catalog(INPUT_CSV, typed=True, **QUERY)
 
 # ---------------------------------------------------------------------
 # 2. STRICT year validation (consistent with prior EDA scripts)
@@ -25,20 +37,36 @@ df = df[df["year"].between(1000, 3000)]
 df = df.dropna(subset=["year"])
 df["year"] = df["year"].astype(int)
 
+# The banner reports the full catalog width, which the two loaded
+# columns do not show, so it is part of the cache key
+cols = len(catalog_columns(INPUT_CSV))
+
+# ---------------------------------------------------------------------
+# Unchanged input → reuse the cached table (artifacts.py)
+# ---------------------------------------------------------------------
+OUTPUT_HTML = Path("0_EDA_phase_I_outlier_table.html")
+TABLE = Artifact(OUTPUT_HTML, df, columns=cols)
+if TABLE.restore():
+    sys.exit(0)
+
 # ---------------------------------------------------------------------
 # 3. Compute yearly meteorite counts
 # ---------------------------------------------------------------------
-year_counts = df.groupby("year")["fall"].count().sort_index()
+with step("groupby year", rows=len(df)):
+    year_counts = df.groupby("year")["fall"].count().sort_index()
 counts = year_counts.values
 
 # ---------------------------------------------------------------------
 # 4. Compute statistics for outlier table
 # ---------------------------------------------------------------------
-total_count = len(counts)
-vmin        = counts.min()
-vmax        = counts.max()
-vmean       = counts.mean()
-vstd        = counts.std()
+# count / min / max / mean / std in one pass (moments.py)
+with step("moments", rows=len(counts)):
+    m = Moments.of(counts)
+total_count = int(m.n)
+vmin        = m.min
+vmax        = m.max
+vmean       = m.mean
+vstd        = m.std
 
 q25         = np.percentile(counts, 25)
 q50         = np.percentile(counts, 50)
@@ -85,7 +113,7 @@ table_data = {
 df_out = pd.DataFrame(table_data)
 
 # Dataset size subtitle
-rows, cols = df.shape
+rows = len(df)
 dataset_banner = f"Dataset Size: {rows:,} rows × {cols:,} columns"
 
 # ---------------------------------------------------------------------
@@ -201,7 +229,8 @@ html_bottom = """
 # ---------------------------------------------------------------------
 # 7. Save HTML file
 # ---------------------------------------------------------------------
-OUTPUT_HTML = Path("0_EDA_phase_I_outlier_table.html")
-OUTPUT_HTML.write_text(html_top + html_mid + html_bottom, encoding="utf-8")
+with step("write html"):
+    OUTPUT_HTML.write_text(html_top + html_mid + html_bottom, encoding="utf-8")
+TABLE.store()
 
 print(f"✔ Outlier summary table saved to: {OUTPUT_HTML.resolve()}")
@@ -10,17 +10,21 @@ Output:
     master_table.html
 """
 
+import sys
 import pandas as pd
 from pathlib import Path
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.catalog import load_catalog  # noqa: E402
+
 # ---------------------------------------------------------------------
 # 1. INPUT CSV
 # ---------------------------------------------------------------------
 INPUT_CSV = Path("Meteorite_Landings.csv")
 OUTPUT_HTML = Path("master_table.html")
 
-df = pd.read_csv(INPUT_CSV)
+df = load_catalog(INPUT_CSV)
 
 # Dataset dimensions
 rows, cols = df.shape
@@ -9,16 +9,21 @@ Generates a box-and-whisker plot of the cleaned Phase II dataset:
 - Outputs: 0_EDA_phase_II_boxplot.png
 """
 
-import pandas as pd
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.session import load_frame  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+
 # ---------------------------------------------------------------------
 # 1. Load Phase II CSV
 # ---------------------------------------------------------------------
 INPUT = Path("Meteorite_Landings_Phase_II.csv")
-df = pd.read_csv(INPUT)
+df = load_frame(INPUT)
 
 if "count" not in df.columns:
     raise ValueError("Phase II CSV must contain 'count' column.")
@@ -33,40 +38,44 @@ print(f"COUNT RANGE: min={counts.min()}, max={counts.max()}")
 # ---------------------------------------------------------------------
 # 2. Create Box Plot
 # ---------------------------------------------------------------------
-plt.figure(figsize=(8, 6))
+OUTPUT = Path("0_EDA_phase_II_boxplot.png")
+FIGURE = Artifact(OUTPUT, counts)
+if not FIGURE.restore():
+    plt.figure(figsize=(8, 6))
 
-plt.boxplot(
-    counts,
-    vert=True,
-    patch_artist=True,
-    boxprops=dict(facecolor="#80c4ff", color="black"),
-    medianprops=dict(color="red", linewidth=2),
-    whiskerprops=dict(color="black"),
-    capprops=dict(color="black"),
-    flierprops=dict(marker='o', color='black', markeredgecolor='black')
-)
+    plt.boxplot(
+        counts,
+        vert=True,
+        patch_artist=True,
+        boxprops=dict(facecolor="#80c4ff", color="black"),
+        medianprops=dict(color="red", linewidth=2),
+        whiskerprops=dict(color="black"),
+        capprops=dict(color="black"),
+        flierprops=dict(marker='o', color='black', markeredgecolor='black')
+    )
 
-plt.title("Box-and-Whisker Plot — Phase II Annual Meteorite Counts")
-plt.ylabel("Annual Meteorite Count")
-plt.xlabel("Distribution")
+    plt.title("Box-and-Whisker Plot — Phase II Annual Meteorite Counts")
+    plt.ylabel("Annual Meteorite Count")
+    plt.xlabel("Distribution")
 
-# ---------------------------------------------------------------------
-# 3. Stub under graph (centered)
-# ---------------------------------------------------------------------
-plt.figtext(
-    0.5, -0.05,
-    "Graph 7. Box-and-whisker plot for the Phase II annual meteorite count distribution.",
-    ha="center",
-    fontsize=10
-)
+    # ---------------------------------------------------------------------
+    # 3. Stub under graph (centered)
+    # ---------------------------------------------------------------------
+    plt.figtext(
+        0.5, -0.05,
+        "Graph 7. Box-and-whisker plot for the Phase II annual meteorite count distribution.",
+        ha="center",
+        fontsize=10
+    )
 
-plt.tight_layout()
+    plt.tight_layout()
 
-# ---------------------------------------------------------------------
-# 4. Save Output
-# ---------------------------------------------------------------------
-OUTPUT = Path("0_EDA_phase_II_boxplot.png")
-plt.savefig(OUTPUT, dpi=300, bbox_inches="tight")
-plt.close()
+    # ---------------------------------------------------------------------
+    # 4. Save Output
+    # ---------------------------------------------------------------------
+    with step("savefig"):
+        plt.savefig(OUTPUT, dpi=300, bbox_inches="tight")
+    plt.close()
+    FIGURE.store()
 
-print(f"✔ Phase II box plot saved to: {OUTPUT.resolve()}")
+    print(f"✔ Phase II box plot saved to: {OUTPUT.resolve()}")
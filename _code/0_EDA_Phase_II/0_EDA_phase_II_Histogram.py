@@ -15,16 +15,21 @@ Outputs:
     0_EDA_phase_II_histogram_logscale.png
 """
 
-import pandas as pd
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.session import load_frame  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+
 # ---------------------------------------------------------------------
 # 1. Load Phase II CSV
 # ---------------------------------------------------------------------
 INPUT = Path("Meteorite_Landings_Phase_II.csv")
-df = pd.read_csv(INPUT)
+df = load_frame(INPUT)
 
 if "count" not in df.columns:
     raise ValueError("Phase II CSV must contain 'count' column.")
@@ -39,52 +44,60 @@ print(f"COUNT RANGE: min={counts.min()}, max={counts.max()}")
 # =====================================================================
 #  FIRST HISTOGRAM (Standard Y-axis)
 # =====================================================================
-plt.figure(figsize=(8, 6))
-
-plt.hist(counts, bins=20, color="#2a6fdb", edgecolor="black", alpha=0.85)
-plt.title("Histogram — Phase II Annual Meteorite Counts")
-plt.xlabel("Annual Meteorite Count")
-plt.ylabel("Frequency")
-
-# Stub text under graph
-plt.figtext(
-    0.5, -0.05,
-    "Figure 5. Standard histogram for Phase II annual meteorite counts.",
-    ha="center",
-    fontsize=10
-)
-
-plt.tight_layout()
 OUT_STD = Path("0_EDA_phase_II_histogram_standard.png")
-plt.savefig(OUT_STD, dpi=300, bbox_inches="tight")
-plt.close()
-
-print(f"✔ Standard histogram saved to: {OUT_STD.resolve()}")
+FIGURE_STD = Artifact(OUT_STD, counts)
+if not FIGURE_STD.restore():
+    plt.figure(figsize=(8, 6))
 
+    plt.hist(counts, bins=20, color="#2a6fdb", edgecolor="black", alpha=0.85)
+    plt.title("Histogram — Phase II Annual Meteorite Counts")
+    plt.xlabel("Annual Meteorite Count")
+    plt.ylabel("Frequency")
 
-# =====================================================================
-#  SECOND HISTOGRAM (Log-scaled Y-axis)
-# =====================================================================
-plt.figure(figsize=(8, 6))
+    # Stub text under graph
+    plt.figtext(
+        0.5, -0.05,
+        "Figure 5. Standard histogram for Phase II annual meteorite counts.",
+        ha="center",
+        fontsize=10
+    )
 
-plt.hist(counts, bins=20, color="#4caf50", edgecolor="black", alpha=0.85)
-plt.yscale("log")
+    plt.tight_layout()
+    with step("savefig standard"):
+        plt.savefig(OUT_STD, dpi=300, bbox_inches="tight")
+    plt.close()
+    FIGURE_STD.store()
 
-plt.title("Histogram — Phase II Annual Meteorite Counts (Log-Scaled)")
-plt.xlabel("Annual Meteorite Count")
-plt.ylabel("Log(Frequency of Years)")
+    print(f"✔ Standard histogram saved to: {OUT_STD.resolve()}")
 
-# Stub text under graph
-plt.figtext(
-    0.5, -0.05,
-    "Figure 6. Log-scaled histogram for Phase II annual meteorite counts.",
-    ha="center",
-    fontsize=10
-)
 
-plt.tight_layout()
+# =====================================================================
+#  SECOND HISTOGRAM (Log-scaled Y-axis)
+# =====================================================================
 OUT_LOG = Path("0_EDA_phase_II_histogram_logscale.png")
-plt.savefig(OUT_LOG, dpi=300, bbox_inches="tight")
-plt.close()
-
-print(f"✔ Log-scale histogram saved to: {OUT_LOG.resolve()}")
+FIGURE_LOG = Artifact(OUT_LOG, counts)
+if not FIGURE_LOG.restore():
+    plt.figure(figsize=(8, 6))
+
+    plt.hist(counts, bins=20, color="#4caf50", edgecolor="black", alpha=0.85)
+    plt.yscale("log")
+
+    plt.title("Histogram — Phase II Annual Meteorite Counts (Log-Scaled)")
+    plt.xlabel("Annual Meteorite Count")
+    plt.ylabel("Log(Frequency of Years)")
+
+    # Stub text under graph
+    plt.figtext(
+        0.5, -0.05,
+        "Figure 6. Log-scaled histogram for Phase II annual meteorite counts.",
+        ha="center",
+        fontsize=10
+    )
+
+    plt.tight_layout()
+    with step("savefig logscale"):
+        plt.savefig(OUT_LOG, dpi=300, bbox_inches="tight")
+    plt.close()
+    FIGURE_LOG.store()
+
+    print(f"✔ Log-scale histogram saved to: {OUT_LOG.resolve()}")
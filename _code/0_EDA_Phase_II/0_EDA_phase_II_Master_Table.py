@@ -8,18 +8,32 @@ Inputs: Meteorite_Landings_Phase_II.csv
 Outputs: 0_EDA_phase_II_Master_Table.html
 """
 
+import sys
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.session import load_frame  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+
 # ---------------------------------------------------------------------
 # 1. Load Phase II CSV
 # ---------------------------------------------------------------------
 INPUT = Path("Meteorite_Landings_Phase_II.csv")
-df = pd.read_csv(INPUT)
+df = load_frame(INPUT)
 
 rows, cols = df.shape
 
+# ---------------------------------------------------------------------
+# Unchanged input → reuse the cached table (artifacts.py)
+# ---------------------------------------------------------------------
+OUTPUT = Path("0_EDA_phase_II_Master_Table.html")
+TABLE = Artifact(OUTPUT, df)
+if TABLE.restore():
+    sys.exit(0)
+
 # ---------------------------------------------------------------------
 # 2. Build Master Table Columns
 # ---------------------------------------------------------------------
@@ -163,7 +177,8 @@ html_bottom = """
 # ---------------------------------------------------------------------
 # 4. Save HTML file
 # ---------------------------------------------------------------------
-OUTPUT = Path("0_EDA_phase_II_Master_Table.html")
-OUTPUT.write_text(html_top + html_mid + html_bottom, encoding="utf-8")
+with step("write html"):
+    OUTPUT.write_text(html_top + html_mid + html_bottom, encoding="utf-8")
+TABLE.store()
 
 print(f"✔ Phase II Master Table saved to: {OUTPUT.resolve()}")
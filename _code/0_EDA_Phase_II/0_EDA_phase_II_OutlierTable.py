@@ -15,42 +15,89 @@ Computes:
 - 25th, 50th, 75th percentiles
 - % within IQR
 - number of outliers
+
+Usage:
+    python 0_EDA_phase_II_OutlierTable.py               # exact, in memory
+    python 0_EDA_phase_II_OutlierTable.py --sketch -j 4
+
+--sketch streams the CSV instead of loading it: count/min/max/mean/std
+stay exact (moments.py) and the percentiles, fences and % within IQR come
+from a mergeable KLL sketch (sketches.py) whose rank-error bound is added
+to the table.
 """
 
+import sys
+import argparse
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.moments import Moments, summarize_csv  # noqa: E402
+from meteorite_eda.session import load_frame  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+from meteorite_eda.sketches import DEFAULT_DELTA, KLLSketch  # noqa: E402
+
+parser = argparse.ArgumentParser(description="Phase II outlier summary table")
+parser.add_argument("--sketch", action="store_true",
+                    help="stream the CSV and estimate percentiles with a KLL sketch")
+parser.add_argument("-j", "--workers", type=int, default=1,
+                    help="processes for --sketch (default: %(default)s)")
+args = parser.parse_args()
+
 # ---------------------------------------------------------------------
 # 1. Load Phase II CSV
 # ---------------------------------------------------------------------
 INPUT = Path("Meteorite_Landings_Phase_II.csv")
-df = pd.read_csv(INPUT)
+# --sketch only reads the header here; the data is streamed below
+df = pd.read_csv(INPUT, nrows=0) if args.sketch else load_frame(INPUT)
 
 if "count" not in df.columns:
     raise ValueError("Phase II CSV must contain 'year' and 'count' columns.")
 
-counts = df["count"].values
 rows, cols = df.shape
 
 # ---------------------------------------------------------------------
-# 2. Compute Statistics
+# Unchanged input → reuse the cached table (artifacts.py)
 # ---------------------------------------------------------------------
-total_count = len(counts)
-vmin        = counts.min()
-vmax        = counts.max()
-vmean       = counts.mean()
-vstd        = counts.std()
+OUTPUT = Path("0_EDA_phase_II_OutlierTable.html")
+TABLE = Artifact(OUTPUT, INPUT if args.sketch else df)
+if TABLE.restore():
+    sys.exit(0)
 
-q25 = np.percentile(counts, 25)
-q50 = np.percentile(counts, 50)
-q75 = np.percentile(counts, 75)
+# ---------------------------------------------------------------------
+# 2. Compute Statistics
+# ---------------------------------------------------------------------
+if args.sketch:
+    with step("summarize csv") as s:
+        rows, summary = summarize_csv(INPUT, ["count"], (Moments, KLLSketch),
+                                      workers=args.workers)
+        s.rows = rows
+    m, sketch = summary["count"]
+    total_count = int(m.n)
+    vmin, vmax, vmean, vstd = m.min, m.max, m.mean, m.std
+    q25, q50, q75 = (float(f"{q:.3f}") for q in sketch.quantiles([25, 50, 75]))
+else:
+    counts = df["count"].values
+    total_count = len(counts)
+    vmin        = counts.min()
+    vmax        = counts.max()
+    vmean       = counts.mean()
+    vstd        = counts.std()
+
+    q25 = np.percentile(counts, 25)
+    q50 = np.percentile(counts, 50)
+    q75 = np.percentile(counts, 75)
 
 iqr = q75 - q25
 lower_bound = q25 - 1.5 * iqr
 upper_bound = q75 + 1.5 * iqr
 
-within_iqr = ((counts >= lower_bound) & (counts <= upper_bound)).sum()
+if args.sketch:
+    within_iqr = sketch.count_between(lower_bound, upper_bound)
+else:
+    within_iqr = ((counts >= lower_bound) & (counts <= upper_bound)).sum()
 pct_within = within_iqr / total_count * 100
 outliers   = total_count - within_iqr
 
@@ -82,6 +129,14 @@ table_data = {
     ]
 }
 
+if args.sketch:
+    # the in-fence count combines two rank estimates
+    eps = sketch.rank_error()
+    table_data["Value"][8] += f" ± {2 * eps * 100:.2f}%"
+    table_data["Statistic"].append(
+        f"Percentile Rank Error (KLL k={sketch.k}, {100 * (1 - DEFAULT_DELTA):.0f}%)")
+    table_data["Value"].append(f"± {eps * 100:.2f}%")
+
 df_out = pd.DataFrame(table_data)
 
 dataset_banner = f"Dataset Size: {rows:,} rows × {cols:,} columns"
@@ -201,7 +256,8 @@ html_bottom = """
 # ---------------------------------------------------------------------
 # 4. Save HTML File
 # ---------------------------------------------------------------------
-OUTPUT = Path("0_EDA_phase_II_OutlierTable.html")
-OUTPUT.write_text(html_top + html_mid + html_bottom, encoding="utf-8")
+with step("write html"):
+    OUTPUT.write_text(html_top + html_mid + html_bottom, encoding="utf-8")
+TABLE.store()
 
 print(f"✔ Phase II Outlier Table saved to: {OUTPUT.resolve()}")
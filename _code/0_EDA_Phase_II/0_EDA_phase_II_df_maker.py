@@ -10,55 +10,133 @@ Creates a cleaned, reduced dataframe for Phase II EDA:
 - Removes missing fall entries
 - Removes duplicate IDs
 - Outputs: Meteorite_Landings_Phase_II.csv
+
+- Saves the aggregation state: Meteorite_Landings_Phase_II.state.npz
+  (+ the seen-id bitmap chunks in Meteorite_Landings_Phase_II.state.ids/)
+
+Usage:
+    python 0_EDA_phase_II_df_maker.py                      # in-memory
+    python 0_EDA_phase_II_df_maker.py --chunksize 1000000  # streaming
+    python 0_EDA_phase_II_df_maker.py --append new_rows.csv \
+        --phase-iii ../0_EDA_Phase_III/Meteorite_Landings_Phase_III.csv
+
+Streaming mode reads the catalog in bounded chunks and produces the same
+CSV; peak memory is set by the chunk size rather than the catalog size.
+
+Append mode loads the saved state (per-year counts + seen ids), folds in
+only the new raw rows and rewrites the Phase II CSV. With --phase-iii the
+derived Phase III table (count_log, count_sqrt) is refreshed as well.
 """
 
+import sys
+import argparse
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
-# ---------------------------------------------------------------------
-# 1. Load original CSV
-# ---------------------------------------------------------------------
-INPUT = Path("Meteorite_Landings.csv")
-df = pd.read_csv(INPUT)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.catalog import load_catalog  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+from meteorite_eda.transforms import phase_iii_frame  # noqa: E402
+from meteorite_eda.yearcounts import (  # noqa: E402
+    YEAR_MIN, YearCountState, stream_year_counts,
+)
 
-# ---------------------------------------------------------------------
-# 2. CLEANING STEPS
-# ---------------------------------------------------------------------
+parser = argparse.ArgumentParser(description="Build Meteorite_Landings_Phase_II.csv")
+parser.add_argument("--input", default="Meteorite_Landings.csv",
+                    help="raw catalog CSV (default: %(default)s)")
+parser.add_argument("--chunksize", type=int, default=None,
+                    help="stream the catalog in chunks of this many rows")
+parser.add_argument("--append", metavar="NEW_CSV", default=None,
+                    help="fold new raw rows into the saved state instead of rebuilding")
+parser.add_argument("--phase-iii", metavar="PATH", default=None,
+                    help="also write the derived Phase III CSV to PATH")
+args = parser.parse_args()
 
-# -- Remove duplicate IDs
-df = df.drop_duplicates(subset="id", keep="first")
+INPUT = Path(args.input)
+OUTPUT = Path("Meteorite_Landings_Phase_II.csv")
+STATE = Path("Meteorite_Landings_Phase_II.state.npz")
 
-# -- coerce year to numeric
-df["year"] = pd.to_numeric(df["year"], errors="coerce")
+if args.append:
+    # -----------------------------------------------------------------
+    # APPEND: only the new rows are read; the state carries the rest
+    # -----------------------------------------------------------------
+    if not STATE.exists():
+        raise FileNotFoundError(f"{STATE} not found; run a full build first.")
 
-# -- remove rows without valid year
-df = df.dropna(subset=["year"])
+    state = YearCountState.load(STATE)
+    before = state.totals.copy()
+    added = state.ingest_csv(args.append, chunksize=args.chunksize or 1_000_000)
+    year_counts = state.frame()
 
-# -- convert to int
-df["year"] = df["year"].astype(int)
+    changed = np.flatnonzero(state.totals != before) + state.year_min
+    print(f"Rows added: {added:,}; years updated: {len(changed)}")
+    if len(changed):
+        print("  " + ", ".join(str(y) for y in changed[:20])
+              + (" ..." if len(changed) > 20 else ""))
 
-# -- remove rows outside valid range
-df = df[df["year"].between(0, 2013)]
+elif args.chunksize:
+    # -----------------------------------------------------------------
+    # STREAMING: chunked read, cross-chunk id dedup, merged year counts
+    # -----------------------------------------------------------------
+    state = YearCountState()
+    year_counts = stream_year_counts(INPUT, chunksize=args.chunksize, state=state)
 
-# -- remove rows missing 'fall'
-df = df.dropna(subset=["fall"])
+else:
+    # -----------------------------------------------------------------
+    # 1. Load original CSV
+    # -----------------------------------------------------------------
+    df = load_catalog(INPUT, columns=["id", "year", "fall"])
 
-# ---------------------------------------------------------------------
-# 3. GROUP BY YEAR → compute counts
-# ---------------------------------------------------------------------
-year_counts = (
-    df.groupby("year")["fall"]
-    .count()
-    .reset_index()
-    .rename(columns={"fall": "count"})
-)
+    # -----------------------------------------------------------------
+    # 2. CLEANING STEPS
+    # -----------------------------------------------------------------
+
+    # -- Remove duplicate IDs
+    df = df.drop_duplicates(subset="id", keep="first")
+    seen_ids = df["id"].to_numpy()
+
+    # -- coerce year to numeric
+    df["year"] = pd.to_numeric(df["year"], errors="coerce")
+
+    # -- remove rows without valid year
+    df = df.dropna(subset=["year"])
+
+    # -- convert to int
+    df["year"] = df["year"].astype(int)
+
+    # -- remove rows outside valid range
+    df = df[df["year"].between(0, 2013)]
+
+    # -- remove rows missing 'fall'
+    df = df.dropna(subset=["fall"])
+
+    # -----------------------------------------------------------------
+    # 3. GROUP BY YEAR → compute counts
+    # -----------------------------------------------------------------
+    with step("groupby year", rows=len(df)):
+        year_counts = (
+            df.groupby("year")["fall"]
+            .count()
+            .reset_index()
+            .rename(columns={"fall": "count"})
+        )
+
+    state = YearCountState()
+    state.seen.add(seen_ids)
+    state.totals[year_counts["year"].to_numpy() - YEAR_MIN] = year_counts["count"].to_numpy()
 
 # ---------------------------------------------------------------------
-# 4. OUTPUT CSV
+# 4. OUTPUT CSV (+ state for later appends)
 # ---------------------------------------------------------------------
-OUTPUT = Path("Meteorite_Landings_Phase_II.csv")
-year_counts.to_csv(OUTPUT, index=False)
+with step("write csv", rows=len(year_counts)):
+    year_counts.to_csv(OUTPUT, index=False)
+state.save(STATE)
+
+if args.phase_iii:
+    PHASE_III = Path(args.phase_iii)
+    phase_iii_frame(year_counts).to_csv(PHASE_III, index=False)
+    print(f"✔ Phase III dataset refreshed: {PHASE_III.resolve()}")
 
 print("✔ Phase II dataset created:")
 print(f"  {OUTPUT.resolve()}")
@@ -11,28 +11,37 @@ Outputs:
     boxplot_count_sqrt.png
 """
 
-import pandas as pd
+import sys
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.session import column, load_frame  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+
 # ---------------------------------------------------------------------
 # 1. Load Phase III dataset
 # ---------------------------------------------------------------------
 INPUT = Path("Meteorite_Landings_Phase_III.csv")
-df = pd.read_csv(INPUT)
+df = load_frame(INPUT)
 
 required_cols = ["count_log", "count_sqrt"]
 for col in required_cols:
     if col not in df.columns:
         raise ValueError(f"Missing required column: {col}")
 
-log_vals = df["count_log"]
-sqrt_vals = df["count_sqrt"]
+log_vals = column(INPUT, "count_log")
+sqrt_vals = column(INPUT, "count_sqrt")
 
 # ---------------------------------------------------------------------
 # Helper function for generating a box plot
 # ---------------------------------------------------------------------
 def make_box_plot(values, title, y_label, filename, stub_text):
+    figure = Artifact(filename, values, title=title, y_label=y_label, stub_text=stub_text)
+    if figure.restore():
+        return
+
     plt.figure(figsize=(7, 6))
 
     plt.boxplot(values, vert=True, patch_artist=True,
@@ -53,8 +62,10 @@ def make_box_plot(values, title, y_label, filename, stub_text):
     )
 
     plt.tight_layout()
-    plt.savefig(filename, dpi=300, bbox_inches="tight")
+    with step(f"savefig {filename}"):
+        plt.savefig(filename, dpi=300, bbox_inches="tight")
     plt.close()
+    figure.store()
     print(f"✔ Saved: {filename}")
 
 # ---------------------------------------------------------------------
@@ -12,48 +12,80 @@ Outputs:
 This script evaluates the topology of the Phase II dataset:
 - Skewness
 - Kurtosis
-- Multimodality (via KDE peak count)
+- Multimodality (via KDE peak count, with mode locations and prominences)
 - Shape classification
 - Transformation suggestions
 - Elucidation and detailed guidance columns
+
+The KDE is binned and convolved by FFT (density.py), so the cost stays at
+O(n + grid log grid) however many years the input holds.
+
+Usage:
+    python 0_EDA_phase_III_Data_Topology_check.py              # 512-point grid
+    python 0_EDA_phase_III_Data_Topology_check.py --grid 4096
 """
 
+import sys
+import argparse
 import pandas as pd
-import numpy as np
 from pathlib import Path
-from scipy.stats import gaussian_kde, skew, kurtosis
 import warnings
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.density import DEFAULT_GRID, binned_kde, kde_modes  # noqa: E402
+from meteorite_eda.moments import Moments  # noqa: E402
+from meteorite_eda.session import column, load_frame  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+
+parser = argparse.ArgumentParser(description="Phase III data topology table")
+parser.add_argument("--grid", type=int, default=DEFAULT_GRID,
+                    help="KDE grid points (default: %(default)s)")
+args = parser.parse_args()
+
 # ---------------------------------------------------------------------
 # 1. Load Dataset
 # ---------------------------------------------------------------------
 INPUT = Path("Meteorite_Landings_Phase_II.csv")
-df = pd.read_csv(INPUT)
+df = load_frame(INPUT)
 
 if "count" not in df.columns:
     raise ValueError("Phase II dataset must contain column 'count'.")
 
-counts = df["count"].astype(float).values
+counts = column(INPUT, "count")
+
+# ---------------------------------------------------------------------
+# Unchanged input → reuse the cached table (artifacts.py)
+# ---------------------------------------------------------------------
+OUTPUT = Path("0_EDA_Data_Topology_Table.html")
+TABLE = Artifact(OUTPUT, df)
+if TABLE.restore():
+    sys.exit(0)
 
 # ---------------------------------------------------------------------
 # 2. Compute Skewness and Kurtosis
 # ---------------------------------------------------------------------
-sk = skew(counts)
-kt = kurtosis(counts, fisher=True)
+# both from one pass over the data (moments.py); same definitions as
+# scipy.stats.skew / kurtosis(fisher=True)
+with step("moments", rows=len(counts)):
+    m = Moments.of(counts)
+sk = m.skew
+kt = m.kurtosis
 
 # ---------------------------------------------------------------------
 # 3. Multimodality via KDE peak count
 # ---------------------------------------------------------------------
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
-kde = gaussian_kde(counts)
-xs = np.linspace(min(counts), max(counts), 512)
-dens = kde(xs)
-
-peaks = 0
-for i in range(1, len(dens) - 1):
-    if dens[i] > dens[i - 1] and dens[i] > dens[i + 1]:
-        peaks += 1
+# Scott bandwidth, grid spanning [min, max] as gaussian_kde was evaluated
+with step("binned kde", rows=len(counts)):
+    xs, dens = binned_kde(counts, grid=args.grid)
+with step("kde peaks", rows=len(dens)):
+    modes = kde_modes(xs, dens)
+peaks = len(modes)
+mode_locations = "; ".join(
+    f"{loc:,.0f} ({prom:.2e})" for loc, prom in zip(modes["location"], modes["prominence"])
+) or "—"
 
 # ---------------------------------------------------------------------
 # 4. Shape Classification
@@ -103,6 +135,11 @@ elucidations = {
         "A proxy for modality. More than one mode suggests multimodal behavior and "
         "possible underlying subgroups."
     ),
+    "Mode Locations (prominence)": (
+        "Count values at the KDE peaks, tallest first. Prominence is the density a peak "
+        "rises above the valley separating it from a taller one; small values flag "
+        "minor bumps rather than distinct subgroups."
+    ),
     "Shape Classification": (
         "Combines skewness and kurtosis into a qualitative description of the distribution's shape."
     ),
@@ -116,6 +153,7 @@ suggestion_map = {
     "Skewness": "Examine histogram; apply log transform if skew > 1.",
     "Kurtosis (Fisher)": "Interpret tail weight; check QQ plot for deviation.",
     "Estimated # of Modes": "If >1, consider segmenting dataset.",
+    "Mode Locations (prominence)": "Segment at the valleys between prominent modes.",
     "Shape Classification": "Use this to evaluate linear model assumptions.",
     "Suggested Transformation": suggestion
 }
@@ -128,6 +166,7 @@ table_data = {
         "Skewness",
         "Kurtosis (Fisher)",
         "Estimated # of Modes",
+        "Mode Locations (prominence)",
         "Shape Classification",
         "Suggested Transformation"
     ],
@@ -135,6 +174,7 @@ table_data = {
         f"{sk:.3f}",
         f"{kt:.3f}",
         peaks,
+        mode_locations,
         shape,
         suggestion
     ],
@@ -142,6 +182,7 @@ table_data = {
         elucidations["Skewness"],
         elucidations["Kurtosis (Fisher)"],
         elucidations["Estimated # of Modes"],
+        elucidations["Mode Locations (prominence)"],
         elucidations["Shape Classification"],
         elucidations["Suggested Transformation"]
     ],
@@ -149,6 +190,7 @@ table_data = {
         suggestion_map["Skewness"],
         suggestion_map["Kurtosis (Fisher)"],
         suggestion_map["Estimated # of Modes"],
+        suggestion_map["Mode Locations (prominence)"],
         suggestion_map["Shape Classification"],
         suggestion_map["Suggested Transformation"]
     ]
@@ -265,7 +307,8 @@ Table X. Summary of distribution topology and transformation guidance.
 # ---------------------------------------------------------------------
 # 9. Save Output
 # ---------------------------------------------------------------------
-OUTPUT = Path("0_EDA_Data_Topology_Table.html")
-OUTPUT.write_text(html_top + html_mid + html_bottom, encoding="utf-8")
+with step("write html"):
+    OUTPUT.write_text(html_top + html_mid + html_bottom, encoding="utf-8")
+TABLE.store()
 
 print(f"✔ Data topology table saved to: {OUTPUT.resolve()}")
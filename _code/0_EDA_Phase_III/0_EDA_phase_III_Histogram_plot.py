@@ -22,17 +22,23 @@ Outputs (per variable):
     {name}_BIN1.png
 """
 
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.session import load_frame  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+
 
 # ---------------------------------------------------------------
 # Load CSV
 # ---------------------------------------------------------------
 INPUT = Path("Meteorite_Landings_Phase_III.csv")
-df = pd.read_csv(INPUT)
+df = load_frame(INPUT)
 
 df["count_log"] = pd.to_numeric(df["count_log"], errors="coerce")
 df["count_sqrt"] = pd.to_numeric(df["count_sqrt"], errors="coerce")
@@ -84,6 +90,10 @@ def z_score(values):
 # Plotting function
 # ---------------------------------------------------------------
 def plot_with_bins(values, bins, title, xlabel, filename, stub):
+    figure = Artifact(filename, values, bins=bins, title=title, xlabel=xlabel, stub=stub)
+    if figure.restore():
+        return
+
     z_vals = z_score(values)
 
     plt.figure(figsize=(8, 6))
@@ -96,8 +106,10 @@ def plot_with_bins(values, bins, title, xlabel, filename, stub):
     plt.figtext(0.05, -0.06, stub, ha="left", fontsize=10)
 
     plt.tight_layout()
-    plt.savefig(filename, dpi=300, bbox_inches="tight")
+    with step(f"savefig {filename}"):
+        plt.savefig(filename, dpi=300, bbox_inches="tight")
     plt.close()
+    figure.store()
     print(f"✔ Saved → {filename}")
 
 
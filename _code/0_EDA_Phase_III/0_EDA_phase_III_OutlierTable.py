@@ -12,7 +12,7 @@ Input:
 Output:
     0_EDA_phase_III_OutlierTable.html
 
-For each numeric column, computes:
+For each numeric column (all columns at once, see outliers.py), computes:
 - total count
 - min
 - max
@@ -23,19 +23,49 @@ For each numeric column, computes:
 - 75th percentile
 - % within IQR
 - number of outliers
+
+Usage:
+    python 0_EDA_phase_III_OutlierTable.py             # exact, in memory
+    python 0_EDA_phase_III_OutlierTable.py --sketch -j 4
+
+--sketch streams the CSV in byte ranges (one per worker at a time) and
+estimates the percentiles, IQR fences and % within IQR with a mergeable
+KLL sketch (sketches.py); the table then carries the sketch's rank-error
+bound. The moment columns stay exact.
 """
 
+import sys
+import argparse
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.moments import Moments, summarize_csv  # noqa: E402
+from meteorite_eda.outliers import as_column_dtype, outlier_stats  # noqa: E402
+from meteorite_eda.session import load_frame  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+from meteorite_eda.sketches import DEFAULT_DELTA, KLLSketch  # noqa: E402
+
+parser = argparse.ArgumentParser(description="Phase III outlier summary table")
+parser.add_argument("--sketch", action="store_true",
+                    help="stream the CSV and estimate percentiles with a KLL sketch")
+parser.add_argument("-j", "--workers", type=int, default=1,
+                    help="processes for --sketch (default: %(default)s)")
+args = parser.parse_args()
+
 # ---------------------------------------------------------------------
 # 1. Load CSV
 # ---------------------------------------------------------------------
 INPUT = Path("Meteorite_Landings_Phase_III.csv")
-df = pd.read_csv(INPUT)
-
-rows, cols = df.shape
+if args.sketch:
+    # the column types come from a sample; the data itself is streamed below
+    df = pd.read_csv(INPUT, nrows=10_000)
+    cols = df.shape[1]
+else:
+    df = load_frame(INPUT)
+    rows, cols = df.shape
 
 # Identify numeric columns only
 numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
@@ -44,30 +74,21 @@ if len(numeric_cols) == 0:
     raise ValueError("No numeric columns found in the Phase III dataset.")
 
 # ---------------------------------------------------------------------
-# 2. Compute Outlier Stats for Each Numeric Column
+# Unchanged input → reuse the cached table (artifacts.py)
 # ---------------------------------------------------------------------
-records = []
-
-for col in numeric_cols:
-    arr = df[col].dropna().values
-
-    total_count = len(arr)
-    vmin = np.min(arr)
-    vmax = np.max(arr)
-    vmean = np.mean(arr)
-    vstd = np.std(arr)
-
-    q25, q50, q75 = np.percentile(arr, [25, 50, 75])
-    iqr = q75 - q25
-
-    lower_bound = q25 - 1.5 * iqr
-    upper_bound = q75 + 1.5 * iqr
+OUTPUT = Path("0_EDA_phase_III_OutlierTable.html")
+TABLE = Artifact(OUTPUT, INPUT if args.sketch else df)
+if TABLE.restore():
+    sys.exit(0)
 
-    within_iqr = ((arr >= lower_bound) & (arr <= upper_bound)).sum()
+# ---------------------------------------------------------------------
+# 2. Compute Outlier Stats for Each Numeric Column
+# ---------------------------------------------------------------------
+def outlier_record(col, n, vmin, vmax, vmean, vstd, q25, q50, q75, within_iqr,
+                   rank_error=None):
+    total_count = int(n)
     pct_within = within_iqr / total_count * 100
-    outliers = total_count - within_iqr
-
-    records.append({
+    record = {
         "Column": col,
         "Total Count": total_count,
         "Min": vmin,
@@ -78,12 +99,47 @@ for col in numeric_cols:
         "50th %ile": f"{q50:.3f}",
         "75th %ile": f"{q75:.3f}",
         "% Within IQR": f"{pct_within:.2f}%",
-        "Outliers": outliers
-    })
+        "Outliers": total_count - within_iqr
+    }
+    if rank_error is not None:
+        # the in-fence count combines two rank estimates
+        record["% Within IQR"] += f" ± {2 * rank_error * 100:.2f}%"
+        record["Rank Error"] = f"± {rank_error * 100:.2f}%"
+    return record
+
+
+records = []
+
+if args.sketch:
+    # one streaming pass: exact moments + KLL sketch per column
+    with step("summarize csv", rows=None) as s:
+        rows, summary = summarize_csv(INPUT, numeric_cols, (Moments, KLLSketch),
+                                      workers=args.workers)
+        s.rows = rows
+    for col in numeric_cols:
+        m, sketch = summary[col]
+        q25, q50, q75 = sketch.quantiles([25, 50, 75])
+        iqr = q75 - q25
+        within_iqr = sketch.count_between(q25 - 1.5 * iqr, q75 + 1.5 * iqr)
+        records.append(outlier_record(col, m.n, m.min, m.max, m.mean, m.std,
+                                      q25, q50, q75, within_iqr, sketch.rank_error()))
+
+else:
+    # every statistic for every column in a few 2-D calls (outliers.py)
+    with step("outlier stats", rows=len(df) * len(numeric_cols)):
+        stats = outlier_stats(df, numeric_cols)
+    for col, st in stats.iterrows():
+        dtype = df[col].dtype
+        records.append(outlier_record(
+            col, st["n"], as_column_dtype(st["min"], dtype), as_column_dtype(st["max"], dtype),
+            st["mean"], st["std"], st["q25"], st["q50"], st["q75"], int(st["within"])))
 
 df_out = pd.DataFrame(records)
 
 dataset_banner = f"Dataset Size: {rows:,} rows × {cols:,} columns"
+if args.sketch:
+    dataset_banner += (f" — percentiles from a KLL sketch (k={KLLSketch().k}); "
+                       f"Rank Error holds with {100 * (1 - DEFAULT_DELTA):.0f}% probability")
 
 # ---------------------------------------------------------------------
 # 3. HTML Template
@@ -194,6 +250,8 @@ for _, row in df_out.iterrows():
     html_mid += f"      <td>{row['75th %ile']}</td>\n"
     html_mid += f"      <td>{row['% Within IQR']}</td>\n"
     html_mid += f"      <td>{row['Outliers']}</td>\n"
+    if args.sketch:
+        html_mid += f"      <td>{row['Rank Error']}</td>\n"
     html_mid += "    </tr>\n"
 
 html_bottom = """
@@ -209,7 +267,8 @@ html_bottom = """
 # ---------------------------------------------------------------------
 # 4. Save Output
 # ---------------------------------------------------------------------
-OUTPUT = Path("0_EDA_phase_III_OutlierTable.html")
-OUTPUT.write_text(html_top + html_mid + html_bottom, encoding="utf-8")
+with step("write html"):
+    OUTPUT.write_text(html_top + html_mid + html_bottom, encoding="utf-8")
+TABLE.store()
 
 print(f"✔ Phase III Outlier Table saved to: {OUTPUT.resolve()}")
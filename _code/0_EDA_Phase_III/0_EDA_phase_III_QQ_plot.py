@@ -11,37 +11,47 @@ Outputs:
     qqplot_count_sqrt.png
 """
 
-import pandas as pd
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 import scipy.stats as stats
 from pathlib import Path
 import warnings
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.session import column, load_frame  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+
 # ---------------------------------------------------------------------
 # 1. Load Phase III dataset
 # ---------------------------------------------------------------------
 INPUT = Path("Meteorite_Landings_Phase_III.csv")
-df = pd.read_csv(INPUT)
+df = load_frame(INPUT)
 
 required_cols = ["count_log", "count_sqrt"]
 for col in required_cols:
     if col not in df.columns:
         raise ValueError(f"Missing required column: {col}")
 
-log_vals = df["count_log"].values
-sqrt_vals = df["count_sqrt"].values
+log_vals = column(INPUT, "count_log")
+sqrt_vals = column(INPUT, "count_sqrt")
 
 # ---------------------------------------------------------------------
 # Helper function for producing QQ plots
 # ---------------------------------------------------------------------
 def make_qq_plot(values, title, filename, stub_text):
+    figure = Artifact(filename, values, title=title, stub_text=stub_text)
+    if figure.restore():
+        return
+
     plt.figure(figsize=(8, 6))
 
     # Produce QQ Plot
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", message=".*SmallSampleWarning.*")
-        stats.probplot(values, dist="norm", plot=plt)
+        with step("probplot", rows=len(values)):
+            stats.probplot(values, dist="norm", plot=plt)
 
     # Overwrite SciPy default title
     plt.title(title, fontsize=16)
@@ -57,8 +67,10 @@ def make_qq_plot(values, title, filename, stub_text):
     )
 
     plt.tight_layout()
-    plt.savefig(filename, dpi=300, bbox_inches="tight")
+    with step(f"savefig {filename}"):
+        plt.savefig(filename, dpi=300, bbox_inches="tight")
     plt.close()
+    figure.store()
 
     print(f"✔ Saved: {filename}")
 
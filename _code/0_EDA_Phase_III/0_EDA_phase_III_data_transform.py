@@ -10,6 +10,7 @@ Phase III transformation pipeline:
 3. Apply recommended transformations:
        - log(count + 1)
        - sqrt(count)
+       - Box–Cox(count), λ by maximum likelihood (transforms.power_lambda)
 4. Save cleaned + transformed dataset:
        Meteorite_Landings_Phase_III.csv
 
@@ -17,24 +18,40 @@ This matches the INFO 511 workflow and the conclusions from the
 Data Topology Summary table (severe right skew, heavy tail).
 """
 
-import pandas as pd
-import numpy as np
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.transforms import iqr_bounds, phase_iii_frame, power_lambda  # noqa: E402
+from meteorite_eda.session import load_frame  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+
 # ---------------------------------------------------------------------
 # 1. Load Phase II
 # ---------------------------------------------------------------------
 INPUT = Path("Meteorite_Landings_Phase_II.csv")
-df = pd.read_csv(INPUT)
+df = load_frame(INPUT)
 
 if "count" not in df.columns or "year" not in df.columns:
     raise ValueError("Phase II dataset must contain 'year' and 'count' columns.")
 
-counts = df["count"].astype(float)
-
 # ---------------------------------------------------------------------
 # 2. Compute IQR + Outlier Removal
+# 3. Apply log(count + 1), sqrt(count) and Box–Cox(count)
 # ---------------------------------------------------------------------
-Q1 = counts.quantile(0.25)
-Q3 = counts.quantile(0.75)
-IQR = Q3
+lower_bound, upper_bound = iqr_bounds(df["count"])
+with step("iqr filter + transforms", rows=len(df)):
+    df_out = phase_iii_frame(df)
+
+print(f"IQR fences: [{lower_bound:.3f}, {upper_bound:.3f}]")
+print(f"Years kept: {len(df_out)} of {len(df)} ({len(df) - len(df_out)} outlier years removed)")
+print(f"Box–Cox λ (MLE): {power_lambda(df_out['count'].astype(float).to_numpy()):.4f}")
+
+# ---------------------------------------------------------------------
+# 4. Save Phase III dataset
+# ---------------------------------------------------------------------
+OUTPUT = Path("Meteorite_Landings_Phase_III.csv")
+with step("write csv", rows=len(df_out)):
+    df_out.to_csv(OUTPUT, index=False)
+
+print(f"✔ Phase III dataset saved to: {OUTPUT.resolve()}")
@@ -20,22 +20,38 @@ Columns contained:
 - Description
 - Log Transform Summary
 - Sqrt Transform Summary
+- Box–Cox Transform Summary (with the fitted λ)
 
 Header color = #8FE29D
 """
 
+import sys
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.session import load_frame  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+from meteorite_eda.transforms import power_lambda  # noqa: E402
+
 # ---------------------------------------------------------------------
 # 1. Load Phase III CSV
 # ---------------------------------------------------------------------
 INPUT = Path("Meteorite_Landings_Phase_III.csv")
-df = pd.read_csv(INPUT)
+df = load_frame(INPUT)
 
 rows, cols = df.shape
 
+# ---------------------------------------------------------------------
+# Unchanged input → reuse the cached table (artifacts.py)
+# ---------------------------------------------------------------------
+OUTPUT = Path("0_EDA_phase_III_master_table.html")
+TABLE = Artifact(OUTPUT, df)
+if TABLE.restore():
+    sys.exit(0)
+
 # ---------------------------------------------------------------------
 # 2. Field descriptions
 # ---------------------------------------------------------------------
@@ -43,7 +59,8 @@ descriptions = {
     "year": "Four-digit calendar year of meteorite record.",
     "count": "Number of meteorites recorded for the given year.",
     "count_log": "Log-transformed annual meteorite count: log(count + 1).",
-    "count_sqrt": "Square-root-transformed annual meteorite count."
+    "count_sqrt": "Square-root-transformed annual meteorite count.",
+    "count_boxcox": "Box–Cox-transformed annual meteorite count: (count^λ − 1) / λ, λ by maximum likelihood."
 }
 
 # ---------------------------------------------------------------------
@@ -70,10 +87,13 @@ def summarize(series):
 
 log_summary = summarize(df["count_log"])
 sqrt_summary = summarize(df["count_sqrt"])
+boxcox_lambda = power_lambda(df["count"].astype(float).to_numpy())
+boxcox_summary = f"λ={boxcox_lambda:.3f}, " + summarize(df["count_boxcox"])
 
 transform_summaries = {
     "count_log": log_summary,
     "count_sqrt": sqrt_summary,
+    "count_boxcox": boxcox_summary,
     "count": "Not transformed",
     "year": "Not transformed"
 }
@@ -215,7 +235,8 @@ Table X. Summary of Phase III features, transformations, and distribution charac
 </html>
 """
 
-OUTPUT = Path("0_EDA_phase_III_master_table.html")
-OUTPUT.write_text(html_top + html_mid + html_bottom, encoding="utf-8")
+with step("write html"):
+    OUTPUT.write_text(html_top + html_mid + html_bottom, encoding="utf-8")
+TABLE.store()
 
 print(f"✔ Phase III Master Table saved to: {OUTPUT.resolve()}")
@@ -22,22 +22,36 @@ Outputs:
     0_EDA_phase_IV_analysis.html
 """
 
-import pandas as pd
+import sys
 import numpy as np
 from scipy import stats
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.session import load_frame  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+from meteorite_eda.regression import fit_ols_batch  # noqa: E402
+
 # ----------------------------------------------------------
 # 1. Load Phase III dataset
 # ----------------------------------------------------------
 INPUT = Path("Meteorite_Landings_Phase_III.csv")
-df = pd.read_csv(INPUT)
+df = load_frame(INPUT)
 
 required_cols = ["count", "count_log", "count_sqrt"]
 for col in required_cols:
     if col not in df.columns:
         raise ValueError(f"Missing required column: {col}")
 
+# ----------------------------------------------------------
+# Unchanged input → reuse the cached table (artifacts.py)
+# ----------------------------------------------------------
+OUTPUT = Path("0_EDA_phase_IV_analysis.html")
+TABLE = Artifact(OUTPUT, df)
+if TABLE.restore():
+    sys.exit(0)
+
 # predictor X
 x = df["year"].astype(float).values
 
@@ -56,16 +70,13 @@ def durbin_watson(resid):
     diff = np.diff(resid)
     return np.sum(diff**2) / np.sum(resid**2)
 
-def evaluate_model(x, y):
-    """Runs all regression assumption tests for a single Y."""
+def evaluate_model(x, y, pred, resid):
+    """Runs all regression assumption tests for a single Y and its fit."""
     mask = ~np.isnan(x) & ~np.isnan(y)
     x_clean = x[mask]
     y_clean = y[mask]
-
-    # Fit regression
-    slope, intercept, r_value, p_value, std_err = stats.linregress(x_clean, y_clean)
-    pred = intercept + slope * x_clean
-    resid = y_clean - pred
+    pred = pred[mask]
+    resid = resid[mask]
 
     results = {}
 
@@ -78,7 +89,8 @@ def evaluate_model(x, y):
     results["Independence"] = "PASS" if 1.5 < dw < 2.5 else "FAIL"
 
     # 3. Normality
-    p_shapiro = stats.shapiro(resid)[1]
+    with step("shapiro", rows=len(resid)):
+        p_shapiro = stats.shapiro(resid)[1]
     results["Normality of Residuals"] = "PASS" if p_shapiro > 0.05 else "FAIL"
 
     # 4. Homoscedasticity
@@ -117,7 +129,14 @@ meaning = {
     "Numeric Predictor": "Predictor variable (year) must be numeric."
 }
 
-model_results = {name: evaluate_model(x, y) for name, y in models.items()}
+# all outcomes against the same year column in one batched fit (regression.py)
+with step("fit_ols_batch", rows=len(x)):
+    fits = fit_ols_batch(x, np.column_stack(list(models.values())))
+
+model_results = {
+    name: evaluate_model(x, y, fits["y_pred"][:, j], fits["residuals"][:, j])
+    for j, (name, y) in enumerate(models.items())
+}
 
 # ----------------------------------------------------------
 # Build final combined table
@@ -227,7 +246,8 @@ html_bottom = """
 </html>
 """
 
-OUTPUT = Path("0_EDA_phase_IV_analysis.html")
-OUTPUT.write_text(html_top + html_mid + html_bottom, encoding="utf-8")
+with step("write html"):
+    OUTPUT.write_text(html_top + html_mid + html_bottom, encoding="utf-8")
+TABLE.store()
 
 print(f"✔ Phase IV Regression Assumptions Table saved to: {OUTPUT.resolve()}")
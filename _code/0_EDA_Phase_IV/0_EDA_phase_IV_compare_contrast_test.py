@@ -11,105 +11,125 @@ Outputs:
     - HTML comparison tables (3 tables)
     - Scatter plots with regression lines + annotated equation boxes
     - Residual plots
+
+Usage:
+    python 0_EDA_phase_IV_compare_contrast_test.py
+    python 0_EDA_phase_IV_compare_contrast_test.py --tables-only   # HTML only
+    python 0_EDA_phase_IV_compare_contrast_test.py --ci wild --resamples 10000 -j 4
+    python 0_EDA_phase_IV_compare_contrast_test.py --from-store      # no CSV read
+
+Both fits come from the sufficient statistics persisted in
+0_EDA_phase_IV_model_store.json (modelstore.py): each run folds in only
+the years that were added, revised or removed since the last one, and
+--from-store rebuilds Tables 1–3 from the store alone. run_pipeline.py
+declares the store as stage state: it is copied into the staging folder
+and moved back with the tables, so a failed run leaves it untouched.
+
+--ci pairs / wild replace the normal (± 1.96 · SE) intervals of Table 2 by
+percentile intervals from a pairs or wild bootstrap (bootstrap.py); the
+run is reproducible for a given --seed, whatever the worker count.
+
+matplotlib is imported on first use, so --tables-only never loads it.
+The slope p-values are computed in log space (regression.py), so they
+never underflow however strong the trend.
 """
 
+import sys
+import argparse
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from pathlib import Path
-from mpmath import erf as mp_erf, mp
-
-# ----------------------------------------------------------
-# High-precision math for p-values (NO UNDERFLOW)
-# ----------------------------------------------------------
-mp.dps = 80   # 80 digits of precision
-
-
-# ----------------------------------------------------------
-# Load Phase III Data
-# ----------------------------------------------------------
-INPUT = Path("Meteorite_Landings_Phase_III.csv")
-df = pd.read_csv(INPUT)
-
-df["year"] = pd.to_numeric(df["year"], errors="coerce")
-df["count_log"] = pd.to_numeric(df["count_log"], errors="coerce")
-df["count_sqrt"] = pd.to_numeric(df["count_sqrt"], errors="coerce")
-df = df.dropna(subset=["year", "count_log", "count_sqrt"])
-
-year = df["year"].values
-y_log = df["count_log"].values
-y_sqrt = df["count_sqrt"].values
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.lazy import lazy_import  # noqa: E402
+from meteorite_eda.session import load_frame  # noqa: E402
+from meteorite_eda.bootstrap import DEFAULT_RESAMPLES, bootstrap_ci, bootstrap_ols  # noqa: E402
+from meteorite_eda.modelstore import ModelStore  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+from meteorite_eda.regression import fmt_log10_p, log10_pvalue  # noqa: E402
+
+plt = lazy_import("matplotlib.pyplot")
+
+parser = argparse.ArgumentParser(description="Phase IV log vs. sqrt model comparison")
+parser.add_argument("--tables-only", action="store_true",
+                    help="write the HTML tables and skip the scatter plots")
+parser.add_argument("--ci", choices=["normal", "pairs", "wild"], default="normal",
+                    help="confidence intervals: normal (± 1.96·SE, default), "
+                         "pairs or wild bootstrap")
+parser.add_argument("--resamples", type=int, default=DEFAULT_RESAMPLES,
+                    help="bootstrap resamples (default: %(default)s)")
+parser.add_argument("--seed", type=int, default=0, help="bootstrap seed")
+parser.add_argument("-j", "--workers", type=int, default=1,
+                    help="bootstrap worker processes (default: 1)")
+parser.add_argument("--from-store", action="store_true",
+                    help="write the tables from the stored statistics without "
+                         "reading the Phase III CSV (implies --tables-only)")
+args = parser.parse_args()
+if args.from_store and args.ci != "normal":
+    parser.error("--ci pairs/wild resamples the data; it cannot run with --from-store")
+args.tables_only = args.tables_only or args.from_store
 
 # ----------------------------------------------------------
-# Manual Linear Regression Function (Closed Form)
+# Model store: one set of sufficient statistics per model
 # ----------------------------------------------------------
-def linear_regression(x, y):
-    x = np.array(x)
-    y = np.array(y)
-    n = len(x)
-
-    x_mean = x.mean()
-    y_mean = y.mean()
-
-    slope = np.sum((x - x_mean)*(y - y_mean)) / np.sum((x - x_mean)**2)
-    intercept = y_mean - slope*x_mean
-
-    y_pred = intercept + slope*x
-    residuals = y - y_pred
-
-    RSS = np.sum(residuals**2)
-    TSS = np.sum((y - y_mean)**2)
-
-    R2 = 1 - RSS/TSS
-    R2_adj = 1 - (1-R2)*(n-1)/(n-2)
-
-    MSE = RSS/n
-    RMSE = np.sqrt(MSE)
-    MAE = np.mean(np.abs(residuals))
-
-    # Standard errors
-    s2 = RSS/(n-2)
-    SE_slope = np.sqrt(s2 / np.sum((x-x_mean)**2))
-    SE_intercept = np.sqrt(s2 * (1/n + x_mean**2/np.sum((x-x_mean)**2)))
-
-    # 95% CI
-    z = 1.96
-    ci_slope = (slope - z*SE_slope, slope + z*SE_slope)
-    ci_inter = (intercept - z*SE_intercept, intercept + z*SE_intercept)
-
-    # F statistic
-    F = (R2/(1-R2))*(n-2)
-
-    # High-precision p-value
-    t_slope = slope / SE_slope
-    t_abs = mp.mpf(abs(t_slope))
-    p_value = 2*(1 - (1 + mp_erf(t_abs/mp.sqrt(2))) / 2)
-
-    return {
-        "intercept": intercept,
-        "slope": slope,
-        "R2": R2,
-        "R2_adj": R2_adj,
-        "MAE": MAE,
-        "MSE": MSE,
-        "RMSE": RMSE,
-        "F": F,
-        "ci_intercept_low": ci_inter[0],
-        "ci_intercept_high": ci_inter[1],
-        "ci_slope_low": ci_slope[0],
-        "ci_slope_high": ci_slope[1],
-        "p_value": float(p_value),
-        "y_pred": y_pred,
-        "residuals": residuals
-    }
+STORE = Path("0_EDA_phase_IV_model_store.json")
+MODELS = {"log": "count_log", "sqrt": "count_sqrt"}
+store = ModelStore.load(STORE)
+
+if args.from_store:
+    missing = [name for name in MODELS if name not in store]
+    if missing:
+        sys.exit(f"✘ {STORE} has no {', '.join(missing)} model yet; "
+                 "run once without --from-store.")
+else:
+    # ----------------------------------------------------------
+    # Load Phase III Data
+    # ----------------------------------------------------------
+    INPUT = Path("Meteorite_Landings_Phase_III.csv")
+    df = load_frame(INPUT)
+
+    df["year"] = pd.to_numeric(df["year"], errors="coerce")
+    df["count_log"] = pd.to_numeric(df["count_log"], errors="coerce")
+    df["count_sqrt"] = pd.to_numeric(df["count_sqrt"], errors="coerce")
+    df = df.dropna(subset=["year", "count_log", "count_sqrt"])
+
+    year = df["year"].values
+    y_log = df["count_log"].values
+    y_sqrt = df["count_sqrt"].values
+
+    # fold in only the years that changed since the stored fit
+    with step("model store sync", rows=len(year)):
+        for name, col in MODELS.items():
+            changes = store.sync(name, year, df[col].values)
+            print(f"✔ {name} model: {changes['added']} added, {changes['revised']} revised, "
+                  f"{changes['removed']} removed (revision {store[name].revision})")
+        store.save()
 
 
 # ----------------------------------------------------------
-# Fit Both Models
+# Fit Both Models from the stored sums (modelstore.py)
 # ----------------------------------------------------------
-results_log = linear_regression(year, y_log)
-results_sqrt = linear_regression(year, y_sqrt)
+# CIs keep the normal 1.96 multiplier the tables have always used
+results_log = store["log"].fit(critical=1.96)
+results_sqrt = store["sqrt"].fit(critical=1.96)
+
+# two-sided normal p-values of the slopes' t statistics, in log space
+# (NO UNDERFLOW)
+for results in (results_log, results_sqrt):
+    results["log10_p"] = float(log10_pvalue(results["t_slope"]))
+    results["p_value"] = 10.0 ** results["log10_p"]
+
+if args.ci != "normal":
+    with step(f"{args.ci} bootstrap", rows=args.resamples):
+        boot = bootstrap_ols(year, np.column_stack([y_log, y_sqrt]), args.resamples,
+                             method=args.ci, seed=args.seed, workers=args.workers)
+    for key, bounds in bootstrap_ci(boot).items():
+        results_log[key], results_sqrt[key] = (float(b) for b in bounds)
+    CI_NOTE = (f"95% percentile intervals from {args.resamples:,} {args.ci} "
+               f"bootstrap resamples (seed {args.seed})")
+else:
+    CI_NOTE = "95% confidence intervals"
 
 
 # ----------------------------------------------------------
@@ -120,17 +140,6 @@ def fmt(x):
         return f"{x:.3e}"
     return f"{x:.4f}"
 
-# Perfect scientific-notation formatter with coefficient
-def fmt_p(x):
-    x = mp.mpf(x)
-    if x == 0:
-        return "0"
-    sign = "-" if x < 0 else ""
-    x = abs(x)
-    exp = int(mp.floor(mp.log10(x)))
-    coef = x / (10**exp)
-    return f"{sign}{float(coef):.4f}e{exp}"
-
 
 # ----------------------------------------------------------
 # TABLE 1 — Model Diagnostics
@@ -198,13 +207,13 @@ def decision_text(p):
 df_hyp = pd.DataFrame([
     {
         "Model": "Log(count+1)",
-        "p-value": fmt_p(results_log["p_value"]),
+        "p-value": fmt_log10_p(results_log["log10_p"]),
         "Decision": decision_symbol(results_log["p_value"]),
         "Interpretation": decision_text(results_log["p_value"])
     },
     {
         "Model": "Sqrt(count)",
-        "p-value": fmt_p(results_sqrt["p_value"]),
+        "p-value": fmt_log10_p(results_sqrt["log10_p"]),
         "Decision": decision_symbol(results_sqrt["p_value"]),
         "Interpretation": decision_text(results_sqrt["p_value"])
     }
@@ -278,7 +287,7 @@ This table summarizes R², Adjusted R², MAE, MSE, RMSE, and the F-statistic for
 <h2>Table 2 — Parameter Estimates & Confidence Intervals</h2>
 {df_to_html(df_params)}
 <div class='desc'>
-Parameter table includes slopes, intercepts, and their 95% confidence intervals.
+Parameter table includes slopes, intercepts, and their {CI_NOTE}.
 </div>
 
 <h2>Table 3 — Hypothesis Test for Slope (β₁)</h2>
@@ -294,7 +303,8 @@ Interpretation meanings:<br>
 """
 
 OUTPUT = Path("0_EDA_phase_IV_model_comparison.html")
-OUTPUT.write_text(html, encoding="utf-8")
+with step("write html"):
+    OUTPUT.write_text(html, encoding="utf-8")
 print("✔ HTML tables written.")
 
 
@@ -302,17 +312,22 @@ print("✔ HTML tables written.")
 # Scatter Plots with Annotation Box
 # ----------------------------------------------------------
 def make_scatter(x, y, results, title, filename):
+    # results are derived from (x, y) by this script, so they are not keyed
+    figure = Artifact(filename, (x, y), title=title)
+    if figure.restore():
+        return
+
     plt.figure(figsize=(8,6))
 
     plt.scatter(x, y, color="#27ae60", edgecolor="black")
 
-    y_pred = results["y_pred"]
+    y_pred = results["intercept"] + results["slope"] * x
     plt.plot(x, y_pred, color="black", linewidth=2)
 
     eq_symbolic = "y = β₀ + β₁·x"
     eq_numeric = f"y = {fmt(results['intercept'])} + {fmt(results['slope'])}·x"
     r2 = f"R² = {fmt(results['R2'])}"
-    pval = f"p = {fmt_p(results['p_value'])}"
+    pval = f"p = {fmt_log10_p(results['log10_p'])}"
 
     text = f"{eq_symbolic}\n{eq_numeric}\n{r2}\n{pval}"
 
@@ -331,11 +346,17 @@ def make_scatter(x, y, results, title, filename):
     plt.ylabel(title)
     plt.ylim(bottom=0)
     plt.tight_layout()
-    plt.savefig(filename, dpi=300)
+    with step(f"savefig {filename}"):
+        plt.savefig(filename, dpi=300)
     plt.close()
+    figure.store()
     print(f"✔ Scatter saved → {filename}")
 
 
+if args.tables_only:
+    print("✔ Phase IV tables complete (plots skipped).")
+    sys.exit(0)
+
 make_scatter(year, y_log, results_log, "log(count+1)", "scatter_log.png")
 make_scatter(year, y_sqrt, results_sqrt, "sqrt(count)", "scatter_sqrt.png")
 
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+0_EDA_phase_IV_grouped_trends.py
+
+The Phase IV year-trend models fitted separately for every group of the
+raw catalog:
+    log(count + 1)  ~ year
+    sqrt(count)     ~ year
+where count is the number of records of the group per year, for
+    - every meteorite class (recclass)
+    - Fell vs. Found (fall)
+    - Valid vs. Relict (nametype)
+
+The catalog is cleaned with the Phase II rules (duplicate ids, missing or
+out-of-range years, missing fall), counted into one (groups × years)
+matrix in a single aggregation pass, and all groups are fitted together
+with segmented vectorized sums (grouped.py) — no per-group loop.
+
+Outputs:
+    0_EDA_phase_IV_grouped_trends.html   one sortable table per grouping
+                                         (click a header to sort)
+
+Usage:
+    python 0_EDA_phase_IV_grouped_trends.py --input ../Meteorite_Landings.csv
+    python 0_EDA_phase_IV_grouped_trends.py --by recclass --min-records 100
+
+run_pipeline.py copies the raw catalog into this folder first (stage
+phase_iv.raw); that copy is not kept in git.
+"""
+
+import sys
+import argparse
+from html import escape
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.catalog import load_catalog  # noqa: E402
+from meteorite_eda.grouped import GROUP_COLUMNS, fit_group_trends, group_year_counts  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+from meteorite_eda.regression import fmt_log10_p  # noqa: E402
+from meteorite_eda.yearcounts import YEAR_MAX, YEAR_MIN  # noqa: E402
+
+parser = argparse.ArgumentParser(description="Phase IV year trends per catalog group")
+parser.add_argument("--input", default="Meteorite_Landings.csv",
+                    help="raw catalog CSV (default: %(default)s)")
+parser.add_argument("--by", nargs="+", choices=GROUP_COLUMNS, default=GROUP_COLUMNS,
+                    help="grouping columns (default: all)")
+parser.add_argument("--min-records", type=int, default=1,
+                    help="leave out groups with fewer records (default: %(default)s)")
+args = parser.parse_args()
+
+# ----------------------------------------------------------
+# Load + clean the raw catalog (Phase II rules)
+# ----------------------------------------------------------
+INPUT = Path(args.input)
+df = load_catalog(INPUT, columns=["id", "year", "fall"]
+                  + [c for c in args.by if c != "fall"])
+
+df = df.drop_duplicates(subset="id", keep="first")
+df["year"] = pd.to_numeric(df["year"], errors="coerce")
+df = df.dropna(subset=["year"])
+df["year"] = df["year"].astype(int)
+df = df[df["year"].between(YEAR_MIN, YEAR_MAX)]
+df = df.dropna(subset=["fall"])
+
+# ----------------------------------------------------------
+# One aggregation pass → (groups × years) counts
+# ----------------------------------------------------------
+with step("group year counts", rows=len(df)):
+    keys, counts = group_year_counts(df, args.by)
+
+OUTPUT = Path("0_EDA_phase_IV_grouped_trends.html")
+TABLE = Artifact(OUTPUT, (keys, counts), min_records=args.min_records)
+if TABLE.restore():
+    sys.exit(0)
+
+# ----------------------------------------------------------
+# All groups fitted at once (segmented sums)
+# ----------------------------------------------------------
+with step("fit group trends", rows=len(keys)):
+    trends = fit_group_trends(keys, counts)
+trends = trends[trends["records"] >= args.min_records]
+
+
+# ----------------------------------------------------------
+# Formatting Utilities
+# ----------------------------------------------------------
+def fmt(x):
+    if np.isnan(x):
+        return "—"
+    if x != 0 and abs(x) < 0.0001:
+        return f"{x:.3e}"
+    return f"{x:.4f}"
+
+def cell(text, key):
+    # the sort key rides along in data-sort; missing values sort last
+    key = "" if pd.isna(key) else key
+    return f"<td data-sort='{key}'>{text}</td>"
+
+
+COLUMNS = ["Group", "Records", "Years", "First–Last",
+           "Log β₁", "Log R²", "Log p-value",
+           "Sqrt β₁", "Sqrt R²", "Sqrt p-value"]
+
+
+def trends_to_html(table_id, rows):
+    html = f"<table id='{table_id}'><thead><tr>"
+    for i, col in enumerate(COLUMNS):
+        html += f"<th onclick=\"sortTable('{table_id}', {i})\">{col}</th>"
+    html += "</tr></thead><tbody>"
+    for row in rows.itertuples(index=False):
+        html += "<tr>"
+        # class names come straight from the raw catalog
+        html += cell(escape(row.group), escape(row.group))
+        html += cell(f"{row.records:,}", row.records)
+        html += cell(row.years, row.years)
+        html += cell(f"{row.first}–{row.last}", row.first)
+        for model in ("log", "sqrt"):
+            slope = getattr(row, f"{model}_slope")
+            log10_p = getattr(row, f"{model}_log10_p")
+            html += cell(fmt(slope), slope)
+            html += cell(fmt(getattr(row, f"{model}_R2")), getattr(row, f"{model}_R2"))
+            html += cell("—" if np.isnan(log10_p) else fmt_log10_p(log10_p), log10_p)
+        html += "</tr>"
+    html += "</tbody></table><br>"
+    return html
+
+
+TITLES = {
+    "recclass": "Meteorite Class (recclass)",
+    "fall": "Fell vs. Found (fall)",
+    "nametype": "Valid vs. Relict (nametype)",
+}
+
+sections = ""
+for n, col in enumerate(args.by, start=1):
+    rows = trends[trends["column"] == col].sort_values("records", ascending=False)
+    fitted = int(rows["log_slope"].notna().sum())
+    sections += f"""
+<h2>Table {n} — {TITLES[col]}</h2>
+{trends_to_html(col, rows)}
+<div class='desc'>
+{len(rows):,} groups, {fitted:,} with at least three years of records (fewer have no slope).
+</div>
+"""
+
+html = f"""
+<!DOCTYPE html>
+<html>
+<head>
+<title>Phase IV Grouped Trends</title>
+<style>
+body {{
+    font-family: Arial; padding:20px;
+}}
+table {{
+    border-collapse: separate;
+    border-spacing: 0;
+    width: 100%;
+    border-radius: 10px;
+    overflow: hidden;
+}}
+th {{
+    background: #9F7CFF;
+    padding: 10px;
+    border: 1px solid black;
+    text-align:center;
+    cursor: pointer;
+}}
+td {{
+    background: #f3f0ff;
+    padding: 8px;
+    border: 1px solid black;
+    text-align:center;
+}}
+h2 {{
+    text-align:center;
+}}
+.desc {{
+    font-size: 16px;
+    margin-bottom: 25px;
+    width: 85%;
+}}
+</style>
+<script>
+function sortTable(id, col) {{
+    const body = document.getElementById(id).tBodies[0];
+    const rows = Array.from(body.rows);
+    const dir = body.dataset.col == col && body.dataset.dir == "asc" ? "desc" : "asc";
+    const key = r => r.cells[col].dataset.sort;
+    rows.sort((a, b) => {{
+        const x = key(a), y = key(b);
+        if (x === "" || y === "") return (x === "") - (y === "");
+        const d = isNaN(x) || isNaN(y) ? x.localeCompare(y) : x - y;
+        return dir == "asc" ? d : -d;
+    }});
+    rows.forEach(r => body.appendChild(r));
+    body.dataset.col = col;
+    body.dataset.dir = dir;
+}}
+</script>
+</head>
+<body>
+
+<h1 style="text-align:center;">Phase IV — Year Trends by Group</h1>
+<div class='desc'>
+Each group's yearly record count (years {YEAR_MIN}–{YEAR_MAX}, Phase II cleaning) is regressed on
+year as log(count + 1) and sqrt(count). β₁ is the slope per year; p-values are two-sided
+t tests of β₁ = 0. Click a column header to sort.
+</div>
+{sections}
+</body>
+</html>
+"""
+
+with step("write html"):
+    OUTPUT.write_text(html, encoding="utf-8")
+TABLE.store()
+
+print(f"✔ {len(trends):,} groups fitted ({', '.join(args.by)}).")
+print(f"  → {OUTPUT.resolve()}")
@@ -18,15 +18,29 @@ Outputs:
     0_EDA_phase_IV_presentation_table.html
 """
 
+import sys
 import pandas as pd
 from pathlib import Path
 import re
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.session import load_frame  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+
 # ----------------------------------------------------------
 # Load Phase III data
 # ----------------------------------------------------------
 INPUT = Path("Meteorite_Landings_Phase_III.csv")
-df = pd.read_csv(INPUT)
+df = load_frame(INPUT)
+
+# ----------------------------------------------------------
+# Unchanged input → reuse the cached table (artifacts.py)
+# ----------------------------------------------------------
+OUTPUT = Path("0_EDA_phase_IV_presentation_table.html")
+TABLE = Artifact(OUTPUT, df)
+if TABLE.restore():
+    sys.exit(0)
 
 # ----------------------------------------------------------
 # Helper functions
@@ -44,14 +58,16 @@ descriptions = {
     "year": "Four-digit calendar year of meteorite record.",
     "count": "Number of meteorites recorded for the given year.",
     "count_log": "Log-transformed annual meteorite count: log(count + 1).",
-    "count_sqrt": "Square-root-transformed annual meteorite count."
+    "count_sqrt": "Square-root-transformed annual meteorite count.",
+    "count_boxcox": "Box–Cox-transformed annual meteorite count (λ by maximum likelihood)."
 }
 
 regression_role = {
     "year": "Predictor (X)",
     "count": "Outcome (Y, raw form)",
     "count_log": "Outcome (Y, log model)",
-    "count_sqrt": "Outcome (Y, sqrt model)"
+    "count_sqrt": "Outcome (Y, sqrt model)",
+    "count_boxcox": "Alternative outcome (Y, Box–Cox)"
 }
 
 
@@ -75,7 +91,7 @@ def split_role(text):
 # ----------------------------------------------------------
 rows = []
 
-for col in ["year", "count", "count_log", "count_sqrt"]:
+for col in ["year", "count", "count_log", "count_sqrt", "count_boxcox"]:
     role = split_role(regression_role[col])
 
     rows.append({
@@ -189,8 +205,9 @@ caption {{
 # ----------------------------------------------------------
 # Write Output
 # ----------------------------------------------------------
-OUTPUT = Path("0_EDA_phase_IV_presentation_table.html")
-OUTPUT.write_text(html_output, encoding="utf-8")
+with step("write html"):
+    OUTPUT.write_text(html_output, encoding="utf-8")
+TABLE.store()
 
 print("✔ HTML table generated.")
 print(f"  → {OUTPUT.resolve()}")
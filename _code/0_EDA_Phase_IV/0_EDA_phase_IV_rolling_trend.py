@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+0_EDA_phase_IV_rolling_trend.py
+
+How the year trend of each model changes over time: the regressions
+    log(count + 1)  ~ year
+    sqrt(count)     ~ year
+refitted in a window of W years slid across the whole series (860–2013
+with the real data), one year at a time.
+
+Outputs:
+    rolling_trend_log.png    slope ± 1.96·SE and R² per window
+    rolling_trend_sqrt.png
+
+All windows of both models are fitted in one vectorized pass over prefix
+sums (rolling.py); the dashed line is the full-series slope.
+
+Usage:
+    python 0_EDA_phase_IV_rolling_trend.py                 # 50-year windows
+    python 0_EDA_phase_IV_rolling_trend.py --window 100 --step 5
+"""
+
+import sys
+import argparse
+import pandas as pd
+import numpy as np
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.lazy import lazy_import  # noqa: E402
+from meteorite_eda.session import load_frame  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+from meteorite_eda.regression import fit_ols_batch  # noqa: E402
+from meteorite_eda.rolling import rolling_ols  # noqa: E402
+
+plt = lazy_import("matplotlib.pyplot")
+
+parser = argparse.ArgumentParser(description="Phase IV sliding-window trend plots")
+parser.add_argument("--window", type=int, default=50,
+                    help="window length in years (default: %(default)s)")
+parser.add_argument("--step", type=int, default=1,
+                    help="years between window starts (default: %(default)s)")
+args = parser.parse_args()
+
+# ----------------------------------------------------------
+# Load Phase III Data
+# ----------------------------------------------------------
+INPUT = Path("Meteorite_Landings_Phase_III.csv")
+df = load_frame(INPUT)
+
+df["year"] = pd.to_numeric(df["year"], errors="coerce")
+df["count_log"] = pd.to_numeric(df["count_log"], errors="coerce")
+df["count_sqrt"] = pd.to_numeric(df["count_sqrt"], errors="coerce")
+df = df.dropna(subset=["year", "count_log", "count_sqrt"])
+
+year = df["year"].values
+Y = np.column_stack([df["count_log"].values, df["count_sqrt"].values])
+
+# ----------------------------------------------------------
+# Rolling and full-series fits
+# ----------------------------------------------------------
+with step("rolling_ols", rows=len(year)):
+    roll = rolling_ols(year, Y, args.window, step=args.step)
+full = fit_ols_batch(year, Y, critical=1.96)
+
+center = roll["start"] + (args.window - 1) / 2
+
+MODELS = [
+    ("log(count+1)", "rolling_trend_log.png"),
+    ("sqrt(count)", "rolling_trend_sqrt.png"),
+]
+
+
+# ----------------------------------------------------------
+# Plot: slope band + R² per window
+# ----------------------------------------------------------
+def make_rolling_plot(j, title, filename):
+    figure = Artifact(filename, (year, Y[:, j]), window=args.window, step=args.step)
+    if figure.restore():
+        return
+
+    slope = roll["slope"][:, j]
+    se = roll["SE_slope"][:, j]
+
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8, 6), sharex=True,
+                                   gridspec_kw={"height_ratios": [2, 1]})
+
+    ax1.fill_between(center, slope - 1.96 * se, slope + 1.96 * se,
+                     color="#27ae60", alpha=0.25, linewidth=0, label="± 1.96·SE")
+    ax1.plot(center, slope, color="#27ae60", linewidth=2, label="window slope β₁")
+    ax1.axhline(full["slope"][j], color="black", linestyle="--", linewidth=1.2,
+                label=f"full-series β₁ = {full['slope'][j]:.4f}")
+    ax1.axhline(0, color="gray", linewidth=0.8)
+    ax1.set_ylabel("Slope β₁ (per year)")
+    ax1.legend(loc="upper left", fontsize=9)
+    ax1.set_title(f"{title} ~ year — {args.window}-year Rolling Regression")
+
+    ax2.plot(center, roll["R2"][:, j], color="#9F7CFF", linewidth=2)
+    ax2.set_ylim(0, 1)
+    ax2.set_ylabel("R²")
+    ax2.set_xlabel("Window center (year)")
+
+    plt.tight_layout()
+    with step(f"savefig {filename}"):
+        plt.savefig(filename, dpi=300)
+    plt.close()
+    figure.store()
+    print(f"✔ Rolling trend saved → {filename}")
+
+
+for j, (title, filename) in enumerate(MODELS):
+    make_rolling_plot(j, title, filename)
+
+print(f"✔ {len(center):,} windows of {args.window} years fitted for both models.")
@@ -11,27 +11,46 @@ Outputs:
     - Residual plot
     - QQ plot
     - Terminal output: Outlier check for log(count+1) data
+
+Usage:
+    python 0_EDA_phase_IV_only_log_model_graphs.py
+    python 0_EDA_phase_IV_only_log_model_graphs.py --check-only   # outlier check only
+
+matplotlib and scipy.stats are imported on first use, so --check-only
+never loads matplotlib or scipy. The slope p-value is computed in log
+space (regression.py), so it never underflows.
 """
 
+import sys
+import argparse
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from pathlib import Path
-from mpmath import erf as mp_erf, mp
 
-# ----------------------------------------------------------
-# High precision math (prevents p-value underflow)
-# ----------------------------------------------------------
-mp.dps = 80   # 80 digits precision
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from meteorite_eda.artifacts import Artifact  # noqa: E402
+from meteorite_eda.lazy import lazy_import  # noqa: E402
+from meteorite_eda.session import load_frame  # noqa: E402
+from meteorite_eda.profiling import step  # noqa: E402
+from meteorite_eda.regression import (  # noqa: E402
+    fit_ols_batch, fmt_log10_p, log10_pvalue, select,
+)
+
+plt = lazy_import("matplotlib.pyplot")
+stats = lazy_import("scipy.stats")
 
+parser = argparse.ArgumentParser(description="Phase IV log-model graphs")
+parser.add_argument("--check-only", action="store_true",
+                    help="print the outlier check and skip the graphs")
+args = parser.parse_args()
 
 # ----------------------------------------------------------
 # Load Phase III Data
 # ----------------------------------------------------------
 INPUT = Path("Meteorite_Landings_Phase_III.csv")
-df = pd.read_csv(INPUT)
+df = load_frame(INPUT)
 
-df["year"] = pd.to_numeric(df["year"], errors="ignore")
+df["year"] = pd.to_numeric(df["year"], errors="coerce")
 df["count_log"] = pd.to_numeric(df["count_log"], errors="coerce")
 df = df.dropna(subset=["year", "count_log"])
 
@@ -39,64 +58,6 @@ year = df["year"].values
 y_log = df["count_log"].values
 
 
-# ----------------------------------------------------------
-# Manual closed-form OLS (simple regression)
-# ----------------------------------------------------------
-def linear_regression(x, y):
-    x = np.array(x)
-    y = np.array(y)
-    n = len(x)
-
-    x_mean = x.mean()
-    y_mean = y.mean()
-
-    slope = np.sum((x - x_mean)*(y - y_mean)) / np.sum((x - x_mean)**2)
-    intercept = y_mean - slope * x_mean
-
-    y_pred = intercept + slope*x
-    residuals = y - y_pred
-
-    RSS = np.sum(residuals**2)
-    TSS = np.sum((y - y_mean)**2)
-
-    R2 = 1 - RSS/TSS
-    R2_adj = 1 - (1-R2)*(n-1)/(n-2)
-
-    MSE = RSS/n
-    RMSE = np.sqrt(MSE)
-
-    # Standard error
-    s2 = RSS/(n-2)
-    SE_slope = np.sqrt(s2 / np.sum((x-x_mean)**2))
-
-    # 95% CI (not used here but calculated)
-    z = 1.96
-    ci_slope = (slope - z*SE_slope, slope + z*SE_slope)
-
-    # F-statistic
-    F = (R2/(1-R2))*(n-2)
-
-    # High-precision p-value
-    t_slope = slope / SE_slope
-    t_abs = mp.mpf(abs(t_slope))
-    p_value = 2*(1 - (1 + mp_erf(t_abs/mp.sqrt(2))) / 2)
-
-    return {
-        "intercept": intercept,
-        "slope": slope,
-        "R2": R2,
-        "R2_adj": R2_adj,
-        "RMSE": RMSE,
-        "F": F,
-        "p_value": float(p_value),
-        "y_pred": y_pred,
-        "residuals": residuals
-    }
-
-
-results = linear_regression(year, y_log)
-
-
 # ----------------------------------------------------------
 # Formatters
 # ----------------------------------------------------------
@@ -105,16 +66,6 @@ def fmt_num(x):
         return f"{x:.3e}"
     return f"{x:.4f}"
 
-def fmt_p(x):
-    x = mp.mpf(x)
-    if x == 0:
-        return "0"
-    sign = "-" if x < 0 else ""
-    x = abs(x)
-    exp = int(mp.floor(mp.log10(x)))
-    coef = x / (10**exp)
-    return f"{sign}{float(coef):.4f}e{exp}"
-
 
 # ----------------------------------------------------------
 # OUTLIER CHECK (1.5 × IQR rule)
@@ -138,6 +89,20 @@ else:
     print(outliers[["year", "count_log"]])
 print("==============================================================\n")
 
+if args.check_only:
+    sys.exit(0)
+
+
+# ----------------------------------------------------------
+# Closed-form OLS (regression.py) — only the graphs need it
+# ----------------------------------------------------------
+with step("fit_ols_batch", rows=len(year)):
+    results = select(fit_ols_batch(year, y_log, critical=1.96), 0)
+
+# Two-sided normal p-value, in log space (prevents p-value underflow)
+results["log10_p"] = log10_pvalue(results["t_slope"])
+results["p_value"] = 10.0 ** results["log10_p"]
+
 
 # ----------------------------------------------------------
 # PLOTTING HELPERS
@@ -150,6 +115,10 @@ label_font = {"fontsize": 16, "fontweight": "bold"}
 # SCATTER PLOT
 # ----------------------------------------------------------
 def make_scatter():
+    figure = Artifact("log_scatter.png", (year, y_log))
+    if figure.restore():
+        return
+
     plt.figure(figsize=(9,7))
     plt.scatter(year, y_log, color="#27ae60", edgecolor="black")
 
@@ -159,7 +128,7 @@ def make_scatter():
     eq_symbolic = "y = β₀ + β₁·x"
     eq_numeric = f"y = {fmt_num(results['intercept'])} + {fmt_num(results['slope'])}·x"
     r2 = f"R² = {fmt_num(results['R2'])}"
-    pval = f"p = {fmt_p(results['p_value'])}"
+    pval = f"p = {fmt_log10_p(results['log10_p'])}"
 
     text = f"{eq_symbolic}\n{eq_numeric}\n{r2}\n{pval}"
 
@@ -177,8 +146,10 @@ def make_scatter():
     plt.ylim(bottom=0)
 
     plt.tight_layout()
-    plt.savefig("log_scatter.png", dpi=300)
+    with step("savefig log_scatter.png"):
+        plt.savefig("log_scatter.png", dpi=300)
     plt.close()
+    figure.store()
     print("✔ Saved scatter plot → log_scatter.png")
 
 
@@ -186,6 +157,10 @@ def make_scatter():
 # RESIDUAL PLOT
 # ----------------------------------------------------------
 def make_residual_plot():
+    figure = Artifact("log_residuals.png", (year, y_log))
+    if figure.restore():
+        return
+
     residuals = results["residuals"]
     y_pred = results["y_pred"]
 
@@ -198,27 +173,34 @@ def make_residual_plot():
     plt.ylabel("Residuals", **label_font)
 
     plt.tight_layout()
-    plt.savefig("log_residuals.png", dpi=300)
+    with step("savefig log_residuals.png"):
+        plt.savefig("log_residuals.png", dpi=300)
     plt.close()
+    figure.store()
     print("✔ Saved residual plot → log_residuals.png")
 
 
 # ----------------------------------------------------------
 # QQ PLOT
 # ----------------------------------------------------------
-import scipy.stats as stats
-
 def make_qq_plot():
+    figure = Artifact("log_qqplot.png", (year, y_log))
+    if figure.restore():
+        return
+
     plt.figure(figsize=(9,7))
-    stats.probplot(y_log, dist="norm", plot=plt)
+    with step("probplot", rows=len(y_log)):
+        stats.probplot(y_log, dist="norm", plot=plt)
 
     plt.title("QQ Plot — log(count+1)", **title_font)
     plt.xlabel("Theoretical Quantiles", **label_font)
     plt.ylabel("Sample Quantiles", **label_font)
 
     plt.tight_layout()
-    plt.savefig("log_qqplot.png", dpi=300)
+    with step("savefig log_qqplot.png"):
+        plt.savefig("log_qqplot.png", dpi=300)
     plt.close()
+    figure.store()
     print("✔ Saved QQ plot → log_qqplot.png")
 
 
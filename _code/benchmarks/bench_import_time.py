@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+bench_import_time.py
+
+Start-up import cost of every entry point.
+
+For each script the module-level imports are pulled out with `ast` (plain
+imports, the meteorite_eda sys.path bootstrap and `lazy_import(...)`
+assignments) and executed under `python -X importtime`, so the report
+shows what a script pays before doing any work. Libraries loaded through
+lazy_import only show up once used, i.e. not here.
+
+Usage:
+    python bench_import_time.py                   # every pipeline script
+    python bench_import_time.py path/to/script.py ...
+    python bench_import_time.py --top 5
+"""
+
+import sys
+import ast
+import argparse
+import subprocess
+from collections import defaultdict
+from pathlib import Path
+
+CODE_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(CODE_ROOT))
+from meteorite_eda.pipeline import STAGES  # noqa: E402
+
+parser = argparse.ArgumentParser(description="Import-time report for the entry points")
+parser.add_argument("scripts", nargs="*",
+                    help="scripts to measure (default: run_pipeline.py + every stage script)")
+parser.add_argument("--top", type=int, default=3,
+                    help="heaviest top-level packages to list per script")
+args = parser.parse_args()
+
+
+# ---------------------------------------------------------------------
+# 1. Import-only version of a script
+# ---------------------------------------------------------------------
+def _is_startup(node):
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        return True
+    if isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
+        return ast.unparse(node.value.func) == "sys.path.insert"
+    if isinstance(node, ast.Assign) and isinstance(node.value, ast.Call):
+        return ast.unparse(node.value.func) == "lazy_import"
+    return False
+
+
+def import_program(script):
+    tree = ast.parse(script.read_text(encoding="utf-8"))
+    body = [node for node in tree.body if _is_startup(node)]
+    return f"__file__ = {str(script)!r}\n" + "\n".join(ast.unparse(n) for n in body)
+
+
+# ---------------------------------------------------------------------
+# 2. -X importtime parsing
+# ---------------------------------------------------------------------
+def import_times(program):
+    """{top-level module: cumulative µs} for modules imported by `program`."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", program],
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    out = defaultdict(int)
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  "):          # nested import, counted by its parent
+            continue
+        out[name.strip().split(".")[0]] += int(cumulative)
+    return out
+
+
+baseline = set(import_times("pass"))
+
+
+def report(script):
+    times = {k: v for k, v in import_times(import_program(script)).items()
+             if k not in baseline}
+    total = sum(times.values()) / 1e3
+    heavy = sorted(times.items(), key=lambda kv: -kv[1])[:args.top]
+    return total, ", ".join(f"{name} {us / 1e3:.0f}" for name, us in heavy)
+
+
+# ---------------------------------------------------------------------
+# 3. Report
+# ---------------------------------------------------------------------
+if args.scripts:
+    scripts = [Path(s).resolve() for s in args.scripts]
+else:
+    scripts = [CODE_ROOT / "run_pipeline.py"]
+    scripts += [CODE_ROOT / s.script for s in STAGES if s.script]
+
+print(f"{'script':<52} {'import ms':>10}   heaviest (ms)")
+for script in scripts:
+    total, heavy = report(script)
+    print(f"{script.name:<52} {total:>10.0f}   {heavy}")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+bench_parallel_read.py
+
+Throughput of the raw catalog parse versus worker count.
+
+Builds an enlarged catalog — the data rows of Meteorite_Landings.csv
+repeated, or a synthetic catalog (synthetic.py) with --synthetic — checks
+once that the parallel reader returns exactly the `pd.read_csv` frame,
+then times:
+    - pd.read_csv (single thread baseline)
+    - read_csv_parallel with 1, 2, 4, ... workers up to the core count
+
+The parallel reader only splits files into ranges of at least
+MIN_RANGE_BYTES (4 MiB), so the real 3.6 MB catalog on its own is always
+read single-threaded; the benchmark refuses catalogs too small to give
+every worker count its own ranges.
+
+Usage:
+    python bench_parallel_read.py [--repeat 40] [--max-workers N]
+    python bench_parallel_read.py --synthetic 2000000
+"""
+
+import sys
+import os
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.parallel_csv import MIN_RANGE_BYTES, read_csv_parallel  # noqa: E402
+from meteorite_eda.synthetic import generate_catalog  # noqa: E402
+
+SOURCE = Path(__file__).resolve().parents[1] / "Meteorite_Landings.csv"
+
+parser = argparse.ArgumentParser(description="Parallel CSV read benchmark")
+parser.add_argument("--repeat", type=int, default=40,
+                    help="copies of the data rows in the enlarged catalog")
+parser.add_argument("--synthetic", type=int, metavar="ROWS", default=None,
+                    help="benchmark a synthetic catalog of ROWS records instead")
+parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+args = parser.parse_args()
+
+# ---------------------------------------------------------------------
+# 1. Enlarged catalog
+# ---------------------------------------------------------------------
+tmp = tempfile.NamedTemporaryFile(suffix=".csv", delete=False)
+if args.synthetic:
+    tmp.close()
+    generate_catalog(tmp.name, args.synthetic)
+else:
+    lines = SOURCE.read_bytes().splitlines(keepends=True)
+    header, body = lines[0], b"".join(lines[1:])
+    with tmp:
+        tmp.write(header)
+        for _ in range(args.repeat):
+            tmp.write(body)
+big = Path(tmp.name)
+size_mb = big.stat().st_size / 1e6
+
+# below MIN_RANGE_BYTES per worker the reader falls back to one read_csv
+need = max(args.max_workers, 2) * MIN_RANGE_BYTES
+if big.stat().st_size < need:
+    big.unlink()
+    sys.exit(f"✘ Catalog is {size_mb:.1f} MB; {need / 1e6:.1f} MB are needed to give "
+             f"{max(args.max_workers, 2)} workers a {MIN_RANGE_BYTES >> 20} MiB range "
+             "each. Raise --repeat / --synthetic.")
+
+# ---------------------------------------------------------------------
+# 2. Correctness check + timings
+# ---------------------------------------------------------------------
+def timed(fn):
+    start = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - start
+
+
+try:
+    reference, base_s = timed(lambda: pd.read_csv(big))
+    rows = len(reference)
+
+    check = read_csv_parallel(big, workers=max(args.max_workers, 2))
+    pd.testing.assert_frame_equal(reference, check)
+    del check
+
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= args.max_workers:
+        worker_counts.append(worker_counts[-1] * 2)
+    if worker_counts[-1] != args.max_workers:
+        worker_counts.append(args.max_workers)
+
+    print(f"Catalog: {rows:,} rows, {size_mb:.1f} MB "
+          f"({os.cpu_count()} cores visible)\n")
+    print(f"{'reader':<24}{'seconds':>10}{'MB/s':>10}{'rows/s':>14}{'speedup':>10}")
+    print(f"{'pd.read_csv':<24}{base_s:>10.3f}{size_mb / base_s:>10.1f}"
+          f"{rows / base_s:>14,.0f}{1.0:>10.2f}")
+
+    for workers in worker_counts:
+        _, secs = timed(lambda: read_csv_parallel(big, workers=workers))
+        print(f"{f'parallel ({workers} workers)':<24}{secs:>10.3f}"
+              f"{size_mb / secs:>10.1f}{rows / secs:>14,.0f}{base_s / secs:>10.2f}")
+finally:
+    big.unlink()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+bench_stages.py
+
+Throughput and memory of the real pipeline stages at growing input sizes.
+
+For every size N a scratch folder is prepared with
+    - catalog/  a synthetic raw catalog of N rows (synthetic.py), used by
+                the Phase I reports and the Phase II df_maker
+    - series/   a synthetic Phase II [year, count] table of N rows, used by
+                the Phase II reports, the Phase III transform / outlier /
+                topology / plot scripts and the Phase IV models
+
+and each stage script from the pipeline graph is run unchanged, as its
+own process, with profiling enabled. The report lists wall time, rows/s
+and the child's peak RSS per stage, plus the slowest profiled step inside
+it (parse, groupby, binned kde, shapiro, savefig, ...).
+
+The real data never gives Phase III/IV more than ~2,000 years; the N-row
+series is there to show how those computations and renderers scale.
+
+Usage:
+    python bench_stages.py                          # 1e4 1e6 1e7 1e8 rows
+    python bench_stages.py --sizes 1e4 1e5 --stages phase_iii phase_iv
+    python bench_stages.py --sizes 1e6 --json results.json --keep scratch/
+"""
+
+import sys
+import os
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+
+CODE_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(CODE_ROOT))
+from meteorite_eda.pipeline import (  # noqa: E402
+    PHASE_II_CSV, RAW, STAGES, matches, resolve_dependencies,
+)
+from meteorite_eda.artifacts import ENV_ARTIFACT_CACHE  # noqa: E402
+from meteorite_eda.profiling import ENV_PROFILE  # noqa: E402
+from meteorite_eda.synthetic import (  # noqa: E402
+    CatalogModel, generate_catalog, year_count_table,
+)
+
+parser = argparse.ArgumentParser(description="Per-stage scaling benchmark")
+parser.add_argument("--sizes", nargs="+", type=float, default=[1e4, 1e6, 1e7, 1e8],
+                    help="input rows per run (default: 1e4 1e6 1e7 1e8)")
+parser.add_argument("--stages", nargs="*", default=[],
+                    help="stage names / phases / globs to run (default: all)")
+parser.add_argument("--seed", type=int, default=0)
+parser.add_argument("--timeout", type=float, default=3600,
+                    help="seconds before a stage is killed (default: %(default)s)")
+parser.add_argument("--keep", metavar="DIR",
+                    help="build inputs and outputs in DIR and keep them")
+parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+args = parser.parse_args()
+
+
+# ---------------------------------------------------------------------
+# 1. Running one stage
+# ---------------------------------------------------------------------
+def run_stage(script, cwd, profile_dir):
+    """(wall seconds, peak RSS MB or None, returncode) of one script run."""
+    # the artifact cache is off: a repeated run would otherwise time the
+    # restore of tables and figures rendered by the previous one
+    env = dict(os.environ, **{ENV_PROFILE: str(profile_dir), "MPLBACKEND": "Agg",
+                              ENV_ARTIFACT_CACHE: "off"})
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, str(script)], cwd=cwd, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    killer = threading.Timer(args.timeout, proc.kill)
+    killer.start()
+    try:
+        if hasattr(os, "wait4"):
+            stderr = proc.stderr.read()
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            rss = usage.ru_maxrss / (1 << 20 if sys.platform == "darwin" else 1024)
+        else:
+            _, stderr = proc.communicate()
+            rss = None
+    finally:
+        killer.cancel()
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        tail = stderr.decode(errors="replace").strip().splitlines()[-1:] or [""]
+        print(f"      ✘ {script.name} exit {proc.returncode}: {tail[0]}")
+    return wall, rss, proc.returncode
+
+
+def slowest_step(profile_dir):
+    steps = []
+    for path in Path(profile_dir).glob("*.profile.json"):
+        steps += json.loads(path.read_text(encoding="utf-8"))["steps"]
+    if not steps:
+        return "-", 0.0
+    top = max(steps, key=lambda s: s["wall_s"])
+    return top["step"], top["wall_s"]
+
+
+# ---------------------------------------------------------------------
+# 2. Benchmark loop
+# ---------------------------------------------------------------------
+stages = [s for s in resolve_dependencies(STAGES) if s.script]
+if args.stages:
+    wanted = [s for s in stages if any(matches(s.name, p) for p in args.stages)]
+    # the Phase III/IV scripts need the transform's output
+    needs_transform = any(s.name.startswith(("phase_iii.", "phase_iv.")) for s in wanted)
+    stages = [s for s in stages if s in wanted
+              or (needs_transform and s.name == "phase_iii.data_transform")]
+
+model = CatalogModel.fit()
+root = Path(args.keep) if args.keep else Path(tempfile.mkdtemp(prefix="bench_stages_"))
+results = []
+
+print(f"{'rows':>12}  {'stage':<30} {'wall s':>9} {'rows/s':>12} {'peak MB':>9}   slowest step")
+for size in args.sizes:
+    n = int(size)
+    base = root / f"n{n}"
+    catalog_dir, series_dir = base / "catalog", base / "series"
+    for folder in (catalog_dir, series_dir):
+        shutil.rmtree(folder, ignore_errors=True)
+        folder.mkdir(parents=True)
+
+    t0 = time.perf_counter()
+    if any(s.inputs[0].endswith(RAW) for s in stages):
+        generate_catalog(catalog_dir / RAW, n, model=model, seed=args.seed)
+    year_count_table(n, seed=args.seed).to_csv(series_dir / PHASE_II_CSV, index=False)
+    print(f"{n:>12,}  {'(inputs generated)':<30} {time.perf_counter() - t0:>9.2f}")
+
+    for stage in stages:
+        cwd = catalog_dir if stage.inputs[0].endswith(RAW) else series_dir
+        profile_dir = base / "profiles" / stage.name
+        shutil.rmtree(profile_dir, ignore_errors=True)
+        wall, rss, code = run_stage(CODE_ROOT / stage.script, cwd, profile_dir)
+        step_name, step_s = slowest_step(profile_dir)
+        results.append({
+            "rows": n, "stage": stage.name, "ok": code == 0,
+            "wall_s": round(wall, 4), "rows_per_s": round(n / wall, 1),
+            "peak_rss_mb": None if rss is None else round(rss, 1),
+            "slowest_step": step_name, "slowest_step_s": round(step_s, 4),
+        })
+        rss_txt = "-" if rss is None else f"{rss:.0f}"
+        print(f"{n:>12,}  {stage.name:<30} {wall:>9.2f} {n / wall:>12,.0f} {rss_txt:>9}"
+              f"   {step_name} ({step_s:.2f}s)")
+
+if args.json:
+    Path(args.json).write_text(json.dumps(results, indent=1), encoding="utf-8")
+    print(f"\n✔ Results written to: {Path(args.json).resolve()}")
+
+if not args.keep:
+    shutil.rmtree(root, ignore_errors=True)
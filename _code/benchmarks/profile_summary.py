@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+profile_summary.py
+
+Summarizes the *.profile.json files written with METEORITE_PROFILE (or
+run_pipeline.py --profile DIR) as one table per folder: wall time, CPU
+time, rows and peak RSS per script step. Pass two folders (e.g. runs on
+the real catalog and on a synthetic 10× catalog) to compare them side by
+side.
+
+Usage:
+    python profile_summary.py profiles/
+    python profile_summary.py profiles_before/ profiles_after/ [--min-ms 5]
+"""
+
+import json
+import argparse
+from pathlib import Path
+
+parser = argparse.ArgumentParser(description="Summarize per-step profiles")
+parser.add_argument("folders", nargs="+", help="folders holding *.profile.json")
+parser.add_argument("--min-ms", type=float, default=1.0,
+                    help="hide steps faster than this in every folder")
+args = parser.parse_args()
+
+
+def load(folder):
+    """{(script, step): [wall_s, cpu_s, rows, peak_rss_mb]} summed over runs."""
+    out = {}
+    for path in sorted(Path(folder).glob("*.profile.json")):
+        for rec in json.loads(path.read_text(encoding="utf-8"))["steps"]:
+            key = (rec["script"], rec["step"])
+            agg = out.setdefault(key, [0.0, 0.0, 0, 0.0])
+            agg[0] += rec["wall_s"]
+            agg[1] += rec["cpu_s"]
+            agg[2] += rec["rows"] or 0
+            agg[3] = max(agg[3], rec["peak_rss_mb"] or 0.0)
+    return out
+
+
+runs = [load(folder) for folder in args.folders]
+keys = sorted(set().union(*runs))
+
+header = f"{'script':<40} {'step':<34}"
+for i, _ in enumerate(runs):
+    header += f" | {'wall ms':>9} {'cpu ms':>9} {'rows':>9} {'rss MB':>7}"
+if len(runs) == 2:
+    header += f" | {'Δ wall':>7}"
+print(header)
+print("-" * len(header))
+
+for key in keys:
+    cells = [run.get(key) for run in runs]
+    if all(c is None or c[0] * 1e3 < args.min_ms for c in cells):
+        continue
+    line = f"{key[0][:40]:<40} {key[1][:34]:<34}"
+    for c in cells:
+        if c is None:
+            line += f" | {'-':>9} {'-':>9} {'-':>9} {'-':>7}"
+        else:
+            line += f" | {c[0] * 1e3:>9.1f} {c[1] * 1e3:>9.1f} {c[2]:>9,} {c[3]:>7.1f}"
+    if len(runs) == 2 and cells[0] and cells[1] and cells[0][0] > 0:
+        line += f" | {cells[1][0] / cells[0][0]:>6.2f}×"
+    print(line)
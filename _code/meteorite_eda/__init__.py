@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+"""
+meteorite_eda
+
+Shared helpers for the INFO 511 meteorite EDA scripts.
+
+The phase scripts under `_code/0_EDA_Phase_*` stay standalone and are still
+run from their own folder; they put `_code/` on `sys.path` and import the
+pieces they need from the submodules here. Nothing heavy is imported at
+package import time.
+"""
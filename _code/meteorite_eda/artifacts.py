@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+artifacts.py
+
+Content-addressed cache for the rendered outputs of the phase scripts
+(300-dpi PNG figures, HTML tables).
+
+An artifact's key is the SHA-256 over
+    - the bytes of the script that generates it (sys.argv[0]), its
+      command-line flags and the shared meteorite_eda code,
+    - the data slice it is drawn from (arrays, Series, DataFrames),
+    - its rendering parameters (titles, bin counts, ...) and any other
+      value the output shows that is not in the data slice,
+    - the output's file name and, for figures, the matplotlib version.
+
+Rendered files are kept once under `_code/.artifact_cache/`, named by
+their key. When a script is re-run with the same key the cached bytes are
+copied into place and the figure is never drawn:
+
+    fig = Artifact(OUTPUT_PNG, counts)
+    if not fig.restore():
+        plt.figure(figsize=(8, 6))
+        ...
+        plt.savefig(OUTPUT_PNG, dpi=300, bbox_inches="tight")
+        fig.store()
+
+The pipeline's stage fingerprints (pipeline.py) decide whether a script
+runs at all; this cache covers the runs that do happen — `--force`,
+scripts run by hand, edits to one output of a multi-output script, and
+switching back to a dataset that was rendered before.
+
+Set METEORITE_ARTIFACT_CACHE to a folder to move the cache, or to "off"
+to always render.
+"""
+
+import functools
+import hashlib
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from meteorite_eda.hashing import file_digest, text_digest, tree_digest
+
+CODE_ROOT = Path(__file__).resolve().parents[1]
+CACHE_DIR_NAME = ".artifact_cache"
+ENV_ARTIFACT_CACHE = "METEORITE_ARTIFACT_CACHE"
+FIGURE_SUFFIXES = (".png", ".svg", ".pdf", ".jpg")
+
+
+def cache_dir():
+    """The cache folder, or None when caching is switched off."""
+    setting = os.environ.get(ENV_ARTIFACT_CACHE, "")
+    if setting.lower() in ("off", "0", "false", "no"):
+        return None
+    return Path(setting) if setting else CODE_ROOT / CACHE_DIR_NAME
+
+
+# ---------------------------------------------------------------------
+# Key parts
+# ---------------------------------------------------------------------
+@functools.lru_cache(maxsize=None)
+def _script_digest(script):
+    try:
+        return file_digest(script)
+    except OSError:
+        return "-"
+
+
+@functools.lru_cache(maxsize=None)
+def _library_digest():
+    return tree_digest(Path(__file__).resolve().parent)
+
+
+@functools.lru_cache(maxsize=None)
+def _matplotlib_version():
+    # read from the package metadata so that restoring a figure does not
+    # import matplotlib just to build its key
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        return version("matplotlib")
+    except PackageNotFoundError:
+        return "-"
+
+
+def data_digest(obj):
+    """
+    Digest of a data slice: numpy arrays, pandas Series/DataFrames, files
+    (Path), and tuples/lists/dicts of these. Anything else by its repr.
+    """
+    parts = []
+    _feed(obj, parts)
+    return text_digest(*parts)
+
+
+def _feed(obj, parts):
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        parts.append(repr(obj))
+    elif isinstance(obj, Path):
+        parts.append(f"file:{file_digest(obj)}")
+    elif isinstance(obj, (tuple, list)):
+        parts.append(f"seq:{len(obj)}")
+        for item in obj:
+            _feed(item, parts)
+    elif isinstance(obj, dict):
+        parts.append(f"map:{len(obj)}")
+        for key in sorted(obj, key=repr):
+            parts.append(repr(key))
+            _feed(obj[key], parts)
+    elif type(obj).__module__.startswith("pandas"):
+        import pandas as pd
+        if isinstance(obj, pd.DataFrame):
+            parts.append(repr(list(obj.columns)) + repr([str(t) for t in obj.dtypes]))
+        else:
+            parts.append(f"{obj.name!r}:{obj.dtype}")
+        hashed = pd.util.hash_pandas_object(obj, index=True).to_numpy()
+        parts.append(hashlib.sha256(hashed.tobytes()).hexdigest())
+    elif type(obj).__module__ == "numpy":
+        import numpy as np
+        arr = np.asarray(obj)
+        parts.append(f"{arr.dtype.str}:{arr.shape}")
+        if arr.dtype.hasobject:
+            parts.append("\0".join(map(repr, arr.ravel().tolist())))
+        else:
+            parts.append(hashlib.sha256(np.ascontiguousarray(arr).data).hexdigest())
+    else:
+        parts.append(repr(obj))
+
+
+# ---------------------------------------------------------------------
+# One cached output
+# ---------------------------------------------------------------------
+class Artifact:
+    """A generated file whose bytes are determined by (script, data, params)."""
+
+    def __init__(self, path, data=None, **params):
+        self.path = Path(path)
+        script = sys.argv[0] if sys.argv and sys.argv[0] else ""
+        parts = [
+            self.path.name,
+            _script_digest(str(Path(script).resolve())) if script else "-",
+            repr(sys.argv[1:]),
+            _library_digest(),
+            data_digest(data),
+            data_digest(params),
+        ]
+        if self.path.suffix.lower() in FIGURE_SUFFIXES:
+            parts.append(f"matplotlib {_matplotlib_version()}")
+        self.key = text_digest(*parts)
+
+    @property
+    def cached(self):
+        folder = cache_dir()
+        if folder is None:
+            return None
+        return folder / self.key[:2] / f"{self.key}{self.path.suffix}"
+
+    def restore(self):
+        """Copy the cached bytes to `path`; False if there is no entry."""
+        entry = self.cached
+        if entry is None or not entry.is_file():
+            return False
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        shutil.copyfile(entry, tmp)
+        os.replace(tmp, self.path)
+        print(f"✔ {self.path.name} unchanged — served from the artifact cache")
+        return True
+
+    def store(self):
+        """Add the freshly written `path` to the cache."""
+        entry = self.cached
+        if entry is None or not self.path.is_file():
+            return
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        shutil.copyfile(self.path, tmp)
+        os.replace(tmp, entry)
+
+
+def clear_cache():
+    """Remove every cached artifact; returns the number of files removed."""
+    folder = cache_dir()
+    if folder is None or not folder.exists():
+        return 0
+    removed = sum(1 for p in folder.rglob("*") if p.is_file())
+    shutil.rmtree(folder)
+    return removed
@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+catalog.py
+
+Shared loader for Meteorite_Landings.csv.
+
+The first load of a catalog parses the CSV once and writes a columnar
+binary copy into a `.catalog_cache/` folder next to the CSV:
+    - Parquet when pyarrow is installed
+    - a pandas pickle otherwise
+
+Cache entries are keyed by the SHA-256 of the CSV bytes, so editing the
+catalog (or dropping in a new snapshot) produces a new entry and a stale
+copy is never served. The digest itself is memoized per (size, mtime) so
+unchanged catalogs are not re-hashed on every run.
+
+`typed=True` loads with the declared CATALOG_SCHEMA instead of pandas'
+default inference (categoricals, float32 coordinates, nullable int years);
+`drop_geolocation=True` skips the redundant GeoLocation string column.
+
+`columns=` / `where=` let a stage declare the projection and row
+predicates it needs; they are pushed into the parse (see predicates.py).
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from meteorite_eda.parallel_csv import (
+    conflicting_text_columns, defer_categoricals, read_csv_parallel,
+    restore_categoricals, with_text_columns,
+)
+from meteorite_eda.hashing import file_digest
+from meteorite_eda.predicates import apply_predicates, predicate_columns, validate
+from meteorite_eda.profiling import profiled
+
+CACHE_DIR_NAME = ".catalog_cache"
+DIGEST_INDEX = "digests.json"
+DEFAULT_CHUNKSIZE = 1_000_000
+
+# ---------------------------------------------------------------------
+# Declared schema for the ten catalog columns
+# ---------------------------------------------------------------------
+# `name` is unique per record, so it stays a plain string column;
+# `GeoLocation` duplicates reclat/reclong and can be skipped entirely.
+CATALOG_SCHEMA = {
+    "id": "int32",
+    "nametype": "category",
+    "recclass": "category",
+    "mass (g)": "float64",
+    "fall": "category",
+    "year": "Int16",
+    "reclat": "float32",
+    "reclong": "float32",
+}
+
+
+# ---------------------------------------------------------------------
+# Content hashing
+# ---------------------------------------------------------------------
+def catalog_digest(path):
+    """Digest of `path`, reusing the memoized value if size/mtime match."""
+    path = Path(path).resolve()
+    index_path = path.parent / CACHE_DIR_NAME / DIGEST_INDEX
+    st = path.stat()
+    stamp = [st.st_size, st.st_mtime_ns]
+
+    index = {}
+    if index_path.exists():
+        try:
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+        except ValueError:
+            index = {}
+
+    entry = index.get(path.name)
+    if entry and entry[:2] == stamp:
+        return entry[2]
+
+    digest = file_digest(path)
+    index[path.name] = stamp + [digest]
+    index_path.parent.mkdir(exist_ok=True)
+    _atomic_write_bytes(index_path, json.dumps(index, indent=1).encode("utf-8"))
+    return digest
+
+
+# ---------------------------------------------------------------------
+# Cache storage
+# ---------------------------------------------------------------------
+def cache_format():
+    """'parquet' if pyarrow is importable, else 'pkl'."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "pkl"
+    return "parquet"
+
+
+def cache_path(path, variant="raw"):
+    """Location of the cached copy of `path` for a given load variant."""
+    path = Path(path)
+    digest = catalog_digest(path)[:20]
+    name = f"{path.stem}-{variant}-{digest}.{cache_format()}"
+    return path.resolve().parent / CACHE_DIR_NAME / name
+
+
+def _atomic_write_bytes(target, payload):
+    tmp = target.with_name(target.name + f".{os.getpid()}.tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, target)
+
+
+def _write_cache(df, target):
+    target.parent.mkdir(exist_ok=True)
+    tmp = target.with_name(target.name + f".{os.getpid()}.tmp")
+    if target.suffix == ".parquet":
+        df.to_parquet(tmp, index=False)
+    else:
+        df.to_pickle(tmp)
+    os.replace(tmp, target)
+
+
+def _read_cache(target, columns=None):
+    if target.suffix == ".parquet":
+        return pd.read_parquet(target, columns=columns)
+    df = pd.read_pickle(target)
+    return df if columns is None else df[columns]
+
+
+def clear_cache(path):
+    """Remove every cached copy that belongs to catalog `path`."""
+    path = Path(path).resolve()
+    cache_dir = path.parent / CACHE_DIR_NAME
+    if not cache_dir.exists():
+        return 0
+    removed = 0
+    for entry in cache_dir.glob(f"{path.stem}-*"):
+        entry.unlink()
+        removed += 1
+    return removed
+
+
+# ---------------------------------------------------------------------
+# Public loader
+# ---------------------------------------------------------------------
+def _not_geolocation(col):
+    # module-level (not a lambda) so parallel workers can unpickle it
+    return col != "GeoLocation"
+
+
+def _read_csv_kwargs(typed, drop_geolocation):
+    kwargs = {}
+    if typed:
+        kwargs["dtype"] = CATALOG_SCHEMA
+    if drop_geolocation:
+        kwargs["usecols"] = _not_geolocation
+    return kwargs
+
+
+def _variant_name(typed, drop_geolocation, columns=None, where=None):
+    name = "typed" if typed else "raw"
+    if drop_geolocation:
+        name += "-nogeo"
+    if columns is not None or where:
+        query = repr((list(columns) if columns is not None else None, list(where or [])))
+        name += "-q" + hashlib.sha1(query.encode("utf-8")).hexdigest()[:12]
+    return name
+
+
+def catalog_columns(path):
+    """Header of the catalog CSV (no rows are parsed)."""
+    return pd.read_csv(path, nrows=0).columns.tolist()
+
+
+def _scan(path, kwargs, columns, where, workers, chunksize):
+    """
+    Parse only what a stage asked for: `usecols` limits the columns that
+    are materialized and predicates are applied chunk by chunk, so rejected
+    rows never accumulate.
+    """
+    if columns is not None:
+        needed = list(columns) + [c for c in predicate_columns(where) if c not in columns]
+        kwargs = dict(kwargs, usecols=needed)
+
+    if workers and workers > 1:
+        return read_csv_parallel(path, workers=workers, where=where,
+                                 columns=columns, **kwargs)
+
+    if columns is None and not where:
+        return pd.read_csv(path, **kwargs)
+
+    kwargs, categorical = defer_categoricals(kwargs)
+
+    def read_pieces(read_kwargs):
+        reader = pd.read_csv(path, chunksize=chunksize, **read_kwargs)
+        return [apply_predicates(chunk, where, columns) for chunk in reader]
+
+    pieces = read_pieces(kwargs)
+    if not pieces:
+        return apply_predicates(pd.read_csv(path, nrows=0, **kwargs), where, columns)
+
+    text_cols = conflicting_text_columns(pieces)
+    if text_cols:
+        pieces = read_pieces(with_text_columns(kwargs, text_cols))
+
+    df = pd.concat(pieces, ignore_index=True)
+    return restore_categoricals(df, categorical)
+
+
+@profiled("catalog.load")
+def load_catalog(path="Meteorite_Landings.csv", use_cache=True,
+                 typed=False, drop_geolocation=False, workers=None,
+                 columns=None, where=None, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Load the meteorite catalog as a DataFrame.
+
+    With the defaults this returns the same frame as `pd.read_csv(path)`;
+    with `use_cache` the parse happens once per distinct file content and
+    later calls read the binary copy instead. `workers > 1` parses the CSV
+    across that many processes (see parallel_csv.py).
+
+    A stage can declare the `columns` it needs and row predicates `where`
+    (see predicates.py); both are applied while parsing. If a full cached
+    copy already exists the query is answered from it instead, otherwise
+    the query result itself is cached.
+    """
+    path = Path(path)
+    validate(where)
+    kwargs = _read_csv_kwargs(typed, drop_geolocation)
+    if not use_cache:
+        return _scan(path, kwargs, columns, where, workers, chunksize)
+
+    full = cache_path(path, _variant_name(typed, drop_geolocation))
+    if (columns is not None or where) and full.exists():
+        needed = None
+        if columns is not None:
+            needed = list(columns) + [c for c in predicate_columns(where) if c not in columns]
+        df = apply_predicates(_read_cache(full, needed), where, columns)
+        # match the scan path, whose categories only hold observed values
+        for col in df.select_dtypes("category").columns:
+            df[col] = df[col].cat.remove_unused_categories()
+        return df
+
+    target = cache_path(path, _variant_name(typed, drop_geolocation, columns, where))
+    if target.exists():
+        return _read_cache(target)
+
+    df = _scan(path, kwargs, columns, where, workers, chunksize)
+    _write_cache(df, target)
+    return df
+
+
+# ---------------------------------------------------------------------
+# Memory report
+# ---------------------------------------------------------------------
+def memory_report(path="Meteorite_Landings.csv"):
+    """
+    Per-column deep memory usage (bytes) of the default load versus the
+    typed load, with and without GeoLocation. The last row holds totals.
+    """
+    raw = load_catalog(path, use_cache=False)
+    typed = load_catalog(path, use_cache=False, typed=True)
+    lean = load_catalog(path, use_cache=False, typed=True, drop_geolocation=True)
+
+    report = pd.DataFrame({
+        "raw dtype": raw.dtypes.astype(str),
+        "raw bytes": raw.memory_usage(deep=True, index=False),
+        "typed dtype": typed.dtypes.astype(str),
+        "typed bytes": typed.memory_usage(deep=True, index=False),
+        "lean bytes": lean.memory_usage(deep=True, index=False),
+    }).reindex(raw.columns)
+    report["lean bytes"] = report["lean bytes"].fillna(0).astype("int64")
+    report.loc["TOTAL"] = [
+        "", report["raw bytes"].sum(),
+        "", report["typed bytes"].sum(), report["lean bytes"].sum(),
+    ]
+    return report
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+density.py
+
+Binned Gaussian KDE and mode detection for the topology check.
+
+scipy.stats.gaussian_kde sums one Gaussian per sample at every grid
+point, O(n · grid). Here the samples are first spread onto the grid by
+linear binning (each value splits its weight between its two neighbouring
+grid points), and the binned counts are convolved with the Gaussian kernel
+sampled at the grid spacing, by FFT:
+
+    O(n + grid · log grid)
+
+The bandwidth defaults to Scott's rule with the sample standard deviation
+— the same factor n^(-1/5) · std(ddof=1) gaussian_kde uses — so the curve
+agrees with gaussian_kde's to within the binning error (a fraction of the
+grid spacing, far below the bandwidth for any sensible grid). The
+convolution is zero-padded over the kernel's reach, so nothing wraps
+around the ends of the grid.
+
+Modes are the strict local maxima of the density, found with one
+vectorized comparison; each is reported with its prominence (height above
+the higher of the two valleys separating it from taller peaks).
+
+    xs, dens = binned_kde(counts, grid=512)
+    modes = kde_modes(xs, dens)         # DataFrame: location, density, prominence
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.signal import peak_prominences
+
+DEFAULT_GRID = 512
+KERNEL_REACH = 6.0        # kernel truncated at ± KERNEL_REACH bandwidths
+NOISE_FLOOR = 1e-12       # FFT round-off below this fraction of the peak is zeroed
+
+
+def scott_bandwidth(x):
+    """Scott's rule, as gaussian_kde(x).factor · std(x, ddof=1)."""
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    if n < 2:
+        return np.nan
+    return n ** (-1 / 5) * np.std(x, ddof=1)
+
+
+def linear_bin(x, lo, hi, grid):
+    """Weights of `x` spread linearly onto `grid` points spanning [lo, hi]."""
+    x = np.asarray(x, dtype=float)
+    x = x[(x >= lo) & (x <= hi)]
+    if hi == lo:
+        counts = np.zeros(grid)
+        counts[0] = len(x)
+        return counts
+    pos = (x - lo) / (hi - lo) * (grid - 1)
+    left = np.minimum(np.floor(pos).astype(np.int64), grid - 2)
+    frac = pos - left
+    counts = np.bincount(left, weights=1 - frac, minlength=grid)
+    counts += np.bincount(left + 1, weights=frac, minlength=grid)
+    return counts
+
+
+def binned_kde(x, grid=DEFAULT_GRID, bandwidth=None, lo=None, hi=None):
+    """
+    (xs, density) of a Gaussian KDE of `x` on `grid` points spanning
+    [lo, hi] (default: the data's range). NaNs are ignored.
+    """
+    x = np.asarray(x, dtype=float)
+    x = x[~np.isnan(x)]
+    if len(x) == 0 and (lo is None or hi is None):
+        return np.full(grid, np.nan), np.full(grid, np.nan)
+    lo = x.min() if lo is None else lo
+    hi = x.max() if hi is None else hi
+    xs = np.linspace(lo, hi, grid)
+    if bandwidth is None:
+        bandwidth = scott_bandwidth(x)
+    if len(x) == 0 or not bandwidth > 0 or hi == lo:
+        return xs, np.full(grid, np.nan)
+
+    counts = linear_bin(x, lo, hi, grid)
+    dx = (hi - lo) / (grid - 1)
+    reach = min(grid - 1, int(np.ceil(KERNEL_REACH * bandwidth / dx)))
+    offsets = np.arange(-reach, reach + 1) * dx
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+
+    size = grid + len(kernel) - 1
+    nfft = 1 << int(np.ceil(np.log2(size)))
+    full = np.fft.irfft(np.fft.rfft(counts, nfft) * np.fft.rfft(kernel, nfft), nfft)
+    dens = full[reach:reach + grid] / len(x)
+    dens[dens < NOISE_FLOOR * dens.max()] = 0.0
+    return xs, dens
+
+
+def kde_modes(xs, dens, min_prominence=0.0):
+    """
+    DataFrame (location, density, prominence) of the strict local maxima
+    of `dens`, tallest first; prominences are measured with the density
+    taken as zero beyond both ends of the grid. Peaks less prominent than
+    `min_prominence` (as a fraction of the highest density) are dropped.
+    """
+    dens = np.asarray(dens, dtype=float)
+    inner = dens[1:-1]
+    idx = np.flatnonzero((inner > dens[:-2]) & (inner > dens[2:])) + 1
+    # the KDE falls to zero outside the grid; without the zero ends a peak
+    # next to an edge could only measure its prominence down to the edge
+    padded = np.concatenate([[0.0], np.nan_to_num(dens), [0.0]])
+    prominence = peak_prominences(padded, idx + 1)[0] if len(idx) else np.empty(0)
+    modes = pd.DataFrame({
+        "location": np.asarray(xs)[idx],
+        "density": dens[idx],
+        "prominence": prominence,
+    })
+    if min_prominence > 0 and len(modes):
+        modes = modes[modes["prominence"] >= min_prominence * np.nanmax(dens)]
+    return modes.sort_values("density", ascending=False, ignore_index=True)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+grouped.py
+
+Phase IV year trends per catalog group — every recclass, Fell vs. Found,
+Valid vs. Relict — fitted all at once instead of group by group.
+
+1. group_year_counts() builds one (groups × years) count matrix for any
+   number of grouping columns in a single np.bincount: each row gets the
+   flat cell (offset[column] + group code) · n_years + (year − year_min),
+   for every grouping column at once.
+
+2. fit_group_trends() regresses
+       log(count + 1) ~ year      sqrt(count) ~ year
+   (the Phase III transforms) for every group. As in Phase II, a group's
+   series holds only the years with at least one record, so the nonzero
+   cells of the matrix, read row by row, are the concatenated series of
+   all groups; each group is a contiguous segment and its sums are
+   np.add.reduceat over the segment starts. Two passes — means first,
+   then centered Σ(x − x̄)², Σ(x − x̄)(y − ȳ), Σ(y − ȳ)² — keep the sums
+   well conditioned for calendar years.
+
+    keys, counts = group_year_counts(df, ["recclass", "fall", "nametype"])
+    trends = fit_group_trends(keys, counts)      # one row per group
+
+Groups with fewer than three years have no slope (NaN); a group whose
+yearly count never changes has slope 0 and no R². P-values are the
+two-sided Student t p-values of the slopes, kept in log10 (regression.py).
+"""
+
+import numpy as np
+import pandas as pd
+
+from meteorite_eda.profiling import profiled
+from meteorite_eda.regression import log10_pvalue
+from meteorite_eda.yearcounts import YEAR_MAX, YEAR_MIN
+
+GROUP_COLUMNS = ["recclass", "fall", "nametype"]
+TREND_MODELS = {
+    "log": np.log1p,
+    "sqrt": np.sqrt,
+}
+TREND_KEYS = ["slope", "intercept", "R2", "SE_slope", "log10_p"]
+
+
+# ---------------------------------------------------------------------
+# Aggregation: one pass for all grouping columns
+# ---------------------------------------------------------------------
+@profiled("grouped.group_year_counts")
+def group_year_counts(df, by=GROUP_COLUMNS, year_min=YEAR_MIN, year_max=YEAR_MAX):
+    """
+    Count the rows of `df` (already cleaned; integer `year` in range) per
+    group and year. Returns (keys, counts): keys is a [column, group]
+    frame with one row per group, counts the matching (groups × years)
+    int64 matrix whose column j is year year_min + j. Rows with a missing
+    group value are left out of that column's groups only.
+    """
+    span = year_max - year_min + 1
+    year = df["year"].to_numpy(dtype=np.int64) - year_min
+
+    cells, columns, labels = [], [], []
+    offset = 0
+    for col in by:
+        codes, uniques = pd.factorize(df[col], sort=True)
+        ok = codes >= 0
+        cells.append((codes[ok] + offset) * span + year[ok])
+        columns += [col] * len(uniques)
+        labels += [str(u) for u in uniques]
+        offset += len(uniques)
+
+    flat = np.concatenate(cells) if cells else np.zeros(0, dtype=np.int64)
+    counts = np.bincount(flat, minlength=offset * span).reshape(offset, span)
+    keys = pd.DataFrame({"column": columns, "group": labels})
+    return keys, counts
+
+
+# ---------------------------------------------------------------------
+# Segmented fits
+# ---------------------------------------------------------------------
+@profiled("grouped.fit_group_trends")
+def fit_group_trends(keys, counts, year_min=YEAR_MIN, models=TREND_MODELS):
+    """
+    Fit every model of `models` (name → transform of the counts) on year
+    for every row of `counts`. Returns `keys` plus records, years, first,
+    last and, per model, {name}_slope / _intercept / _R2 / _SE_slope /
+    _log10_p; groups with no records are dropped.
+    """
+    present = counts.any(axis=1)
+    keys = keys[present].reset_index(drop=True)
+    counts = counts[present]
+
+    # nonzero cells in row-major order: group segments, years ascending
+    g, t = np.nonzero(counts)
+    c = counts[g, t].astype(float)
+    x = t.astype(float) + year_min
+    Y = np.column_stack([f(c) for f in models.values()])
+
+    n = np.bincount(g, minlength=len(counts)).astype(float)
+    starts = np.concatenate([[0], np.cumsum(n[:-1])]).astype(np.int64)
+
+    x_mean = np.add.reduceat(x, starts) / n
+    y_mean = np.add.reduceat(Y, starts, axis=0) / n[:, None]
+    xc = x - x_mean[g]
+    yc = Y - y_mean[g]
+    Sxx = np.add.reduceat(xc * xc, starts)
+    Sxy = np.add.reduceat(xc[:, None] * yc, starts, axis=0)
+    Syy = np.add.reduceat(yc * yc, starts, axis=0)
+    # a constant series (e.g. one record every year) is exactly flat,
+    # not a round-off slope
+    flat = np.maximum.reduceat(Y, starts, axis=0) == np.minimum.reduceat(Y, starts, axis=0)
+    Sxy = np.where(flat, 0.0, Sxy)
+    Syy = np.where(flat, 0.0, Syy)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fitted = (n >= 3)[:, None]
+        Sxx = Sxx[:, None]
+        slope = np.where(fitted, Sxy / Sxx, np.nan)
+        intercept = y_mean - slope * x_mean[:, None]
+        R2 = Sxy * Sxy / (Sxx * Syy)
+        rss = np.maximum(Syy - slope * Sxy, 0.0)
+        dof = (n - 2)[:, None]
+        SE_slope = np.sqrt(rss / dof / Sxx)
+        log10_p = log10_pvalue(slope / SE_slope, np.broadcast_to(dof, slope.shape))
+
+    out = keys.copy()
+    out["records"] = counts.sum(axis=1)
+    out["years"] = n.astype(np.int64)
+    out["first"] = x[starts].astype(np.int64)
+    out["last"] = x[starts + n.astype(np.int64) - 1].astype(np.int64)
+    stats = {"slope": slope, "intercept": intercept, "R2": R2,
+             "SE_slope": SE_slope, "log10_p": log10_p}
+    for j, name in enumerate(models):
+        for key in TREND_KEYS:
+            out[f"{name}_{key}"] = np.where(fitted[:, 0], stats[key][:, j], np.nan)
+    return out
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+hashing.py
+
+Content digests shared by the catalog cache and the pipeline runner.
+Standard library only, so importing it never pulls in pandas.
+"""
+
+import hashlib
+from pathlib import Path
+
+HASH_BLOCK = 1 << 20
+
+
+def file_digest(path):
+    """SHA-256 hex digest of a file, read in 1 MiB blocks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(HASH_BLOCK), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def tree_digest(folder, pattern="*.py"):
+    """Digest over the names and contents of every `pattern` file in `folder`."""
+    h = hashlib.sha256()
+    for path in sorted(Path(folder).glob(pattern)):
+        h.update(path.name.encode("utf-8"))
+        h.update(file_digest(path).encode("ascii"))
+    return h.hexdigest()
+
+
+def text_digest(*parts):
+    """Digest of a sequence of strings (order-sensitive)."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(str(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+lazy.py
+
+Deferred imports for the heavy libraries.
+
+matplotlib.pyplot and scipy.stats each add hundreds of
+milliseconds to start-up, and several scripts only need them on some
+paths (plots vs. HTML tables). A module-level
+
+    plt = lazy_import("matplotlib.pyplot")
+
+keeps the script reading like a normal import, but the library is only
+loaded the first time an attribute is used.
+"""
+
+import importlib
+
+
+class LazyModule:
+    """Stand-in for a module that imports it on first attribute access."""
+
+    def __init__(self, name):
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_module", None)
+
+    def _load(self):
+        module = object.__getattribute__(self, "_module")
+        if module is None:
+            module = importlib.import_module(object.__getattribute__(self, "_name"))
+            object.__setattr__(self, "_module", module)
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        name = object.__getattribute__(self, "_name")
+        loaded = object.__getattribute__(self, "_module") is not None
+        return f"<lazy module {name!r} ({'loaded' if loaded else 'not loaded'})>"
+
+
+def lazy_import(name):
+    return LazyModule(name)
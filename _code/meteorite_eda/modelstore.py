@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+modelstore.py
+
+Persisted sufficient statistics for the Phase IV year-trend models, so a
+fit is updated from the rows that changed instead of refitted from the
+whole Phase III CSV.
+
+OLSStats keeps, for one model y ~ x,
+
+    n, Σx, Σy, Σx², Σxy, Σy²
+
+around a fixed shift of x (the first year added, so the sums of squares
+stay well conditioned for calendar years), plus the (year → y) points
+it was built from. Adding, removing or revising a year is O(1):
+
+    stats.add(x, y)    stats.remove(x)    stats.upsert(x, y)
+
+and fit() rebuilds every diagnostic of the model comparison tables from
+the sums alone — slope, intercept, R², adjusted R², MSE, RMSE, SEs, CIs,
+t, F and the p-value. MAE is the one statistic that is not a function of
+the sums; it is recomputed from the stored points (one entry per year).
+
+ModelStore is the JSON file holding one OLSStats per model name.
+sync(name, x, y) compares the stored points with the current data and
+applies only the additions, removals and revisions, bumping the model's
+revision when anything changed:
+
+    store = ModelStore.load("0_EDA_phase_IV_model_store.json")
+    changes = store.sync("log", year, y_log)     # {"added": 0, "revised": 1, ...}
+    results = store["log"].fit(critical=1.96)
+    store.save()
+"""
+
+import json
+import math
+import os
+from pathlib import Path
+
+import numpy as np
+
+from meteorite_eda.lazy import lazy_import
+from meteorite_eda.regression import log10_pvalue
+
+stats = lazy_import("scipy.stats")
+
+STORE_VERSION = 1
+SUM_FIELDS = ["n", "sx", "sy", "sxx", "sxy", "syy"]
+
+
+def _key(x):
+    # years are stored as JSON object keys; integral years print as ints
+    x = float(x)
+    return str(int(x)) if x.is_integer() else repr(x)
+
+
+# ---------------------------------------------------------------------
+# One model
+# ---------------------------------------------------------------------
+class OLSStats:
+    """Sufficient statistics of a simple regression y ~ x."""
+
+    def __init__(self, shift=None, sums=None, points=None, revision=0):
+        self.shift = shift
+        sums = sums or {}
+        for field in SUM_FIELDS:
+            setattr(self, field, sums.get(field, 0 if field == "n" else 0.0))
+        self.points = points or {}
+        self.revision = revision
+
+    def _shifted(self, x):
+        if self.shift is None:
+            self.shift = float(x)
+        return float(x) - self.shift
+
+    def add(self, x, y):
+        if _key(x) in self.points:
+            raise ValueError(f"Year {x} is already in the model; use upsert().")
+        self._accumulate(self._shifted(x), float(y), +1)
+        self.points[_key(x)] = float(y)
+
+    def remove(self, x):
+        y = self.points.pop(_key(x))
+        self._accumulate(self._shifted(x), y, -1)
+
+    def upsert(self, x, y):
+        if _key(x) in self.points:
+            self.remove(x)
+        self.add(x, y)
+
+    def _accumulate(self, x, y, sign):
+        self.n += sign
+        self.sx += sign * x
+        self.sy += sign * y
+        self.sxx += sign * x * x
+        self.sxy += sign * x * y
+        self.syy += sign * y * y
+
+    # -----------------------------------------------------------------
+    # Diagnostics from the sums
+    # -----------------------------------------------------------------
+    def fit(self, level=0.95, critical=None):
+        """The model comparison statistics as a dict of scalars."""
+        n = self.n
+        x_mean = self.sx / n
+        y_mean = self.sy / n
+        Sxx = self.sxx - self.sx * x_mean
+        Sxy = self.sxy - self.sx * y_mean
+        TSS = self.syy - self.sy * y_mean
+
+        slope = Sxy / Sxx
+        intercept = y_mean - slope * x_mean - slope * self.shift
+        RSS = max(TSS - slope * Sxy, 0.0)
+
+        R2 = 1 - RSS / TSS
+        R2_adj = 1 - (1 - R2) * (n - 1) / (n - 2)
+        MSE = RSS / n
+        dof = n - 2
+        s2 = RSS / dof
+        SE_slope = math.sqrt(s2 / Sxx)
+        SE_intercept = math.sqrt(s2 * (1 / n + (x_mean + self.shift) ** 2 / Sxx))
+        t_slope = slope / SE_slope
+        if critical is None:
+            critical = float(stats.t.ppf(0.5 + level / 2, dof))
+        log10_p = float(log10_pvalue(t_slope, dof))
+
+        xs = np.array([float(k) for k in self.points])
+        ys = np.fromiter(self.points.values(), dtype=float, count=len(self.points))
+        MAE = float(np.abs(ys - (intercept + slope * xs)).mean())
+
+        return {
+            "n": n,
+            "intercept": intercept,
+            "slope": slope,
+            "R2": R2,
+            "R2_adj": R2_adj,
+            "MAE": MAE,
+            "MSE": MSE,
+            "RMSE": math.sqrt(MSE),
+            "SE_intercept": SE_intercept,
+            "SE_slope": SE_slope,
+            "ci_intercept_low": intercept - critical * SE_intercept,
+            "ci_intercept_high": intercept + critical * SE_intercept,
+            "ci_slope_low": slope - critical * SE_slope,
+            "ci_slope_high": slope + critical * SE_slope,
+            "t_slope": t_slope,
+            "F": (R2 / (1 - R2)) * dof,
+            "df": dof,
+            "p_value": 10.0 ** log10_p,
+            "log10_p": log10_p,
+            "revision": self.revision,
+        }
+
+    def to_dict(self):
+        return {
+            "shift": self.shift,
+            "sums": {field: getattr(self, field) for field in SUM_FIELDS},
+            "points": self.points,
+            "revision": self.revision,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["shift"], data["sums"], data["points"], data["revision"])
+
+
+# ---------------------------------------------------------------------
+# The persisted store
+# ---------------------------------------------------------------------
+class ModelStore:
+    """JSON file of OLSStats by model name."""
+
+    def __init__(self, path, models=None):
+        self.path = Path(path)
+        self.models = models or {}
+
+    def __getitem__(self, name):
+        return self.models[name]
+
+    def __contains__(self, name):
+        return name in self.models
+
+    @classmethod
+    def load(cls, path):
+        """The store at `path`, or an empty one when there is none yet."""
+        path = Path(path)
+        if not path.is_file():
+            return cls(path)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != STORE_VERSION:
+            return cls(path)
+        return cls(path, {name: OLSStats.from_dict(m) for name, m in data["models"].items()})
+
+    def save(self):
+        payload = {
+            "version": STORE_VERSION,
+            "models": {name: m.to_dict() for name, m in self.models.items()},
+        }
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def sync(self, name, x, y):
+        """
+        Bring model `name` up to date with the data (x, y), one row per
+        year, touching only the years that were added, revised or removed.
+        Returns the number of each.
+        """
+        current = {}
+        for xi, yi in zip(np.asarray(x, dtype=float), np.asarray(y, dtype=float)):
+            key = _key(xi)
+            if key in current:
+                raise ValueError(f"Model {name!r}: year {key} appears twice.")
+            current[key] = float(yi)
+
+        model = self.models.setdefault(name, OLSStats())
+        changes = {"added": 0, "revised": 0, "removed": 0}
+        for key in [k for k in model.points if k not in current]:
+            model.remove(float(key))
+            changes["removed"] += 1
+        for key, yi in current.items():
+            old = model.points.get(key)
+            if old is None:
+                model.add(float(key), yi)
+                changes["added"] += 1
+            elif old != yi:
+                model.upsert(float(key), yi)
+                changes["revised"] += 1
+        if any(changes.values()):
+            model.revision += 1
+        return changes
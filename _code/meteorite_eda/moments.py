@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+moments.py
+
+One-pass, mergeable summary statistics for the outlier and topology
+tables: count, min, max, mean and the central moment sums
+
+    M2 = Σ(x − mean)²,  M3 = Σ(x − mean)³,  M4 = Σ(x − mean)⁴
+
+from which the variance, standard deviation, skewness and kurtosis
+follow. Each chunk is summarized around its own mean, and chunks are
+combined with the pairwise update formulas of Pébay (2008), so no
+Σx² − n·mean² cancellation ever occurs and the result does not depend on
+how the data was split.
+
+    m = Moments.of(counts)                  # one array
+    m = Moments(); m.update(a); m.update(b) # chunk by chunk
+    m = part_1.merge(part_2)                # partial results from workers
+
+Given a 2-D array the statistics are computed per column (NaNs ignored),
+so one call covers every numeric column of a table.
+
+summarize_csv() runs accumulators over a CSV of any size: the file is cut
+into record-aligned byte ranges (parallel_csv.py), each range is reduced
+on its own — in a process pool with workers > 1 — and the partial results
+are merged in file order.
+
+The definitions match what the scripts used before: population variance
+(np.std, ddof=0), biased skewness (scipy.stats.skew) and Fisher kurtosis
+(scipy.stats.kurtosis).
+"""
+
+import io
+import math
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from meteorite_eda.parallel_csv import record_boundaries
+from meteorite_eda.profiling import profiled
+
+RANGE_BYTES = 64 << 20
+
+
+# ---------------------------------------------------------------------
+# Moment accumulator
+# ---------------------------------------------------------------------
+class Moments:
+    """Count, min, max, mean and M2–M4 of a stream of values (per column)."""
+
+    def __init__(self, shape=()):
+        self.n = np.zeros(shape, dtype=np.int64)
+        self.mean = np.zeros(shape)
+        self.m2 = np.zeros(shape)
+        self.m3 = np.zeros(shape)
+        self.m4 = np.zeros(shape)
+        self.min = None
+        self.max = None
+
+    @classmethod
+    def of(cls, values):
+        m = cls()
+        m.update(values)
+        return m
+
+    def update(self, values):
+        """Fold one chunk in (1-D: one series, 2-D: rows × columns)."""
+        return self.merge(_chunk_moments(np.asarray(values)))
+
+    def merge(self, other):
+        """Combine with another accumulator in place; returns self."""
+        if other.min is None:
+            return self
+        if self.min is None:
+            self.__dict__.update({k: np.copy(v) if isinstance(v, np.ndarray) else v
+                                  for k, v in other.__dict__.items()})
+            return self
+
+        na, nb = self.n.astype(float), other.n.astype(float)
+        n = na + nb
+        n_safe = np.maximum(n, 1.0)
+        delta = other.mean - self.mean
+        delta_n = delta / n_safe
+        ab = na * nb
+
+        mean = self.mean + delta_n * nb
+        m2 = self.m2 + other.m2 + delta * delta_n * ab
+        m3 = (self.m3 + other.m3
+              + delta * delta_n ** 2 * ab * (na - nb)
+              + 3.0 * delta_n * (na * other.m2 - nb * self.m2))
+        m4 = (self.m4 + other.m4
+              + delta * delta_n ** 3 * ab * (na * na - ab + nb * nb)
+              + 6.0 * delta_n ** 2 * (na * na * other.m2 + nb * nb * self.m2)
+              + 4.0 * delta_n * (na * other.m3 - nb * self.m3))
+
+        self.n = self.n + other.n
+        self.mean, self.m2, self.m3, self.m4 = mean, m2, m3, m4
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        return self
+
+    # -----------------------------------------------------------------
+    # Derived statistics (population / biased, like np.std and scipy)
+    # -----------------------------------------------------------------
+    def _per_n(self, total):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.n > 0, total / np.maximum(self.n, 1), np.nan)[()]
+
+    @property
+    def variance(self):
+        return self._per_n(self.m2)
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+    def _degenerate(self):
+        # scipy returns NaN for (numerically) constant data
+        var = self.variance
+        return ~(var > (np.finfo(float).eps * self.mean) ** 2)
+
+    @property
+    def skew(self):
+        var = self.variance
+        with np.errstate(invalid="ignore", divide="ignore"):
+            g1 = self._per_n(self.m3) / var ** 1.5
+        return np.where(self._degenerate(), np.nan, g1)[()]
+
+    @property
+    def kurtosis(self):
+        """Fisher (excess) kurtosis."""
+        var = self.variance
+        with np.errstate(invalid="ignore", divide="ignore"):
+            g2 = self._per_n(self.m4) / var ** 2 - 3.0
+        return np.where(self._degenerate(), np.nan, g2)[()]
+
+
+def _chunk_moments(x):
+    """Moments of one in-memory chunk, centered on the chunk's own mean."""
+    m = Moments(x.shape[1:])
+    if x.shape[0] == 0:
+        return m
+
+    if x.dtype.kind == "f":
+        valid = ~np.isnan(x)
+        n = valid.sum(axis=0)
+        if not n.any():
+            return m
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(n > 0, np.where(valid, x, 0.0).sum(axis=0) / np.maximum(n, 1), 0.0)
+        d = np.where(valid, x - mean, 0.0)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)   # all-NaN columns
+            m.min, m.max = np.nanmin(x, axis=0), np.nanmax(x, axis=0)
+    else:
+        n = np.full(x.shape[1:], x.shape[0], dtype=np.int64)
+        mean = x.mean(axis=0)
+        d = x - mean
+        m.min, m.max = x.min(axis=0), x.max(axis=0)
+
+    d2 = d * d
+    m.n = np.asarray(n, dtype=np.int64)
+    m.mean = np.asarray(mean, dtype=float)
+    m.m2 = d2.sum(axis=0)
+    m.m3 = (d2 * d).sum(axis=0)
+    m.m4 = (d2 * d2).sum(axis=0)
+    return m
+
+
+# ---------------------------------------------------------------------
+# Out-of-core reduction over a CSV
+# ---------------------------------------------------------------------
+def _summarize_range(task):
+    path, header_end, start, end, columns, factories = task
+    with open(path, "rb") as fh:
+        header = fh.read(header_end)
+        fh.seek(start)
+        body = fh.read(end - start)
+    df = pd.read_csv(io.BytesIO(header + body), usecols=columns)
+    out = {}
+    for col in columns:
+        values = df[col]
+        if not pd.api.types.is_numeric_dtype(values):
+            values = pd.to_numeric(values, errors="coerce")
+        values = values.to_numpy(dtype=float, na_value=np.nan) if values.hasnans \
+            else values.to_numpy()
+        accs = []
+        for factory in factories:
+            acc = factory()
+            acc.update(values)
+            accs.append(acc)
+        out[col] = accs
+    return len(df), out
+
+
+@profiled("moments.summarize_csv")
+def summarize_csv(path, columns, factories=(Moments,), workers=1, range_bytes=RANGE_BYTES):
+    """
+    (rows, {column: [accumulator per factory]}) over the whole CSV at
+    `path`; rows counts every record, missing values included.
+
+    Every factory must build an object with update(values) and
+    merge(other). At most `range_bytes` of the file is parsed at a time
+    per worker.
+    """
+    size = os.path.getsize(path)
+    parts = max(workers, math.ceil(size / range_bytes))
+    bounds = record_boundaries(path, parts)
+    tasks = [(str(path), bounds[0], start, end, list(columns), tuple(factories))
+             for start, end in zip(bounds[:-1], bounds[1:]) if end > start]
+
+    merged = {col: [factory() for factory in factories] for col in columns}
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = _fold(merged, pool.map(_summarize_range, tasks))
+    else:
+        rows = _fold(merged, map(_summarize_range, tasks))
+    return rows, merged
+
+
+def _fold(merged, partials):
+    """Merge per-range results into `merged` in file order; returns rows."""
+    rows = 0
+    for part_rows, part in partials:
+        rows += part_rows
+        for col, accs in part.items():
+            for total, acc in zip(merged[col], accs):
+                total.merge(acc)
+    return rows
+
+
+def stream_moments(path, columns, workers=1, range_bytes=RANGE_BYTES):
+    """{column: Moments} for a CSV of any size."""
+    _, summary = summarize_csv(path, columns, (Moments,), workers, range_bytes)
+    return {col: accs[0] for col, accs in summary.items()}
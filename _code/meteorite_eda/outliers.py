@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+outliers.py
+
+Batched IQR outlier statistics for many numeric columns at once.
+
+The columns are stacked into a column-major 2-D float array (missing
+values become NaN) and every statistic is computed for every column with
+a handful of vectorized calls:
+
+    - count / min / max / mean / std   Moments over the 2-D block (NaN-masked)
+    - 25th / 50th / 75th percentiles   one np.sort(axis=0) — NaNs sort last —
+                                       then per-column linear interpolation
+                                       at q·(n − 1), exactly as np.percentile
+    - IQR fences, % within, outliers   broadcast comparisons against the
+                                       per-column fences
+
+Wide tables (thousands of derived feature columns) are processed in
+blocks of columns sized to BLOCK_BYTES, so memory stays bounded by the
+block, not by the table.
+
+    stats = outlier_stats(df, numeric_cols)
+    stats.loc["count_log", "q75"]
+"""
+
+import numpy as np
+import pandas as pd
+
+from meteorite_eda.moments import Moments
+
+BLOCK_BYTES = 256 << 20
+FENCE = 1.5
+PERCENTS = (25, 50, 75)
+STAT_COLUMNS = ["n", "min", "max", "mean", "std", "q25", "q50", "q75",
+                "lower", "upper", "within", "outliers"]
+
+
+def _lerp(a, b, t):
+    # np.percentile's interpolation, including its t >= 0.5 branch
+    diff = b - a
+    out = a + diff * t
+    return np.where(t >= 0.5, b - diff * (1 - t), out)
+
+
+def sorted_percentiles(sorted_block, n, percents=PERCENTS):
+    """
+    Percentiles (rows = percents) of each column of `sorted_block`, whose
+    first n[j] entries of column j are its valid values in ascending order.
+    """
+    n = np.asarray(n)
+    q = np.asarray(percents, dtype=float)[:, None] / 100
+    if sorted_block.shape[0] == 0:
+        return np.full((len(q), sorted_block.shape[1]), np.nan)
+    pos = q * np.maximum(n - 1, 0)
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.minimum(lo + 1, np.maximum(n - 1, 0))
+    a = np.take_along_axis(sorted_block, lo, axis=0)
+    b = np.take_along_axis(sorted_block, hi, axis=0)
+    return np.where(n > 0, _lerp(a, b, pos - lo), np.nan)
+
+
+def _block_stats(x, fence):
+    m = Moments.of(x)
+    q25, q50, q75 = sorted_percentiles(np.sort(x, axis=0), m.n)
+    iqr = q75 - q25
+    lower, upper = q25 - fence * iqr, q75 + fence * iqr
+    # NaN compares False, so missing values are never "within"
+    within = ((x >= lower) & (x <= upper)).sum(axis=0)
+    return [m.n, m.min, m.max, m.mean, m.std, q25, q50, q75,
+            lower, upper, within, m.n - within]
+
+
+def outlier_stats(df, columns=None, fence=FENCE, block_bytes=BLOCK_BYTES):
+    """
+    DataFrame indexed by column name with STAT_COLUMNS for every column of
+    `df` in `columns` (default: all numeric columns).
+    """
+    if columns is None:
+        columns = df.select_dtypes(include=[np.number]).columns.tolist()
+    columns = list(columns)
+    per_block = max(1, block_bytes // max(8 * len(df), 1))
+
+    parts = []
+    for start in range(0, len(columns), per_block):
+        block_cols = columns[start:start + per_block]
+        x = np.asfortranarray(
+            df[block_cols].to_numpy(dtype=float, na_value=np.nan))
+        stats = _block_stats(x, fence)
+        parts.append(pd.DataFrame(dict(zip(STAT_COLUMNS, stats)), index=block_cols))
+
+    if not parts:
+        return pd.DataFrame(columns=STAT_COLUMNS)
+    return pd.concat(parts)
+
+
+def as_column_dtype(value, dtype):
+    """`value` as a scalar of the column's own dtype (ints print as ints)."""
+    if pd.api.types.is_integer_dtype(dtype) and not np.isnan(value):
+        return np.dtype(getattr(dtype, "numpy_dtype", dtype)).type(value)
+    return value
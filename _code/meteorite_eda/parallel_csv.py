@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+parallel_csv.py
+
+Multi-core CSV ingestion for the raw meteorite catalog.
+
+The file is cut into byte ranges that start on record boundaries. A plain
+newline split is not safe because quoted fields (GeoLocation is written as
+"(50.775, 6.08333)") may hold commas or even newlines, so a candidate cut
+is only accepted after a newline where the running count of '"' bytes is
+even. Escaped quotes ("") add two to the count and keep the parity intact.
+
+Each range is parsed with `pd.read_csv` in a process pool (header bytes
+prepended to every range) and the pieces are concatenated. Columns whose inferred dtype
+differs between pieces are reconciled so the result equals what a single
+`pd.read_csv(path)` returns.
+
+Every range is at least MIN_RANGE_BYTES (4 MiB), so a file gets at most
+size / 4 MiB workers. Anything smaller — including the 3.6 MB
+Meteorite_Landings.csv itself — is read with one plain `pd.read_csv`,
+whatever `workers` says; the pool only pays off on larger catalogs.
+"""
+
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from meteorite_eda.predicates import apply_predicates
+
+SCAN_BLOCK = 16 << 20
+MIN_RANGE_BYTES = 4 << 20
+
+
+# ---------------------------------------------------------------------
+# Quote-aware record boundaries
+# ---------------------------------------------------------------------
+def _count_quotes(mm, start, end):
+    total = 0
+    for pos in range(start, end, SCAN_BLOCK):
+        total += mm[pos:min(pos + SCAN_BLOCK, end)].count(b'"')
+    return total
+
+
+def _next_record_start(mm, pos, parity, size):
+    """
+    First offset >= pos that begins a record, given the quote parity at
+    `pos`. Returns (offset, parity at offset).
+    """
+    while pos < size:
+        nl = mm.find(b"\n", pos)
+        if nl == -1:
+            return size, parity
+        parity = (parity + _count_quotes(mm, pos, nl)) & 1
+        if parity == 0:
+            return nl + 1, parity
+        pos = nl + 1
+    return size, parity
+
+
+def record_boundaries(path, parts):
+    """
+    Byte offsets [data_start, b1, ..., size] that split `path` into at most
+    `parts` ranges of whole records. data_start is the end of the header.
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return [0, 0]
+
+    with open(path, "rb") as fh, \
+            mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data_start, parity = _next_record_start(mm, 0, 0, size)
+        bounds = [data_start]
+        step = max((size - data_start) // max(parts, 1), 1)
+
+        pos, pos_parity = data_start, parity
+        for i in range(1, parts):
+            target = data_start + i * step
+            if target <= bounds[-1]:
+                continue
+            pos_parity = (pos_parity + _count_quotes(mm, pos, target)) & 1
+            cut, pos_parity = _next_record_start(mm, target, pos_parity, size)
+            pos = cut
+            if cut >= size:
+                break
+            bounds.append(cut)
+
+    bounds.append(size)
+    return bounds
+
+
+# ---------------------------------------------------------------------
+# Range parsing
+# ---------------------------------------------------------------------
+def _parse_range(task):
+    path, header_end, start, end, read_kwargs, where, columns = task
+    with open(path, "rb") as fh:
+        header = fh.read(header_end)
+        fh.seek(start)
+        body = fh.read(end - start)
+    df = pd.read_csv(io.BytesIO(header + body), **read_kwargs)
+    if where or columns is not None:
+        df = apply_predicates(df, where, columns)
+    return df
+
+
+# ---------------------------------------------------------------------
+# Combining pieces parsed independently (ranges or chunks)
+# ---------------------------------------------------------------------
+def _is_text(dtype):
+    return dtype == object or pd.api.types.is_string_dtype(dtype)
+
+
+def conflicting_text_columns(pieces):
+    """
+    Columns that are text in one piece but not in another. A full-file
+    parse would make them text throughout, so they must be re-read as str.
+    """
+    cols = []
+    for col in pieces[0].columns:
+        dtypes = {str(piece[col].dtype) for piece in pieces}
+        if len(dtypes) > 1 and any(_is_text(piece[col].dtype) for piece in pieces):
+            cols.append(col)
+    return cols
+
+
+def with_text_columns(read_kwargs, cols):
+    """Copy of `read_kwargs` that forces `cols` to parse as str."""
+    dtype = read_kwargs.get("dtype")
+    dtype = dict(dtype) if isinstance(dtype, dict) else {}
+    dtype.update({col: str for col in cols})
+    return dict(read_kwargs, dtype=dtype)
+
+
+def defer_categoricals(read_kwargs):
+    """
+    Categories differ from piece to piece, so categorical columns are
+    parsed as text and converted once after the concat. Returns the
+    adjusted kwargs and the deferred column names.
+    """
+    dtype = read_kwargs.get("dtype")
+    if not isinstance(dtype, dict):
+        return read_kwargs, []
+    categorical = [col for col, dt in dtype.items() if str(dt) == "category"]
+    if not categorical:
+        return read_kwargs, []
+    dtype = {col: (str if col in categorical else dt) for col, dt in dtype.items()}
+    return dict(read_kwargs, dtype=dtype), categorical
+
+
+def restore_categoricals(df, categorical):
+    for col in categorical:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+# ---------------------------------------------------------------------
+# Public reader
+# ---------------------------------------------------------------------
+def read_csv_parallel(path, workers=None, where=None, columns=None,
+                      **read_kwargs):
+    """
+    Parse `path` across `workers` processes (default: all cores).
+
+    `where` / `columns` (see predicates.py) are applied inside each worker
+    so rejected rows are never shipped back. Other keyword arguments are
+    forwarded to every `pd.read_csv` call; anything that changes row
+    positions (skiprows, nrows, header, chunksize) is not supported.
+    """
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    parts = min(workers, max(size // MIN_RANGE_BYTES, 1))
+    if parts <= 1:
+        df = pd.read_csv(path, **read_kwargs)
+        if where or columns is not None:
+            df = apply_predicates(df, where, columns)
+        return df
+
+    read_kwargs, categorical = defer_categoricals(read_kwargs)
+    bounds = record_boundaries(path, parts)
+    tasks = [(str(path), bounds[0], bounds[i], bounds[i + 1], read_kwargs, where, columns)
+             for i in range(len(bounds) - 1)]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        pieces = list(pool.map(_parse_range, tasks))
+
+        text_cols = conflicting_text_columns(pieces)
+        if text_cols:
+            kwargs = with_text_columns(read_kwargs, text_cols)
+            tasks = [task[:4] + (kwargs,) + task[5:] for task in tasks]
+            pieces = list(pool.map(_parse_range, tasks))
+
+    df = pd.concat(pieces, ignore_index=True)
+    return restore_categoricals(df, categorical)
@@ -0,0 +1,506 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+pipeline.py
+
+The Phase I → IV workflow as a dependency graph of stages:
+
+    Meteorite_Landings.csv
+        → Phase I reports
+        → Phase II df_maker → Meteorite_Landings_Phase_II.csv → Phase II reports
+        → Phase III data_transform → Meteorite_Landings_Phase_III.csv
+              → Phase III reports
+              → Phase IV tables and plots
+
+A stage is either one of the existing scripts (run unchanged, from its own
+folder) or a copy of an intermediate CSV into the next phase's folder —
+the step that used to be done by hand.
+
+Every successful run records, per stage, a fingerprint of its script, the
+meteorite_eda modules it imports (directly or through other modules, found
+by an ast scan), and its input contents, plus the digests of the outputs it
+wrote. A stage is re-executed only when that fingerprint changes or an
+output is missing/modified, so editing a Phase IV plot script — or a module
+only Phase IV imports, such as rolling.py — does not re-trigger Phase I–III
+work.
+
+Independent stages (e.g. the five Phase I reports once the raw CSV is in
+place) run concurrently with `workers > 1`; each writes into a staging
+folder and its files are moved into place atomically on success.
+
+With `in_process=True` the script stages run one after another inside the
+current interpreter, sharing one ReportSession (see session.py), so each
+dataset is parsed once and the heavy imports happen once for the run.
+
+All paths are relative to the `_code/` folder.
+"""
+
+import ast
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+
+from meteorite_eda.hashing import file_digest, text_digest
+from meteorite_eda.profiling import step
+from meteorite_eda.session import ReportSession
+
+CODE_ROOT = Path(__file__).resolve().parents[1]
+PACKAGE = "meteorite_eda"
+STATE_FILE = ".pipeline_state.json"
+STAGING_PREFIX = ".stage-"
+
+P1 = "0_EDA_Phase_I"
+P2 = "0_EDA_Phase_II"
+P3 = "0_EDA_Phase_III"
+P4 = "0_EDA_Phase_IV"
+P4L = "0_EDA_Phase_IV/large_labels"
+
+RAW = "Meteorite_Landings.csv"
+PHASE_II_CSV = "Meteorite_Landings_Phase_II.csv"
+PHASE_III_CSV = "Meteorite_Landings_Phase_III.csv"
+
+
+# ---------------------------------------------------------------------
+# Stage definitions
+# ---------------------------------------------------------------------
+@dataclass
+class Stage:
+    name: str
+    inputs: list
+    outputs: list
+    script: str = None          # None → copy inputs[0] to outputs[0]
+    deps: list = field(default_factory=list)
+    state: list = field(default_factory=list)   # outputs the script reads back
+
+    @property
+    def cwd(self):
+        return str(Path(self.script).parent) if self.script else "."
+
+
+def _copy(name, src, dst):
+    return Stage(name, inputs=[src], outputs=[dst])
+
+
+def _script(name, folder, script, inputs, outputs, state=()):
+    return Stage(
+        name,
+        inputs=[f"{folder}/{p}" for p in inputs],
+        outputs=[f"{folder}/{p}" for p in [*outputs, *state]],
+        script=f"{folder}/{script}",
+        state=[f"{folder}/{p}" for p in state],
+    )
+
+
+STAGES = [
+    # ---- Phase I ----------------------------------------------------
+    _copy("phase_i.raw", RAW, f"{P1}/{RAW}"),
+    _script("phase_i.master_table", P1, "0_EDA_phase_I_Master_Table.py",
+            [RAW], ["master_table.html"]),
+    _script("phase_i.outlier_table", P1, "0_EDA_phase_I_outLier_Table.py",
+            [RAW], ["0_EDA_phase_I_outlier_table.html"]),
+    _script("phase_i.histogram", P1, "0_EDA_phase_I_Histogram.py",
+            [RAW], ["0_EDA_phase_I_histogram_standard.png",
+                    "0_EDA_phase_I_histogram_logscale.png"]),
+    _script("phase_i.boxplot", P1, "0_EDA_phase_I_BoxPlot.py",
+            [RAW], ["0_EDA_phase_I_boxplot_fall_counts.png"]),
+    _script("phase_i.qqplot", P1, "0_EDA_phase_I_QQplot.py",
+            [RAW], ["0_EDA_phase_I_qqplot_fall_counts.png"]),
+
+    # ---- Phase II ---------------------------------------------------
+    _copy("phase_ii.raw", RAW, f"{P2}/{RAW}"),
+    _script("phase_ii.df_maker", P2, "0_EDA_phase_II_df_maker.py",
+            [RAW], [PHASE_II_CSV]),
+    _script("phase_ii.master_table", P2, "0_EDA_phase_II_Master_Table.py",
+            [PHASE_II_CSV], ["0_EDA_phase_II_Master_Table.html"]),
+    _script("phase_ii.outlier_table", P2, "0_EDA_phase_II_OutlierTable.py",
+            [PHASE_II_CSV], ["0_EDA_phase_II_OutlierTable.html"]),
+    _script("phase_ii.histogram", P2, "0_EDA_phase_II_Histogram.py",
+            [PHASE_II_CSV], ["0_EDA_phase_II_histogram_standard.png",
+                             "0_EDA_phase_II_histogram_logscale.png"]),
+    _script("phase_ii.boxplot", P2, "0_EDA_phase_II_BoxPlot.py",
+            [PHASE_II_CSV], ["0_EDA_phase_II_boxplot.png"]),
+    _script("phase_ii.qqplot", P2, "0_EDA_phase_II_QQplot.py",
+            [PHASE_II_CSV], ["0_EDA_phase_II_QQplot.png"]),
+
+    # ---- Phase III --------------------------------------------------
+    _copy("phase_iii.phase_ii_csv", f"{P2}/{PHASE_II_CSV}", f"{P3}/{PHASE_II_CSV}"),
+    _script("phase_iii.data_transform", P3, "0_EDA_phase_III_data_transform.py",
+            [PHASE_II_CSV], [PHASE_III_CSV]),
+    _script("phase_iii.topology", P3, "0_EDA_phase_III_Data_Topology_check.py",
+            [PHASE_II_CSV], ["0_EDA_Data_Topology_Table.html"]),
+    _script("phase_iii.master_table", P3, "0_EDA_phase_III_master_table.py",
+            [PHASE_III_CSV], ["0_EDA_phase_III_master_table.html"]),
+    _script("phase_iii.outlier_table", P3, "0_EDA_phase_III_OutlierTable.py",
+            [PHASE_III_CSV], ["0_EDA_phase_III_OutlierTable.html"]),
+    _script("phase_iii.boxplot", P3, "0_EDA_phase_III_Box_plot.py",
+            [PHASE_III_CSV], ["boxplot_count_log.png", "boxplot_count_sqrt.png"]),
+    _script("phase_iii.qqplot", P3, "0_EDA_phase_III_QQ_plot.py",
+            [PHASE_III_CSV], ["qqplot_count_log.png", "qqplot_count_sqrt.png"]),
+    _script("phase_iii.histogram", P3, "0_EDA_phase_III_Histogram_plot.py",
+            [PHASE_III_CSV], [f"{name}_{rule}.png"
+                              for name in ("count_log", "count_sqrt")
+                              for rule in ("FD", "Scott", "Sturges", "BIN1")]),
+
+    # ---- Phase IV ---------------------------------------------------
+    _copy("phase_iv.phase_iii_csv", f"{P3}/{PHASE_III_CSV}", f"{P4}/{PHASE_III_CSV}"),
+    _script("phase_iv.analysis", P4, "0_EDA_phase_IV_analysis.py",
+            [PHASE_III_CSV], ["0_EDA_phase_IV_analysis.html"]),
+    _script("phase_iv.compare_contrast", P4, "0_EDA_phase_IV_compare_contrast_test.py",
+            [PHASE_III_CSV], ["0_EDA_phase_IV_model_comparison.html",
+                              "scatter_log.png", "scatter_sqrt.png"],
+            state=["0_EDA_phase_IV_model_store.json"]),
+    _script("phase_iv.rolling_trend", P4, "0_EDA_phase_IV_rolling_trend.py",
+            [PHASE_III_CSV], ["rolling_trend_log.png", "rolling_trend_sqrt.png"]),
+    _copy("phase_iv.raw", RAW, f"{P4}/{RAW}"),
+    _script("phase_iv.grouped_trends", P4, "0_EDA_phase_IV_grouped_trends.py",
+            [RAW], ["0_EDA_phase_IV_grouped_trends.html"]),
+    _script("phase_iv.presentation_table", P4, "0_EDA_phase_IV_presentation_table.py",
+            [PHASE_III_CSV], ["0_EDA_phase_IV_presentation_table.html"]),
+    _copy("phase_iv.large_labels_csv", f"{P3}/{PHASE_III_CSV}", f"{P4L}/{PHASE_III_CSV}"),
+    _script("phase_iv.log_model_graphs", P4L, "0_EDA_phase_IV_only_log_model_graphs.py",
+            [PHASE_III_CSV], ["log_scatter.png", "log_residuals.png", "log_qqplot.png"]),
+]
+
+
+# ---------------------------------------------------------------------
+# Graph helpers
+# ---------------------------------------------------------------------
+def resolve_dependencies(stages):
+    """Fill `deps` from which stage produces each input; returns stages
+    in a valid execution order (definition order, dependencies first)."""
+    producer = {}
+    for stage in stages:
+        for out in stage.outputs:
+            if out in producer:
+                raise ValueError(f"{out} is produced by both {producer[out]} and {stage.name}")
+            producer[out] = stage.name
+
+    for stage in stages:
+        stage.deps = sorted({producer[i] for i in stage.inputs if i in producer})
+
+    by_name = {s.name: s for s in stages}
+    ordered, done, active = [], set(), set()
+
+    def visit(name):
+        if name in done:
+            return
+        if name in active:
+            raise ValueError(f"Dependency cycle through {name}")
+        active.add(name)
+        for dep in by_name[name].deps:
+            visit(dep)
+        active.discard(name)
+        done.add(name)
+        ordered.append(by_name[name])
+
+    for stage in stages:
+        visit(stage.name)
+    return ordered
+
+
+def matches(name, pattern):
+    """`phase_ii` matches phase_ii.*; full names and fnmatch globs also work."""
+    return name == pattern or name.startswith(pattern + ".") or fnmatch(name, pattern)
+
+
+def select(stages, patterns):
+    """Stages matching any pattern, plus everything upstream of them."""
+    if not patterns:
+        return list(stages)
+    by_name = {s.name: s for s in stages}
+    wanted = set()
+
+    def add(name):
+        if name not in wanted:
+            wanted.add(name)
+            for dep in by_name[name].deps:
+                add(dep)
+
+    for stage in stages:
+        if any(matches(stage.name, p) for p in patterns):
+            add(stage.name)
+    return [s for s in stages if s.name in wanted]
+
+
+# ---------------------------------------------------------------------
+# Fingerprints + state
+# ---------------------------------------------------------------------
+def load_state(root=CODE_ROOT):
+    path = Path(root) / STATE_FILE
+    if path.exists():
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except ValueError:
+            pass
+    return {}
+
+
+def save_state(state, root=CODE_ROOT):
+    path = Path(root) / STATE_FILE
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(state, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def imported_modules(path):
+    """
+    Names of the meteorite_eda submodules a file imports anywhere in its
+    body: `from meteorite_eda.X import ...`, `import meteorite_eda.X` and
+    `from meteorite_eda import X`.
+    """
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            dotted = [alias.name.split(".") for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            dotted = [node.module.split(".") + [alias.name] for alias in node.names]
+        else:
+            continue
+        names.update(parts[1] for parts in dotted if parts[0] == PACKAGE and len(parts) > 1)
+    return names
+
+
+def library_digest(script, root=CODE_ROOT, imports=None):
+    """
+    Digest of the meteorite_eda modules `script` imports, followed through
+    their own imports (plus the package __init__.py). `imports` caches
+    imported_modules() per module across calls.
+    """
+    package = Path(root) / PACKAGE
+    imports = {} if imports is None else imports
+    seen, todo = set(), sorted(imported_modules(script))
+    while todo:
+        name = todo.pop()
+        path = package / f"{name}.py"
+        # `from meteorite_eda import X` may name something that is not a module
+        if name in seen or not path.is_file():
+            continue
+        seen.add(name)
+        if name not in imports:
+            imports[name] = imported_modules(path)
+        todo.extend(imports[name])
+    if not seen:
+        return "-"
+    files = ["__init__.py"] + sorted(f"{name}.py" for name in seen)
+    return text_digest(*(f"{f}:{file_digest(package / f)}" for f in files))
+
+
+def fingerprint(stage, root=CODE_ROOT, lib_digest=None):
+    """
+    Digest of everything that determines a stage's outputs. `lib_digest`
+    is the stage script's library_digest(), if already computed.
+    """
+    root = Path(root)
+    parts = [stage.name]
+    if stage.script:
+        parts.append(file_digest(root / stage.script))
+        parts.append(lib_digest or library_digest(root / stage.script, root))
+    for path in stage.inputs:
+        parts.append(path)
+        parts.append(file_digest(root / path))
+    return text_digest(*parts)
+
+
+def output_digests(stage, root=CODE_ROOT):
+    root = Path(root)
+    return {out: file_digest(root / out) for out in stage.outputs}
+
+
+def is_fresh(stage, record, current, root=CODE_ROOT):
+    """True if `record` matches the current fingerprint and outputs."""
+    if not record or record.get("fingerprint") != current:
+        return False
+    root = Path(root)
+    for out, digest in record.get("outputs", {}).items():
+        target = root / out
+        if not target.exists() or file_digest(target) != digest:
+            return False
+    return set(record.get("outputs", {})) == set(stage.outputs)
+
+
+# ---------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------
+def _link_or_copy(src, dst):
+    try:
+        os.symlink(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def execute(stage, root=CODE_ROOT, session=None):
+    """
+    Run one stage; raises on failure. With a `session` the script runs in
+    this process (session.run_script) instead of a child interpreter.
+
+    Scripts run inside a private staging folder next to their phase folder
+    (inputs are symlinked in, `state` files copied in), and every file (and
+    folder) they write is moved into place with os.replace only after the
+    script exits cleanly. A failed or interrupted stage therefore never
+    leaves a half-written artifact or a half-updated state file, and
+    concurrent stages in the same folder cannot see each other's partial
+    output.
+    """
+    root = Path(root)
+    if stage.script is None:
+        src, dst = root / stage.inputs[0], root / stage.outputs[0]
+        tmp = dst.with_name(f".{dst.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+        return ""
+
+    folder = root / stage.cwd
+    staging = folder / f"{STAGING_PREFIX}{stage.name}"
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir()
+    try:
+        linked = set()
+        for path in stage.inputs:
+            name = Path(path).name
+            _link_or_copy((root / path).resolve(), staging / name)
+            linked.add(name)
+        # a private copy the script may rewrite; moved back with the outputs
+        for path in stage.state:
+            if (root / path).is_file():
+                shutil.copyfile(root / path, staging / Path(path).name)
+
+        if session is not None:
+            try:
+                stdout = session.run_script(root / stage.script, cwd=staging)
+            except Exception as exc:
+                raise RuntimeError(f"{stage.name} failed: {exc}") from exc
+        else:
+            proc = subprocess.run(
+                [sys.executable, str((root / stage.script).resolve())],
+                cwd=staging,
+                capture_output=True,
+                text=True,
+            )
+            if proc.returncode != 0:
+                raise RuntimeError(f"{stage.name} failed (exit {proc.returncode}):\n{proc.stderr}")
+            stdout = proc.stdout
+
+        produced = {p.name for p in staging.iterdir() if p.is_file() and p.name not in linked}
+        missing = [out for out in stage.outputs if Path(out).name not in produced]
+        if missing:
+            raise RuntimeError(f"{stage.name} did not write: {', '.join(missing)}")
+
+        for name in sorted(produced):
+            os.replace(staging / name, folder / name)
+        # folders a script writes (e.g. the Phase II seen-id chunks) replace
+        # the previous copy as a whole
+        for sub in sorted(p for p in staging.iterdir() if p.is_dir() and p.name not in linked):
+            shutil.rmtree(folder / sub.name, ignore_errors=True)
+            os.replace(sub, folder / sub.name)
+        return stdout
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _timed_execute(stage, root, session):
+    with step(f"stage {stage.name}"):
+        return execute(stage, root, session)
+
+
+def _record(stage, current, root):
+    return {"fingerprint": current, "outputs": output_digests(stage, root)}
+
+
+def run(patterns=None, force=False, dry_run=False, workers=1,
+        in_process=False, root=CODE_ROOT, log=print):
+    """
+    Bring the selected stages up to date. Returns (ran, skipped) name lists.
+
+    Up to `workers` stages whose dependencies are complete run at the same
+    time, each as its own Python process. On the first failure no new
+    stages are started; running ones finish and the error is re-raised.
+
+    `in_process` runs every script in this interpreter with one shared
+    ReportSession; the working directory is process-wide, so stages then
+    run one at a time regardless of `workers`.
+    """
+    root = Path(root)
+    stages = select(resolve_dependencies(STAGES), patterns)
+    state = load_state(root)
+    imports = {}
+    lib_digests = {s.script: library_digest(root / s.script, root, imports)
+                   for s in stages if s.script}
+    ran, skipped = [], []
+
+    if dry_run:
+        for stage in stages:
+            current = fingerprint(stage, root, lib_digests.get(stage.script))
+            upstream_pending = any(dep in ran for dep in stage.deps)
+            if not force and not upstream_pending \
+                    and is_fresh(stage, state.get(stage.name), current, root):
+                skipped.append(stage.name)
+                log(f"  ·  {stage.name} (up to date)")
+            else:
+                ran.append(stage.name)
+                log(f"  →  {stage.name} (would run)")
+        return ran, skipped
+
+    session = None
+    if in_process:
+        session = ReportSession()
+        workers = 1
+        os.environ.setdefault("MPLBACKEND", "Agg")   # figures drawn off the main thread
+
+    pending = list(stages)
+    selected = {s.name for s in stages}
+    done = set()
+    running = {}
+    error = None
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        while pending or running:
+            # -- launch every ready stage while there is a free slot
+            progressed = True
+            while progressed and error is None:
+                progressed = False
+                for stage in list(pending):
+                    if len(running) >= max(workers, 1):
+                        break
+                    if any(d in selected and d not in done for d in stage.deps):
+                        continue
+                    pending.remove(stage)
+                    progressed = True
+
+                    current = fingerprint(stage, root, lib_digests.get(stage.script))
+                    if not force and is_fresh(stage, state.get(stage.name), current, root):
+                        skipped.append(stage.name)
+                        done.add(stage.name)
+                        log(f"  ·  {stage.name} (up to date)")
+                        continue
+
+                    log(f"  ▶  {stage.name}")
+                    running[pool.submit(_timed_execute, stage, root, session)] = (stage, current)
+
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, current = running.pop(future)
+                try:
+                    future.result()
+                except Exception as exc:  # noqa: BLE001 - reported after drain
+                    error = error or exc
+                    log(f"  ✘  {stage.name}")
+                    continue
+                state[stage.name] = _record(stage, current, root)
+                save_state(state, root)
+                done.add(stage.name)
+                ran.append(stage.name)
+
+    if error is not None:
+        raise error
+    return ran, skipped
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+predicates.py
+
+Row predicates a stage can declare for the catalog loader.
+
+A predicate is a plain tuple `(column, op, value)`:
+
+    ("year", "between", (1000, 3000))
+    ("fall", "==", "Fell")
+    ("recclass", "in", ["L6", "H5"])
+    ("mass (g)", "notna", None)
+
+Numeric comparisons (<, <=, >, >=, between) coerce the column with
+`pd.to_numeric(errors="coerce")` first, matching the scripts' own year
+validation, so unparseable values never pass. Tuples are picklable, which
+lets the parallel reader apply them inside its workers.
+"""
+
+import numpy as np
+import pandas as pd
+
+NUMERIC_OPS = {"<", "<=", ">", ">=", "between"}
+OPS = NUMERIC_OPS | {"==", "!=", "in", "not in", "notna", "isna"}
+
+
+def predicate_columns(where):
+    """Columns referenced by a list of predicates, in first-use order."""
+    cols = []
+    for col, _, _ in where or []:
+        if col not in cols:
+            cols.append(col)
+    return cols
+
+
+def validate(where):
+    for pred in where or []:
+        if len(pred) != 3 or pred[1] not in OPS:
+            raise ValueError(f"Unsupported predicate: {pred!r}")
+
+
+def _mask(series, op, value):
+    if op in NUMERIC_OPS:
+        series = pd.to_numeric(series, errors="coerce")
+        if op == "between":
+            low, high = value
+            out = series.between(low, high)
+        elif op == "<":
+            out = series < value
+        elif op == "<=":
+            out = series <= value
+        elif op == ">":
+            out = series > value
+        else:
+            out = series >= value
+        # nullable dtypes propagate <NA>; a missing value never passes
+        return out.fillna(False).to_numpy(dtype=bool)
+
+    if op == "notna":
+        return series.notna().to_numpy()
+    if op == "isna":
+        return series.isna().to_numpy()
+    if op == "in":
+        return series.isin(value).to_numpy()
+    if op == "not in":
+        return ~series.isin(value).to_numpy()
+    if op == "==":
+        return (series == value).fillna(False).to_numpy(dtype=bool)
+    return (series != value).fillna(True).to_numpy(dtype=bool)
+
+
+def apply_predicates(df, where, columns=None):
+    """
+    Keep rows of `df` that satisfy every predicate, then project onto
+    `columns` (None keeps all). The index is reset.
+    """
+    if where:
+        keep = np.ones(len(df), dtype=bool)
+        for col, op, value in where:
+            keep &= _mask(df[col], op, value)
+        df = df[keep]
+    if columns is not None:
+        df = df[list(columns)]
+    return df.reset_index(drop=True)
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+profiling.py
+
+Per-step timing and memory instrumentation for the phase scripts.
+
+    with step("kde", rows=len(counts)):
+        kde = gaussian_kde(counts)
+
+    with step("parse") as s:
+        df = pd.read_csv(INPUT)
+        s.rows = len(df)
+
+Each step records wall time, CPU time, the process's peak RSS when the
+step ends (and how much the step raised it) and the rows it handled.
+Library entry points (catalog load, session parse, streaming counts) are
+wrapped with @profiled.
+
+Recording is off unless METEORITE_PROFILE names a directory. At exit the
+process then writes
+
+    <dir>/<entry>-<timestamp>-<pid>.profile.json
+
+and, with METEORITE_TRACE=1, a Chrome trace (chrome://tracing, Perfetto)
+next to it. Trace timestamps are wall-clock microseconds, so the traces of
+several processes (run_pipeline.py --profile) line up when loaded together.
+"""
+
+import atexit
+import functools
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:         # Windows: no getrusage, peak RSS is not recorded
+    resource = None
+
+ENV_PROFILE = "METEORITE_PROFILE"
+ENV_TRACE = "METEORITE_TRACE"
+
+_records = []
+_lock = threading.Lock()
+_registered = False
+_started = datetime.now()
+
+
+def enabled():
+    return bool(os.environ.get(ENV_PROFILE))
+
+
+def peak_rss_mb():
+    """High-water resident set size of this process in MB (None if unknown)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def _script():
+    return Path(sys.argv[0]).stem if sys.argv and sys.argv[0] else "python"
+
+
+class Step:
+    """One timed region; set `rows` inside the block if it is only known there."""
+
+    __slots__ = ("name", "rows")
+
+    def __init__(self, name, rows=None):
+        self.name = name
+        self.rows = rows
+
+
+class step:
+    """Context manager that records one Step when profiling is enabled."""
+
+    def __init__(self, name, rows=None):
+        self.step = Step(name, rows)
+        self.on = enabled()
+
+    def __enter__(self):
+        if self.on:
+            self.t_wall = time.time()
+            self.t0 = time.perf_counter()
+            self.c0 = time.process_time()
+            self.rss0 = peak_rss_mb()
+        return self.step
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.on:
+            return False
+        wall = time.perf_counter() - self.t0
+        cpu = time.process_time() - self.c0
+        rss = peak_rss_mb()
+        record = {
+            "script": _script(),
+            "step": self.step.name,
+            "start": self.t_wall,
+            "wall_s": round(wall, 6),
+            "cpu_s": round(cpu, 6),
+            "peak_rss_mb": None if rss is None else round(rss, 2),
+            "rss_growth_mb": None if rss is None else round(rss - self.rss0, 2),
+            "rows": self.step.rows,
+            "thread": threading.current_thread().name,
+            "ok": exc_type is None,
+        }
+        _record(record)
+        return False
+
+
+def profiled(name):
+    """Decorator form of `step`; rows = len(result) when the result has one."""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            with step(name) as s:
+                out = fn(*args, **kwargs)
+                if hasattr(out, "__len__"):
+                    s.rows = len(out)
+                return out
+        return inner
+    return wrap
+
+
+def _record(record):
+    global _registered
+    with _lock:
+        _records.append(record)
+        if not _registered:
+            atexit.register(write_profile)
+            _registered = True
+
+
+# ---------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------
+def records():
+    with _lock:
+        return list(_records)
+
+
+def chrome_trace(recs):
+    """Chrome trace-event JSON ("X" complete events) for `recs`."""
+    pid = os.getpid()
+    events = []
+    for rec in recs:
+        events.append({
+            "name": rec["step"],
+            "cat": rec["script"],
+            "ph": "X",
+            "ts": int(rec["start"] * 1e6),
+            "dur": max(int(rec["wall_s"] * 1e6), 1),
+            "pid": pid,
+            "tid": f"{rec['script']} / {rec['thread']}",
+            "args": {k: rec[k] for k in ("cpu_s", "peak_rss_mb", "rss_growth_mb", "rows")},
+        })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_profile(folder=None):
+    """Write this process's profile (and trace) if anything was recorded."""
+    folder = folder or os.environ.get(ENV_PROFILE)
+    recs = records()
+    if not folder or not recs:
+        return None
+
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    stem = f"{_script()}-{_started:%Y%m%d-%H%M%S}-{os.getpid()}"
+
+    profile = {
+        "entry": _script(),
+        "argv": sys.argv,
+        "pid": os.getpid(),
+        "started": _started.isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "steps": recs,
+    }
+    out = folder / f"{stem}.profile.json"
+    out.write_text(json.dumps(profile, indent=1), encoding="utf-8")
+
+    if os.environ.get(ENV_TRACE, "") not in ("", "0"):
+        trace = folder / f"{stem}.trace.json"
+        trace.write_text(json.dumps(chrome_trace(recs)), encoding="utf-8")
+    return out
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+regression.py
+
+Batched simple linear regression for the Phase IV models: any number of
+outcome columns regressed on the same predictor (year) in one set of
+matrix operations.
+
+    fits = fit_ols_batch(year, np.column_stack([y_log, y_sqrt]))
+    fits["slope"]                  # array, one entry per outcome
+    results_log = select(fits, 0)  # one outcome as a dict of scalars
+
+Each outcome is fitted on the rows where both x and that outcome are
+present, so columns with different gaps still share the pass. The fit is
+the closed form on centered data,
+
+    slope = Σ(x − x̄)(y − ȳ) / Σ(x − x̄)²,   intercept = ȳ − slope · x̄,
+
+with the centered products of all outcomes formed as one (n × k) array
+product, and it returns, per outcome:
+
+    n, intercept, slope, R2, R2_adj, MAE, MSE, RMSE,
+    SE_intercept, SE_slope, ci_{intercept,slope}_{low,high},
+    t_slope, F, df (= n − 2), p_value and log10_p (two-sided Student t,
+    slope = 0), y_pred, residuals (n × k, NaN on the rows an outcome skipped)
+
+MSE is RSS / n and the standard errors use s² = RSS / (n − 2), as the
+scripts always computed them. The confidence intervals use the Student t
+critical value at `level` unless a fixed `critical` multiplier (e.g. the
+normal 1.96) is passed.
+
+P-values are computed in log space (log10_pvalue), from the log survival
+function of the t or normal distribution, so the tiny p-values of the
+year trends (1e-47 and far below) never underflow to 0 and any number of
+test statistics is handled in one vectorized call. fmt_log10_p prints
+them as "4.2577e-47" straight from the logarithm.
+"""
+
+import math
+
+import numpy as np
+
+from meteorite_eda.lazy import lazy_import
+
+special = lazy_import("scipy.special")
+stats = lazy_import("scipy.stats")
+
+SCALAR_KEYS = ["n", "intercept", "slope", "R2", "R2_adj", "MAE", "MSE", "RMSE",
+               "SE_intercept", "SE_slope", "ci_intercept_low", "ci_intercept_high",
+               "ci_slope_low", "ci_slope_high", "t_slope", "F", "df", "p_value", "log10_p"]
+LN10 = math.log(10)
+TAIL_TERMS = 30
+
+
+# ---------------------------------------------------------------------
+# Log-space p-values
+# ---------------------------------------------------------------------
+def _t_logsf_tail(t, dof):
+    # sf = I_x(ν/2, 1/2) / 2 with x = ν / (ν + t²), and for small x
+    # I_x(a, b) = x^a (1 − x)^b / (a B(a, b)) · Σ_k [(a+b)_k / (a+1)_k] x^k
+    a, b = dof / 2, 0.5
+    # log(ν + t²) written so that t² never overflows
+    log_1mx = -np.log1p(dof / t / t)
+    log_x = np.log(dof) - 2 * np.log(t) + log_1mx
+    x = np.exp(log_x)
+    term = np.ones_like(x)
+    series = np.ones_like(x)
+    for k in range(TAIL_TERMS):
+        term = term * (a + b + k) / (a + 1 + k) * x
+        series = series + term
+    return (a * log_x + b * log_1mx - np.log(a) - special.betaln(a, b)
+            + np.log(series) - np.log(2))
+
+
+def log10_pvalue(t, dof=None):
+    """
+    log10 of the two-sided p-value of test statistics `t` (any shape):
+    Student t with `dof` degrees of freedom, or standard normal when dof
+    is None.
+    """
+    t = np.abs(np.asarray(t, dtype=float))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if dof is None:
+            log_sf = stats.norm.logsf(t)
+        else:
+            dof = np.broadcast_to(np.asarray(dof, dtype=float), t.shape)
+            log_sf = stats.t.logsf(t, dof)
+            # the t survival function underflows below ~1e-308
+            deep = np.isneginf(log_sf) & np.isfinite(t) & (dof > 0)
+            if deep.any():
+                log_sf = np.where(deep, _t_logsf_tail(np.where(deep, t, 1.0),
+                                                       np.where(deep, dof, 1.0)), log_sf)
+    return ((log_sf + math.log(2)) / LN10)[()]
+
+
+def fmt_log10_p(log10_p, digits=4):
+    """A p-value given by its log10 as "c.cccce-N" (e.g. "4.2577e-47")."""
+    if np.isnan(log10_p):
+        return "nan"
+    if np.isneginf(log10_p):
+        return "0"
+    exp = math.floor(log10_p)
+    coef = round(10 ** (log10_p - exp), digits)
+    if coef >= 10:
+        coef, exp = coef / 10, exp + 1
+    return f"{coef:.{digits}f}e{exp}"
+
+
+# ---------------------------------------------------------------------
+# Batched fit
+# ---------------------------------------------------------------------
+
+
+def fit_ols_batch(x, Y, level=0.95, critical=None):
+    """
+    Regress every column of Y (n × k, or a single length-n outcome) on x.
+    Returns a dict of arrays of length k (see the module docstring).
+    """
+    x = np.asarray(x, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    if Y.ndim == 1:
+        Y = Y[:, None]
+
+    mask = ~np.isnan(Y) & ~np.isnan(x)[:, None]
+    w = mask.astype(float)
+    n = w.sum(axis=0)
+    xw = np.where(mask, x[:, None], 0.0)
+    Yw = np.where(mask, Y, 0.0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_mean = xw.sum(axis=0) / n
+        y_mean = Yw.sum(axis=0) / n
+        xc = np.where(mask, x[:, None] - x_mean, 0.0)
+        yc = np.where(mask, Y - y_mean, 0.0)
+
+        Sxx = (xc * xc).sum(axis=0)
+        Sxy = (xc * yc).sum(axis=0)
+        TSS = (yc * yc).sum(axis=0)
+
+        slope = Sxy / Sxx
+        intercept = y_mean - slope * x_mean
+
+        y_pred = np.where(mask, intercept + slope * x[:, None], np.nan)
+        residuals = Y - y_pred
+        r = np.where(mask, residuals, 0.0)
+        RSS = (r * r).sum(axis=0)
+
+        R2 = 1 - RSS / TSS
+        R2_adj = 1 - (1 - R2) * (n - 1) / (n - 2)
+
+        MSE = RSS / n
+        RMSE = np.sqrt(MSE)
+        MAE = np.abs(r).sum(axis=0) / n
+
+        dof = n - 2
+        s2 = RSS / dof
+        SE_slope = np.sqrt(s2 / Sxx)
+        SE_intercept = np.sqrt(s2 * (1 / n + x_mean ** 2 / Sxx))
+
+        t_slope = slope / SE_slope
+        F = (R2 / (1 - R2)) * dof
+
+    if critical is None:
+        critical = stats.t.ppf(0.5 + level / 2, dof)
+    log10_p = log10_pvalue(t_slope, dof)
+
+    return {
+        "n": n.astype(np.int64),
+        "intercept": intercept,
+        "slope": slope,
+        "R2": R2,
+        "R2_adj": R2_adj,
+        "MAE": MAE,
+        "MSE": MSE,
+        "RMSE": RMSE,
+        "SE_intercept": SE_intercept,
+        "SE_slope": SE_slope,
+        "ci_intercept_low": intercept - critical * SE_intercept,
+        "ci_intercept_high": intercept + critical * SE_intercept,
+        "ci_slope_low": slope - critical * SE_slope,
+        "ci_slope_high": slope + critical * SE_slope,
+        "t_slope": t_slope,
+        "F": F,
+        "df": dof.astype(np.int64),
+        "p_value": 10.0 ** log10_p,
+        "log10_p": log10_p,
+        "y_pred": y_pred,
+        "residuals": residuals,
+    }
+
+
+def select(fits, j):
+    """
+    Outcome j of a batch fit as a dict of scalars, with y_pred and
+    residuals restricted to the rows that outcome was fitted on.
+    """
+    one = {key: fits[key][j].item() for key in SCALAR_KEYS}
+    rows = ~np.isnan(fits["y_pred"][:, j])
+    one["y_pred"] = fits["y_pred"][rows, j]
+    one["residuals"] = fits["residuals"][rows, j]
+    return one
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+rolling.py
+
+Sliding-window simple regression of one or more outcomes on year.
+
+A window covers the years [start, start + window). With the rows sorted
+by x, every window is a contiguous slice [lo, hi) of rows, found for all
+windows at once with np.searchsorted. Prefix sums of
+
+    1, x, y, x², xy, y²
+
+then give each window's sums as P[hi] − P[lo], so all windows are fitted
+in one vectorized pass, O(n + windows) instead of O(n · w):
+
+    Sxx = Σx² − (Σx)²/n,  Sxy = Σxy − Σx·Σy/n,  Syy = Σy² − (Σy)²/n
+    slope = Sxy / Sxx,  intercept = ȳ − slope · x̄
+    R² = Sxy² / (Sxx · Syy),  SE_slope = sqrt((Syy − slope · Sxy) / (n − 2) / Sxx)
+
+x and y are centered on their overall means before the sums are taken,
+which keeps the differences well conditioned for calendar years. A
+window whose y (or x) is constant up to the round-off of the differences
+(FLAT_RTOL) is treated as exactly constant: slope 0 and no R². Windows
+with fewer than three points have no slope (NaN).
+
+    roll = rolling_ols(year, np.column_stack([y_log, y_sqrt]), window=50)
+    roll["start"], roll["slope"][:, 0], roll["SE_slope"][:, 0]
+"""
+
+import numpy as np
+
+ROLLING_KEYS = ["n", "slope", "intercept", "R2", "SE_slope"]
+FLAT_RTOL = 1e-9
+
+
+def _prefix(values):
+    out = np.zeros((len(values) + 1,) + values.shape[1:])
+    np.cumsum(values, axis=0, out=out[1:])
+    return out
+
+
+def rolling_ols(x, Y, window, step=1, first=None, last=None):
+    """
+    Fit every column of Y on x in each window [start, start + window),
+    for start = first, first + step, ... while start + window − 1 <= last
+    (default: the span of x). Returns {"start": (m,), "end": (m,),
+    "n": (m,), "slope" / "intercept" / "R2" / "SE_slope": (m × k)}.
+    """
+    x = np.asarray(x, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    if Y.ndim == 1:
+        Y = Y[:, None]
+    keep = ~np.isnan(x) & ~np.isnan(Y).any(axis=1)
+    order = np.argsort(x[keep], kind="stable")
+    x, Y = x[keep][order], Y[keep][order]
+
+    first = x[0] if first is None else first
+    last = x[-1] if last is None else last
+    starts = np.arange(first, last - window + 1 + step / 2, step, dtype=float)
+    ends = starts + window
+    lo = np.searchsorted(x, starts, side="left")
+    hi = np.searchsorted(x, ends, side="left")
+
+    x0 = x.mean() if len(x) else 0.0
+    y0 = Y.mean(axis=0) if len(x) else np.zeros(Y.shape[1])
+    xc = x - x0
+    yc = Y - y0
+    P_x = _prefix(xc)
+    P_xx = _prefix(xc * xc)
+    P_y = _prefix(yc)
+    P_xy = _prefix(xc[:, None] * yc)
+    P_yy = _prefix(yc * yc)
+
+    n = (hi - lo).astype(float)
+    Sx = P_x[hi] - P_x[lo]
+    Sy = P_y[hi] - P_y[lo]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        nn = np.where(n > 0, n, np.nan)[:, None]
+        x_mean = (Sx / nn[:, 0])[:, None]
+        y_mean = Sy / nn
+        Sxx_raw = (P_xx[hi] - P_xx[lo])[:, None]
+        Syy_raw = P_yy[hi] - P_yy[lo]
+        Sxx = Sxx_raw - (Sx * Sx / nn[:, 0])[:, None]
+        Sxy = (P_xy[hi] - P_xy[lo]) - Sx[:, None] * y_mean
+        Syy = Syy_raw - Sy * y_mean
+        # differences lost in the round-off of the raw sums are zero
+        Sxx = np.where(Sxx > FLAT_RTOL * Sxx_raw, Sxx, 0.0)
+        flat_y = ~(Syy > FLAT_RTOL * Syy_raw)
+        Syy = np.where(flat_y, 0.0, Syy)
+        Sxy = np.where(flat_y, 0.0, Sxy)
+
+        slope = Sxy / Sxx
+        intercept = y_mean + y0 - slope * (x_mean + x0)
+        R2 = Sxy * Sxy / (Sxx * Syy)
+        rss = np.maximum(Syy - slope * Sxy, 0.0)
+        SE_slope = np.sqrt(rss / (nn - 2) / Sxx)
+
+    fitted = (n >= 3)[:, None]
+    return {
+        "start": starts,
+        "end": ends - 1,
+        "n": n.astype(np.int64),
+        "slope": np.where(fitted, slope, np.nan),
+        "intercept": np.where(fitted, intercept, np.nan),
+        "R2": np.where(fitted, R2, np.nan),
+        "SE_slope": np.where(fitted, SE_slope, np.nan),
+    }
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+session.py
+
+One-process report session for the phase scripts.
+
+Each report script loads its phase dataset and derives the same few arrays
+(count columns as float, percentiles) on its own. Run as separate
+processes, every script pays for interpreter start-up, the pandas /
+matplotlib / scipy imports and a fresh CSV parse.
+
+A ReportSession memoizes those loads: datasets are keyed by resolved path
+plus (size, mtime_ns), so a symlinked input in a staging folder and the
+file it points to share one entry, and a rewritten file is re-read. Scripts
+call the module-level helpers, which go through the active session:
+
+    df = load_frame(INPUT)
+    vals = column(INPUT, "count_log")
+
+Run standalone, a script gets a private session and behaves exactly as
+before. Run through `ReportSession.run_script` (see run_pipeline.py
+--in-process), all scripts share the active session and the process.
+"""
+
+import contextlib
+import io
+import os
+import runpy
+import sys
+from pathlib import Path
+
+from meteorite_eda.lazy import lazy_import
+from meteorite_eda.profiling import step
+
+# the pipeline runner imports this module; keep its start-up pandas-free
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+def _key(path):
+    path = Path(path).resolve()
+    st = path.stat()
+    return str(path), st.st_size, st.st_mtime_ns
+
+
+class ReportSession:
+    """Memoized datasets and derived arrays shared by report scripts."""
+
+    def __init__(self):
+        self._frames = {}
+        self._derived = {}
+
+    def frame(self, path, **read_kwargs):
+        """
+        The dataset at `path`, parsed once per file version. Callers get a
+        copy (lazy under pandas copy-on-write), so a script that adds or
+        coerces columns does not change what the next script sees.
+        """
+        key = _key(path) + (tuple(sorted(read_kwargs.items())),)
+        if key not in self._frames:
+            with step(f"parse {Path(path).name}") as s:
+                self._frames[key] = pd.read_csv(path, **read_kwargs)
+                s.rows = len(self._frames[key])
+        return self._frames[key].copy()
+
+    def derived(self, path, name, build):
+        """Memoize `build(frame)` per file version under `name`."""
+        key = _key(path) + (name,)
+        if key not in self._derived:
+            value = build(self.frame(path))
+            if isinstance(value, np.ndarray):
+                value.setflags(write=False)
+            self._derived[key] = value
+        return self._derived[key]
+
+    def column(self, path, col, dropna=False):
+        """Column `col` as a read-only float array."""
+        def build(df):
+            values = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=float)
+            return values[~np.isnan(values)] if dropna else values
+        return self.derived(path, ("column", col, dropna), build)
+
+    def percentiles(self, path, col, qs):
+        """np.percentile of the non-missing values of `col`."""
+        qs = tuple(qs)
+        return self.derived(
+            path, ("percentiles", col, qs),
+            lambda df: np.percentile(self.column(path, col, dropna=True), qs),
+        )
+
+    def clear(self):
+        self._frames.clear()
+        self._derived.clear()
+
+    # -----------------------------------------------------------------
+    # Running scripts in this process
+    # -----------------------------------------------------------------
+    def run_script(self, script, cwd=None):
+        """
+        Execute `script` as __main__ with `cwd` as working directory and
+        this session active. Returns the script's stdout; raises
+        RuntimeError if it exits non-zero.
+        """
+        global _active
+        script = str(Path(script).resolve())
+        out = io.StringIO()
+        previous = _active
+        saved_argv, saved_path, saved_cwd = sys.argv, list(sys.path), os.getcwd()
+        _active = self
+        try:
+            sys.argv = [script]
+            sys.path.insert(0, str(Path(script).parent))
+            if cwd is not None:
+                os.chdir(cwd)
+            with contextlib.redirect_stdout(out):
+                runpy.run_path(script, run_name="__main__")
+        except SystemExit as exc:
+            if exc.code not in (None, 0):
+                raise RuntimeError(f"{Path(script).name} exited with {exc.code}") from exc
+        finally:
+            _active = previous
+            sys.argv, sys.path[:] = saved_argv, saved_path
+            os.chdir(saved_cwd)
+        return out.getvalue()
+
+
+_active = None
+
+
+def current():
+    """The active session (one is created on first use)."""
+    global _active
+    if _active is None:
+        _active = ReportSession()
+    return _active
+
+
+def load_frame(path, **read_kwargs):
+    return current().frame(path, **read_kwargs)
+
+
+def column(path, col, dropna=False):
+    return current().column(path, col, dropna)
+
+
+def percentiles(path, col, qs):
+    return current().percentiles(path, col, qs)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+sketches.py
+
+KLL quantile sketch (Karnin, Lang & Liberty, 2016) for the percentile,
+IQR-fence and "% Within IQR" columns of the outlier tables when the data
+is streamed or split across workers.
+
+The sketch keeps a stack of buffers; an item in level h stands for 2^h
+input values. When a level outgrows its capacity it is sorted and every
+other item (odd or even positions, chosen at random) is promoted to the
+level above. Capacities shrink geometrically (factor 2/3) below the top
+level, so the memory is O(k) items whatever the stream length, and two
+sketches merge by concatenating their levels.
+
+Error bound: one compaction at level h moves the rank of any query value
+by at most 2^h, with mean zero. The sketch records Σ2^h and Σ(2^h)² over
+all its compactions (merges add the sums), so
+
+    |rank error| ≤ Σ2^h                            always, and
+    |rank error| ≤ sqrt(2 · Σ(2^h)² · ln(2/δ))     with probability 1 − δ
+                                                   (Hoeffding).
+
+rank_error() reports the smaller of the two as a fraction of n. A sketch that never
+compacted (n ≤ k) is exact and reproduces np.percentile.
+
+    s = KLLSketch.of(counts)
+    q25, q50, q75 = s.quantiles([25, 50, 75])
+    inside = s.count_between(lower, upper)
+    eps = s.rank_error()          # e.g. 0.004 → ±0.4 % of the ranks
+"""
+
+import math
+import zlib
+
+import numpy as np
+
+DEFAULT_K = 200
+CAPACITY_DECAY = 2 / 3
+MIN_CAPACITY = 8
+DEFAULT_DELTA = 0.01
+
+
+class KLLSketch:
+    """Mergeable quantile sketch with O(k) memory."""
+
+    def __init__(self, k=DEFAULT_K, seed=None):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.n = 0
+        self.error_sum = 0.0         # Σ 2^h over all compactions
+        self.error_sq = 0.0          # Σ (2^h)²
+        self.min = None
+        self.max = None
+        self._rng = None if seed is None else np.random.default_rng(seed)
+
+    @classmethod
+    def of(cls, values, k=DEFAULT_K):
+        sketch = cls(k)
+        sketch.update(values)
+        return sketch
+
+    # -----------------------------------------------------------------
+    # Building
+    # -----------------------------------------------------------------
+    def update(self, values):
+        """Add a batch of values (NaNs are ignored)."""
+        x = np.asarray(values, dtype=float).ravel()
+        x = x[~np.isnan(x)]
+        if not len(x):
+            return self
+        if self._rng is None:
+            # seeded from the data: reproducible runs, yet independent
+            # offsets for sketches built from different partitions
+            self._rng = np.random.default_rng(zlib.crc32(x[:4096].tobytes()))
+        self.n += len(x)
+        lo, hi = x.min(), x.max()
+        self.min = lo if self.min is None else min(self.min, lo)
+        self.max = hi if self.max is None else max(self.max, hi)
+        self.levels[0] = np.concatenate([self.levels[0], x])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Fold another sketch in; returns self."""
+        if other.n == 0:
+            return self
+        if self._rng is None:
+            self._rng = np.random.default_rng(other._rng.integers(1 << 63))
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self.n += other.n
+        self.error_sum += other.error_sum
+        self.error_sq += other.error_sq
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._compress()
+        return self
+
+    def _capacity(self, h):
+        depth = len(self.levels) - 1 - h
+        return max(MIN_CAPACITY, int(math.ceil(self.k * CAPACITY_DECAY ** depth)))
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            items = self.levels[h]
+            if len(items) > self._capacity(h):
+                grew = h + 1 == len(self.levels)
+                if grew:
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # an odd item out stays behind at this level
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                pairs = items[:len(items) - len(keep)]
+                promoted = pairs[self._rng.integers(2)::2]
+                self.levels[h] = keep
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+                self.error_sum += float(2 ** h)
+                self.error_sq += float(4 ** h)
+                # a new top level shrinks the capacities below it
+                h = 0 if grew else h + 1
+                continue
+            h += 1
+
+    # -----------------------------------------------------------------
+    # Queries
+    # -----------------------------------------------------------------
+    def _weighted(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(lv), 2 ** h, dtype=np.int64)
+                                  for h, lv in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        return items[order], weights[order]
+
+    @property
+    def exact(self):
+        return self.error_sq == 0
+
+    def quantiles(self, percents):
+        """Values at the given percentiles (np.percentile's linear rule)."""
+        percents = np.asarray(percents, dtype=float)
+        if self.n == 0:
+            return np.full(percents.shape, np.nan)
+        items, weights = self._weighted()
+        # rank of the middle of each item's block of 2^h equal copies
+        centers = np.cumsum(weights) - (weights + 1) / 2
+        return np.interp(percents / 100 * (self.n - 1), centers, items)
+
+    def rank(self, value, inclusive=True):
+        """Estimated number of inputs <= value (< value if not inclusive)."""
+        items, weights = self._weighted()
+        side = "right" if inclusive else "left"
+        return int(weights[:np.searchsorted(items, value, side=side)].sum())
+
+    def count_between(self, lower, upper):
+        """Estimated number of inputs in [lower, upper]."""
+        return self.rank(upper) - self.rank(lower, inclusive=False)
+
+    def rank_error(self, delta=DEFAULT_DELTA):
+        """Bound on |rank error| / n that holds with probability 1 − delta."""
+        if self.n == 0:
+            return 0.0
+        bound = math.sqrt(2 * self.error_sq * math.log(2 / delta))
+        return min(bound, self.error_sum) / self.n
+
+    @property
+    def retained(self):
+        return sum(len(lv) for lv in self.levels)
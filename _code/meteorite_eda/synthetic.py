@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+synthetic.py
+
+Synthetic inputs of any size for stress-testing the phase scripts.
+
+CatalogModel
+    Distributions fitted to Meteorite_Landings.csv, separately for Fell
+    and Found records since they differ in every respect:
+        - Fell/Found ratio, nametype and recclass frequencies
+        - mass (g): inverse CDF of log10(mass) on a fine quantile grid
+          (keeps the heavy upper tail), plus the missing / zero rates
+        - year: empirical distribution of the (skewed) years + missing rate
+        - coordinates: weighted real locations with a small Gaussian
+          jitter (keeps the find-site clusters), plus the (0, 0)
+          placeholder and missing rates
+    The model is plain JSON, so a fitted model can be saved and shipped.
+
+generate_catalog
+    Writes N records with the ten catalog columns (GeoLocation as the
+    quoted "(lat, long)" pair) to CSV, or to Parquet when pyarrow is
+    installed. Chunks are generated in a process pool and written in
+    order with a bounded number in flight, so memory does not grow with
+    N. Chunk k always uses the k-th child of SeedSequence(seed), so the
+    output depends on the seed and chunk size, not on the worker count.
+
+year_count_table
+    A Phase II style [year, count] table with `rows` rows, counts drawn
+    from the real Phase II distribution. The real pipeline never has more
+    than ~2,000 years; this exists to stress the Phase III/IV computations.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CODE_ROOT = Path(__file__).resolve().parents[1]
+SOURCE_CATALOG = CODE_ROOT / "Meteorite_Landings.csv"
+SOURCE_PHASE_II = CODE_ROOT / "0_EDA_Phase_II" / "Meteorite_Landings_Phase_II.csv"
+
+COLUMNS = ["name", "id", "nametype", "recclass", "mass (g)", "fall",
+           "year", "reclat", "reclong", "GeoLocation"]
+DEFAULT_CHUNKSIZE = 200_000
+MASS_QUANTILES = 2001
+CLUSTER_JITTER_DEG = 0.05
+
+
+# ---------------------------------------------------------------------
+# Fitting
+# ---------------------------------------------------------------------
+def _freqs(series):
+    counts = series.value_counts()
+    return {"values": counts.index.tolist(),
+            "p": (counts / counts.sum()).tolist()}
+
+
+def _fit_group(df):
+    mass = pd.to_numeric(df["mass (g)"], errors="coerce")
+    positive = np.log10(mass[mass > 0].to_numpy())
+    year = pd.to_numeric(df["year"], errors="coerce")
+    lat = pd.to_numeric(df["reclat"], errors="coerce")
+    lon = pd.to_numeric(df["reclong"], errors="coerce")
+    located = lat.notna() & lon.notna()
+    zero = located & (lat == 0) & (lon == 0)
+    sites = pd.DataFrame({"lat": lat[located & ~zero], "lon": lon[located & ~zero]})
+    sites = sites.value_counts().reset_index(name="n")
+
+    n = len(df)
+    return {
+        "nametype": _freqs(df["nametype"]),
+        "recclass": _freqs(df["recclass"]),
+        "mass": {
+            "p_missing": float(mass.isna().mean()),
+            "p_zero": float((mass == 0).sum() / n),
+            "log10_quantiles": np.quantile(positive, np.linspace(0, 1, MASS_QUANTILES)).tolist(),
+        },
+        "year": {"p_missing": float(year.isna().mean()),
+                 **_freqs(year.dropna().astype(int))},
+        "coords": {
+            "p_missing": float((~located).mean()),
+            "p_zero": float(zero.mean()),
+            "lat": sites["lat"].tolist(),
+            "lon": sites["lon"].tolist(),
+            "p": (sites["n"] / sites["n"].sum()).tolist(),
+        },
+    }
+
+
+class CatalogModel:
+    """Per-fall distributions of the raw catalog columns."""
+
+    def __init__(self, params):
+        self.params = params
+        self._arrays = None
+
+    @classmethod
+    def fit(cls, source=SOURCE_CATALOG):
+        df = pd.read_csv(source)
+        fall = df["fall"].astype(str)
+        params = {"fall": _freqs(fall), "groups": {}}
+        for value in params["fall"]["values"]:
+            params["groups"][value] = _fit_group(df[fall == value])
+        return cls(params)
+
+    def save(self, path):
+        Path(path).write_text(json.dumps(self.params), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path):
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    # -----------------------------------------------------------------
+    # Sampling
+    # -----------------------------------------------------------------
+    def _group_arrays(self):
+        if self._arrays is None:
+            self._arrays = {}
+            for name, g in self.params["groups"].items():
+                self._arrays[name] = {
+                    "year_values": np.asarray(g["year"]["values"], dtype=np.int64),
+                    "year_p": np.asarray(g["year"]["p"]),
+                    "mass_q": np.asarray(g["mass"]["log10_quantiles"]),
+                    "lat": np.asarray(g["coords"]["lat"]),
+                    "lon": np.asarray(g["coords"]["lon"]),
+                    "site_p": np.asarray(g["coords"]["p"]),
+                }
+        return self._arrays
+
+    def sample(self, n, rng, first_id=1):
+        """
+        Typed frame of `n` records: ids first_id.., NaN for missing
+        values, GeoLocation not yet formatted (see format_csv_chunk).
+        """
+        fall_values = self.params["fall"]["values"]
+        fall_idx = rng.choice(len(fall_values), size=n, p=self.params["fall"]["p"])
+
+        nametype = np.empty(n, dtype=object)
+        recclass = np.empty(n, dtype=object)
+        mass = np.full(n, np.nan)
+        year = np.full(n, np.nan)
+        lat = np.full(n, np.nan)
+        lon = np.full(n, np.nan)
+
+        arrays = self._group_arrays()
+        for k, value in enumerate(fall_values):
+            rows = np.flatnonzero(fall_idx == k)
+            m = rows.size
+            if m == 0:
+                continue
+            g, a = self.params["groups"][value], arrays[value]
+
+            nt = g["nametype"]
+            nametype[rows] = np.asarray(nt["values"], dtype=object)[
+                rng.choice(len(nt["values"]), size=m, p=nt["p"])]
+            rc = g["recclass"]
+            recclass[rows] = np.asarray(rc["values"], dtype=object)[
+                rng.choice(len(rc["values"]), size=m, p=rc["p"])]
+
+            # mass: inverse CDF of log10(mass), zeros and gaps at fitted rates
+            u = rng.random(m)
+            grid = np.linspace(0, 1, a["mass_q"].size)
+            mass[rows] = 10 ** np.interp(rng.random(m), grid, a["mass_q"])
+            mass[rows[u < g["mass"]["p_zero"]]] = 0.0
+            mass[rows[rng.random(m) < g["mass"]["p_missing"]]] = np.nan
+
+            years = a["year_values"][rng.choice(a["year_values"].size, size=m, p=a["year_p"])]
+            year[rows] = years
+            year[rows[rng.random(m) < g["year"]["p_missing"]]] = np.nan
+
+            # coordinates: a real site plus jitter, or (0, 0), or missing
+            site = rng.choice(a["site_p"].size, size=m, p=a["site_p"])
+            jitter = rng.normal(0.0, CLUSTER_JITTER_DEG, size=(2, m))
+            lat[rows] = np.clip(a["lat"][site] + jitter[0], -90, 90)
+            lon[rows] = (a["lon"][site] + jitter[1] + 180) % 360 - 180
+            u = rng.random(m)
+            c = g["coords"]
+            zero = u < c["p_zero"]
+            gone = (u >= c["p_zero"]) & (u < c["p_zero"] + c["p_missing"])
+            lat[rows[zero]] = lon[rows[zero]] = 0.0
+            lat[rows[gone]] = lon[rows[gone]] = np.nan
+
+        ids = np.arange(first_id, first_id + n, dtype=np.int64)
+        return pd.DataFrame({
+            "name": np.char.add("Synthetic ", ids.astype(str)),
+            "id": ids,
+            "nametype": nametype,
+            "recclass": recclass,
+            "mass (g)": np.round(mass, 2),
+            "fall": np.asarray(fall_values, dtype=object)[fall_idx],
+            "year": pd.Series(year).astype("Int64"),
+            "reclat": np.round(lat, 5),
+            "reclong": np.round(lon, 5),
+        })
+
+
+# ---------------------------------------------------------------------
+# Formatting (same text conventions as Meteorite_Landings.csv)
+# ---------------------------------------------------------------------
+def _trim(values, decimals):
+    """'%.Nf' text with trailing zeros dropped: 21.0 → '21', 256.80 → '256.8'."""
+    text = np.char.mod(f"%.{decimals}f", np.nan_to_num(values))
+    text = np.char.rstrip(np.char.rstrip(text, "0"), ".")
+    text = np.where(text == "-0", "0", text)
+    return np.where(np.isnan(values), "", text)
+
+
+def format_csv_chunk(df, header=False):
+    lat, lon = df["reclat"].to_numpy(), df["reclong"].to_numpy()
+    lat_txt, lon_txt = _trim(lat, 5), _trim(lon, 5)
+    # GeoLocation shows Python floats, so whole numbers keep a ".0"
+    lat_geo = np.where(np.char.find(lat_txt, ".") < 0, np.char.add(lat_txt, ".0"), lat_txt)
+    lon_geo = np.where(np.char.find(lon_txt, ".") < 0, np.char.add(lon_txt, ".0"), lon_txt)
+    geo = np.char.add(np.char.add(np.char.add(np.char.add("(", lat_geo), ", "), lon_geo), ")")
+
+    out = pd.DataFrame({
+        "name": df["name"],
+        "id": df["id"],
+        "nametype": df["nametype"],
+        "recclass": df["recclass"],
+        "mass (g)": _trim(df["mass (g)"].to_numpy(), 2),
+        "fall": df["fall"],
+        "year": df["year"].astype("string").fillna(""),
+        "reclat": lat_txt,
+        "reclong": lon_txt,
+        "GeoLocation": np.where(np.isnan(lat), "", geo),
+    })
+    return out.to_csv(index=False, header=header)
+
+
+def _generate_chunk(task):
+    params, seed_seq, first_id, n, fmt = task
+    df = CatalogModel(params).sample(n, np.random.default_rng(seed_seq), first_id)
+    if fmt == "csv":
+        return format_csv_chunk(df).encode("utf-8")
+    df["GeoLocation"] = [None if np.isnan(a) else f"({a}, {b})"
+                         for a, b in zip(df["reclat"], df["reclong"])]
+    return df
+
+
+# ---------------------------------------------------------------------
+# Streaming writer
+# ---------------------------------------------------------------------
+def generate_catalog(out, rows, model=None, seed=0, workers=None,
+                     chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Write `rows` synthetic records to `out` (.csv, or .parquet with
+    pyarrow) and return `out`. `model` defaults to CatalogModel.fit().
+    """
+    out = Path(out)
+    fmt = "parquet" if out.suffix == ".parquet" else "csv"
+    if fmt == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet output needs pyarrow; write a .csv instead.")
+
+    model = model or CatalogModel.fit()
+    workers = workers or os.cpu_count() or 1
+    starts = list(range(0, rows, chunksize))
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    tasks = ((model.params, seeds[k], start + 1, min(chunksize, rows - start), fmt)
+             for k, start in enumerate(starts))
+
+    tmp = out.with_name(out.name + ".tmp")
+    writer = None
+    with open(tmp, "wb") as fh, ProcessPoolExecutor(max_workers=workers) as pool:
+        if fmt == "csv":
+            fh.write((",".join(COLUMNS) + "\n").encode("utf-8"))
+        pending = []
+        for task in tasks:
+            pending.append(pool.submit(_generate_chunk, task))
+            # keep at most 2 chunks per worker in flight → bounded memory
+            if len(pending) >= 2 * workers:
+                writer = _write_chunk(pending.pop(0).result(), fh, writer)
+        for future in pending:
+            writer = _write_chunk(future.result(), fh, writer)
+        if writer is not None:
+            writer.close()
+        elif fmt == "parquet":
+            empty = model.sample(0, np.random.default_rng(seed))
+            empty["GeoLocation"] = pd.Series(dtype=object)
+            pq.write_table(pa.Table.from_pandas(empty, preserve_index=False), fh)
+    os.replace(tmp, out)
+    return out
+
+
+def _write_chunk(chunk, fh, writer):
+    if isinstance(chunk, bytes):
+        fh.write(chunk)
+        return writer
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    table = pa.Table.from_pandas(chunk, preserve_index=False)
+    if writer is None:
+        writer = pq.ParquetWriter(fh, table.schema)
+    writer.write_table(table)
+    return writer
+
+
+def year_count_table(rows, source=SOURCE_PHASE_II, seed=0):
+    """[year, count] frame with `rows` consecutive years."""
+    counts = pd.read_csv(source)["count"].to_numpy()
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "year": np.arange(rows, dtype=np.int64),
+        "count": rng.choice(counts, size=rows).astype(np.int64),
+    })
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+transforms.py
+
+Phase III derivation from the Phase II [year, count] table:
+
+1. Remove outlier years with the 1.5 × IQR rule on `count`
+2. Add the recommended transforms:
+       count_log    = log(count + 1)
+       count_sqrt   = sqrt(count)
+       count_boxcox = Box–Cox of count, λ fitted by maximum likelihood
+
+Shared by 0_EDA_phase_III_data_transform.py and the incremental Phase II
+append mode, so both write the same Meteorite_Landings_Phase_III.csv.
+
+Power-transform λ search (Box–Cox for x > 0, Yeo–Johnson for any x):
+the profile log-likelihood
+
+    boxcox:      (λ − 1) Σ log x          − n/2 · log σ²(y_λ)
+    yeojohnson:  (λ − 1) Σ sign x · log(1 + |x|) − n/2 · log σ²(y_λ)
+
+is evaluated for a whole grid of λ (LAMBDA_GRID) and a whole batch of
+samples in one broadcast (samples × λ × values), then the best grid
+point is refined by successive parabolic steps through its neighbours.
+Samples of different sizes are rows of a NaN-padded matrix, so thousands
+of subsets cost one pass:
+
+    lam = power_lambda(counts)                        # one sample
+    lams = group_lambdas(values, groups, "yeojohnson")  # one λ per group
+
+λ is searched within the grid's range ([-2, 2] by default); an optimum
+on the boundary stays there. A constant sample gets λ = 1. Blocks of samples are sized to BLOCK_BYTES.
+"""
+
+import numpy as np
+import pandas as pd
+
+IQR_K = 1.5
+POWER_METHODS = ("boxcox", "yeojohnson")
+LAMBDA_GRID = np.linspace(-2.0, 2.0, 201)
+REFINE_STEPS = 4
+BLOCK_BYTES = 64 << 20
+
+
+def iqr_bounds(values, k=IQR_K):
+    """(lower, upper) Tukey fences of `values`."""
+    values = pd.Series(values, dtype=float)
+    q1 = values.quantile(0.25)
+    q3 = values.quantile(0.75)
+    iqr = q3 - q1
+    return q1 - k * iqr, q3 + k * iqr
+
+
+# ---------------------------------------------------------------------
+# Power transforms (broadcasting over x and λ)
+# ---------------------------------------------------------------------
+def _power(log_base, lmbda):
+    # (b^λ − 1) / λ written as expm1(λ log b) / λ, and log b at λ = 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(lmbda == 0, log_base, np.expm1(lmbda * log_base) / lmbda)
+
+
+def boxcox(x, lmbda):
+    """Box–Cox transform of x > 0."""
+    return _power(np.log(np.asarray(x, dtype=float)), lmbda)
+
+
+def yeojohnson(x, lmbda):
+    """Yeo–Johnson transform of any real x."""
+    x = np.asarray(x, dtype=float)
+    # x >= 0: ((x + 1)^λ − 1) / λ;  x < 0: −((1 − x)^(2−λ) − 1) / (2 − λ)
+    power = np.where(x >= 0, lmbda, 2 - lmbda)
+    return np.where(x >= 0, 1.0, -1.0) * _power(np.log1p(np.abs(x)), power)
+
+
+# ---------------------------------------------------------------------
+# Profile log-likelihood over a batch of samples and λ values
+# ---------------------------------------------------------------------
+def _llf_block(X, lambdas, method):
+    # X: (m × n) NaN-padded samples, lambdas: (m × L) → (m × L). The
+    # padding is replaced by the value both transforms send to 0 for every
+    # λ (1 for Box–Cox, 0 for Yeo–Johnson), so it drops out of ΣY and its
+    # share of Σ(Y − Ȳ)² is just pad · Ȳ²
+    valid = ~np.isnan(X)
+    n = valid.sum(axis=1)[:, None]
+    pad = X.shape[1] - n
+    if method == "boxcox":
+        Xz = np.where(valid, X, 1.0)
+        jac = np.log(Xz).sum(axis=1)[:, None]
+        Y = boxcox(Xz[:, None, :], lambdas[:, :, None])
+    else:
+        Xz = np.where(valid, X, 0.0)
+        jac = (np.sign(Xz) * np.log1p(np.abs(Xz))).sum(axis=1)[:, None]
+        Y = yeojohnson(Xz[:, None, :], lambdas[:, :, None])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = Y.sum(axis=2) / n
+        Y -= mean[:, :, None]
+        var = (np.einsum("mln,mln->ml", Y, Y) - pad * mean * mean) / n
+        return (lambdas - 1) * jac - n / 2 * np.log(var)
+
+
+def power_llf(X, lambdas=LAMBDA_GRID, method="boxcox"):
+    """
+    Profile log-likelihood of every λ in `lambdas` for every row of X
+    (a sample, or an (m × n) NaN-padded batch of samples) → (m × L).
+    """
+    if method not in POWER_METHODS:
+        raise ValueError(f"Unknown power transform {method!r}; use one of {POWER_METHODS}.")
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    if method == "boxcox" and (X <= 0).any():
+        raise ValueError("Box–Cox needs strictly positive data; use Yeo–Johnson.")
+    lambdas = np.asarray(lambdas, dtype=float)
+    if lambdas.ndim == 1:
+        lambdas = np.broadcast_to(lambdas, (len(X), len(lambdas)))
+
+    rows = max(1, BLOCK_BYTES // (8 * 4 * max(1, lambdas.shape[1] * X.shape[1])))
+    out = np.empty(lambdas.shape)
+    for start in range(0, len(X), rows):
+        block = slice(start, start + rows)
+        out[block] = _llf_block(X[block], lambdas[block], method)
+    return out
+
+
+def power_lambda(X, method="boxcox", grid=LAMBDA_GRID, refine=REFINE_STEPS):
+    """
+    Maximum-likelihood λ of each row of X (a float for a single sample):
+    the best point of `grid`, then `refine` parabolic steps through the
+    current estimate and its neighbours at a shrinking spacing.
+    """
+    single = np.asarray(X).ndim == 1
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    grid = np.asarray(grid, dtype=float)
+
+    # a constant (or empty) sample has no likelihood to maximize: λ = 1.
+    # Checked on the data, since round-off keeps its σ²(y_λ) just above 0
+    valid = ~np.isnan(X)
+    spread = (np.where(valid, X, -np.inf).max(axis=1, initial=-np.inf)
+              - np.where(valid, X, np.inf).min(axis=1, initial=np.inf))
+    degenerate = ~(spread > 0)
+
+    llf = power_llf(X, grid, method)
+    degenerate |= ~np.isfinite(llf).any(axis=1)
+    best = np.argmax(np.where(np.isfinite(llf), llf, -np.inf), axis=1)
+    lam = np.where(degenerate, 1.0, grid[best])
+    h = np.full(len(X), (grid[-1] - grid[0]) / max(len(grid) - 1, 1))
+    interior = (best > 0) & (best < len(grid) - 1) & ~degenerate
+
+    for _ in range(refine):
+        pts = lam[:, None] + h[:, None] * np.array([-1.0, 0.0, 1.0])
+        f_lo, f_0, f_hi = power_llf(X, pts, method).T
+        with np.errstate(invalid="ignore", divide="ignore"):
+            curv = f_lo - 2 * f_0 + f_hi
+            step = np.clip(h * (f_lo - f_hi) / (2 * curv), -h, h)
+        step = np.where(interior & (curv < 0), step, 0.0)
+        lam = np.clip(lam + step, grid[0], grid[-1])
+        h = h / 4
+
+    return float(lam[0]) if single else lam
+
+
+def group_lambdas(values, groups, method="boxcox", grid=LAMBDA_GRID):
+    """
+    λ of `values` within every group of `groups` (equal-length arrays),
+    all groups fitted in one padded batch → Series indexed by group.
+    """
+    values = np.asarray(values, dtype=float)
+    codes, uniques = pd.factorize(pd.Series(groups), sort=True)
+    keep = codes >= 0
+    codes, values = codes[keep], values[keep]
+
+    order = np.argsort(codes, kind="stable")
+    codes, values = codes[order], values[order]
+    sizes = np.bincount(codes, minlength=len(uniques))
+    starts = np.concatenate([[0], np.cumsum(sizes[:-1])])
+    X = np.full((len(uniques), max(sizes.max(initial=0), 1)), np.nan)
+    X[codes, np.arange(len(codes)) - starts[codes]] = values
+
+    return pd.Series(power_lambda(X, method, grid), index=uniques, name="lambda")
+
+
+# ---------------------------------------------------------------------
+# Phase III frame
+# ---------------------------------------------------------------------
+def phase_iii_frame(phase_ii, k=IQR_K):
+    """[year, count, count_log, count_sqrt, count_boxcox] for the non-outlier years."""
+    if "count" not in phase_ii.columns or "year" not in phase_ii.columns:
+        raise ValueError("Phase II dataset must contain 'year' and 'count' columns.")
+
+    lower, upper = iqr_bounds(phase_ii["count"], k)
+    counts = phase_ii["count"].astype(float)
+    out = phase_ii.loc[counts.between(lower, upper), ["year", "count"]].copy()
+
+    out["count_log"] = np.log1p(out["count"].astype(float))
+    out["count_sqrt"] = np.sqrt(out["count"].astype(float))
+    count = out["count"].astype(float).to_numpy()
+    out["count_boxcox"] = boxcox(count, power_lambda(count))
+    return out.reset_index(drop=True)
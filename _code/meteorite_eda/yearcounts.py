@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+yearcounts.py
+
+Out-of-core version of the Phase II aggregation in
+0_EDA_phase_II_df_maker.py:
+
+    drop_duplicates(id) → coerce year → drop missing year → int
+    → keep years in [0, 2013] → drop missing fall → count per year
+
+The catalog is read in bounded chunks (only `id`, `year`, `fall`). Ids are
+deduplicated across chunks with a packed bitmap (1 bit per possible id) and
+per-year counts are accumulated in a fixed-size array over the year range,
+so peak memory is set by the chunk size plus max(id)/8 bytes, not by the
+number of rows in the catalog.
+
+YearCountState bundles the per-year totals with the seen-id bitmap and can
+be saved next to Meteorite_Landings_Phase_II.csv, so newly arrived records
+are folded in without re-reading the catalog (append mode). The bitmap is
+kept as fixed-size chunks in a `.ids/` folder beside the state file; an
+append loads and rewrites only the chunks its ids fall in.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from meteorite_eda.profiling import profiled
+
+YEAR_MIN = 0
+YEAR_MAX = 2013
+DEFAULT_CHUNKSIZE = 1_000_000
+CHUNK_BYTES = 1 << 16
+
+
+# ---------------------------------------------------------------------
+# Seen-id bitmap
+# ---------------------------------------------------------------------
+class SeenIds:
+    """
+    Set of non-negative integer ids stored as a bitmap split into chunks
+    of CHUNK_BYTES (CHUNK_BYTES · 8 ids each).
+
+    Only the chunks an add() touches are created, loaded (from the folder
+    the set was read from) or marked dirty, so folding in a batch of ids
+    and saving it costs the chunks the batch lands in, not max(id) / 8.
+    """
+
+    def __init__(self, chunks=None, seen_nan=False, source=None):
+        self.chunks = chunks if chunks is not None else {}
+        self.seen_nan = seen_nan
+        self.source = Path(source) if source is not None else None
+        self.dirty = set(self.chunks)
+
+    @classmethod
+    def from_bits(cls, bits, seen_nan=False):
+        """A set from one contiguous bitmap (the pre-chunked state format)."""
+        chunks = {}
+        for k in range(0, bits.size, CHUNK_BYTES):
+            piece = bits[k:k + CHUNK_BYTES]
+            if piece.any():
+                chunk = np.zeros(CHUNK_BYTES, dtype=np.uint8)
+                chunk[:piece.size] = piece
+                chunks[k // CHUNK_BYTES] = chunk
+        return cls(chunks, seen_nan)
+
+    def _stored(self):
+        if self.source is None or not self.source.is_dir():
+            return []
+        return [int(p.stem) for p in self.source.glob("*.npy")]
+
+    def _chunk(self, k):
+        chunk = self.chunks.get(k)
+        if chunk is None:
+            path = self.source / f"{k}.npy" if self.source is not None else None
+            if path is not None and path.exists():
+                chunk = np.load(path)
+            else:
+                chunk = np.zeros(CHUNK_BYTES, dtype=np.uint8)
+            self.chunks[k] = chunk
+        return chunk
+
+    def load_all(self):
+        for k in self._stored():
+            self._chunk(k)
+
+    def __len__(self):
+        self.load_all()
+        return (sum(int(np.unpackbits(c).sum()) for c in self.chunks.values())
+                + int(self.seen_nan))
+
+    def add(self, ids):
+        """
+        Mark `ids` as seen and return a boolean mask that is True where the
+        id had not been seen before. `ids` must be unique within the call.
+        """
+        ids = np.asarray(ids)
+        fresh = np.ones(ids.size, dtype=bool)
+
+        if ids.dtype.kind == "f":
+            nan = np.isnan(ids)
+            if nan.any():
+                fresh[nan] = not self.seen_nan
+                self.seen_nan = True
+            valid = ~nan
+        else:
+            valid = np.ones(ids.size, dtype=bool)
+
+        keys = ids[valid].astype(np.int64)
+        if keys.size == 0:
+            return fresh
+        if keys.min() < 0:
+            raise ValueError("SeenIds only supports non-negative integer ids.")
+
+        byte = keys >> 3
+        bit = np.left_shift(1, keys & 7).astype(np.uint8)
+        which = byte // CHUNK_BYTES
+        offset = byte - which * CHUNK_BYTES
+        is_new = np.empty(keys.size, dtype=bool)
+        for k in np.unique(which):
+            rows = which == k
+            chunk = self._chunk(int(k))
+            is_new[rows] = (chunk[offset[rows]] & bit[rows]) == 0
+            np.bitwise_or.at(chunk, offset[rows], bit[rows])
+            self.dirty.add(int(k))
+        fresh[valid] = is_new
+        return fresh
+
+    def save(self, folder):
+        """Write the dirty chunks (all of them for a new folder) into `folder`."""
+        folder = Path(folder)
+        if self.source is None or folder.resolve() != self.source.resolve():
+            # a different folder gets the untouched stored chunks as well
+            self.load_all()
+            self.dirty = set(self.chunks)
+            shutil.rmtree(folder, ignore_errors=True)
+        folder.mkdir(parents=True, exist_ok=True)
+        for k in sorted(self.dirty):
+            tmp = folder / f".{k}.tmp.npy"
+            np.save(tmp, self.chunks[k])
+            os.replace(tmp, folder / f"{k}.npy")
+        self.source = folder
+        self.dirty = set()
+
+
+# ---------------------------------------------------------------------
+# Chunk cleaning + counting
+# ---------------------------------------------------------------------
+def count_chunk(chunk, seen, totals, year_min=YEAR_MIN, year_max=YEAR_MAX):
+    """
+    Apply the Phase II cleaning rules to one chunk and add its per-year
+    counts into `totals` (indexed by year - year_min). Returns the number
+    of rows that survived cleaning.
+    """
+    chunk = chunk.drop_duplicates(subset="id", keep="first")
+    chunk = chunk[seen.add(chunk["id"].to_numpy())]
+
+    year = pd.to_numeric(chunk["year"], errors="coerce")
+    keep = year.notna().to_numpy()
+    year = year[keep].astype(int).to_numpy()
+    fall_ok = chunk["fall"].notna().to_numpy()[keep]
+
+    in_range = (year >= year_min) & (year <= year_max) & fall_ok
+    year = year[in_range]
+
+    totals += np.bincount(year - year_min, minlength=totals.size)
+    return int(year.size)
+
+
+def totals_to_frame(totals, year_min=YEAR_MIN):
+    """[year, count] frame for every year with at least one record."""
+    years = np.flatnonzero(totals)
+    return pd.DataFrame({
+        "year": (years + year_min).astype(np.int64),
+        "count": totals[years].astype(np.int64),
+    })
+
+
+# ---------------------------------------------------------------------
+# Persistent aggregation state
+# ---------------------------------------------------------------------
+class YearCountState:
+    """Per-year totals plus the set of ids already counted."""
+
+    def __init__(self, totals=None, seen=None, year_min=YEAR_MIN, year_max=YEAR_MAX):
+        self.year_min = year_min
+        self.year_max = year_max
+        if totals is None:
+            totals = np.zeros(year_max - year_min + 1, dtype=np.int64)
+        self.totals = totals
+        self.seen = seen if seen is not None else SeenIds()
+
+    def ingest(self, chunk):
+        """Fold one chunk of raw rows in; returns rows counted."""
+        return count_chunk(chunk, self.seen, self.totals, self.year_min, self.year_max)
+
+    def ingest_csv(self, path, chunksize=DEFAULT_CHUNKSIZE):
+        """Fold a raw-catalog CSV in, chunk by chunk; returns rows counted."""
+        added = 0
+        reader = pd.read_csv(path, usecols=["id", "year", "fall"], chunksize=chunksize)
+        for chunk in reader:
+            added += self.ingest(chunk)
+        return added
+
+    def frame(self):
+        return totals_to_frame(self.totals, self.year_min)
+
+    @staticmethod
+    def ids_folder(path):
+        """Folder of seen-id chunks kept next to the state file at `path`."""
+        path = Path(path)
+        return path.with_name(path.name.removesuffix(".npz") + ".ids")
+
+    def save(self, path):
+        """
+        Write the totals to `path` and the seen-id chunks that changed
+        since the state was loaded into ids_folder(path).
+        """
+        path = Path(path)
+        self.seen.save(self.ids_folder(path))
+        tmp = path.with_name(path.name + ".tmp.npz")
+        np.savez_compressed(
+            tmp,
+            totals=self.totals,
+            seen_nan=np.array(self.seen.seen_nan),
+            year_range=np.array([self.year_min, self.year_max]),
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            year_min, year_max = (int(v) for v in data["year_range"])
+            seen_nan = bool(data["seen_nan"])
+            if "bits" in data:
+                seen = SeenIds.from_bits(data["bits"], seen_nan)
+            else:
+                seen = SeenIds(seen_nan=seen_nan, source=cls.ids_folder(path))
+            return cls(data["totals"].copy(), seen, year_min, year_max)
+
+
+@profiled("yearcounts.stream")
+def stream_year_counts(path, chunksize=DEFAULT_CHUNKSIZE,
+                       year_min=YEAR_MIN, year_max=YEAR_MAX, state=None):
+    """
+    Build the Phase II [year, count] table from a catalog CSV of any size.
+
+    Produces the same frame as the in-memory df_maker pipeline. Pass an
+    empty YearCountState as `state` to keep it for later appends.
+    """
+    if state is None:
+        state = YearCountState(year_min=year_min, year_max=year_max)
+    state.ingest_csv(path, chunksize)
+    return state.frame()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+run_pipeline.py
+
+Runs the Phase I → IV EDA workflow, re-executing only the stages whose
+script, the shared code it imports or its input data changed since the last run (see
+meteorite_eda/pipeline.py for the stage graph). Intermediate CSVs are
+copied into the next phase's folder automatically.
+
+Usage:
+    python run_pipeline.py                  # bring everything up to date
+    python run_pipeline.py phase_iv         # Phase IV (+ anything upstream)
+    python run_pipeline.py 'phase_*.outlier_table'
+    python run_pipeline.py --dry-run        # show what would run
+    python run_pipeline.py -j 8             # up to 8 stages at once
+    python run_pipeline.py --in-process phase_iii   # one interpreter, shared loads
+    python run_pipeline.py --profile profiles --trace  # per-step JSON profiles
+    python run_pipeline.py --force phase_iii.topology
+    python run_pipeline.py --force --no-artifact-cache   # re-render every figure
+    python run_pipeline.py --list
+"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from meteorite_eda.artifacts import ENV_ARTIFACT_CACHE  # noqa: E402
+from meteorite_eda.pipeline import STAGES, resolve_dependencies, run  # noqa: E402
+from meteorite_eda.profiling import ENV_PROFILE, ENV_TRACE  # noqa: E402
+
+parser = argparse.ArgumentParser(description="Incremental Phase I-IV pipeline runner")
+parser.add_argument("stages", nargs="*",
+                    help="stages to bring up to date: a phase (phase_ii), a full "
+                         "name or a glob (default: all)")
+parser.add_argument("--force", action="store_true",
+                    help="re-run the selected stages even if up to date")
+parser.add_argument("--dry-run", action="store_true",
+                    help="report what would run without running it")
+parser.add_argument("--list", action="store_true",
+                    help="list stages and their dependencies")
+parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1,
+                    help="stages to run concurrently (default: %(default)s)")
+parser.add_argument("--in-process", action="store_true",
+                    help="run scripts in this process, sharing loaded datasets "
+                         "(stages then run one at a time)")
+parser.add_argument("--profile", metavar="DIR",
+                    help="write per-step timing/memory profiles of every stage to DIR")
+parser.add_argument("--trace", action="store_true",
+                    help="with --profile, also write Chrome trace files")
+parser.add_argument("--no-artifact-cache", action="store_true",
+                    help="render every figure/table even if a cached copy matches")
+args = parser.parse_args()
+
+# stage scripts inherit the environment, so each one profiles itself
+if args.profile:
+    os.environ[ENV_PROFILE] = str(Path(args.profile).resolve())
+    if args.trace:
+        os.environ[ENV_TRACE] = "1"
+if args.no_artifact_cache:
+    os.environ[ENV_ARTIFACT_CACHE] = "off"
+
+if args.list:
+    for stage in resolve_dependencies(STAGES):
+        deps = ", ".join(stage.deps) or "-"
+        print(f"{stage.name:<32} ← {deps}")
+    sys.exit(0)
+
+try:
+    ran, skipped = run(args.stages, force=args.force, dry_run=args.dry_run,
+                       workers=args.workers, in_process=args.in_process)
+except RuntimeError as exc:
+    print(f"\n✘ Pipeline stopped: {exc}", file=sys.stderr)
+    sys.exit(1)
+
+verb = "would run" if args.dry_run else "ran"
+print(f"\n✔ Pipeline complete: {len(ran)} stage(s) {verb}, {len(skipped)} up to date.")
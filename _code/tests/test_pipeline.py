@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+test_pipeline.py
+
+Stage fingerprints of meteorite_eda/pipeline.py: a stage depends on the
+meteorite_eda modules its script imports (and their imports), not on the
+whole package, so editing a Phase IV-only module leaves Phase I–III alone;
+and a stage's state file (the Phase IV model store) only changes when the
+stage succeeds.
+
+    python -m pytest -q _code/tests
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+CODE_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(CODE_ROOT))
+from meteorite_eda.pipeline import (  # noqa: E402
+    PACKAGE, STAGES, Stage, _record, execute, fingerprint, imported_modules,
+    resolve_dependencies, run, save_state,
+)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """A copy of the scripts and package with placeholder inputs/outputs,
+    every stage recorded as up to date."""
+    shutil.copytree(CODE_ROOT / PACKAGE, tmp_path / PACKAGE,
+                    ignore=shutil.ignore_patterns("__pycache__"))
+    stages = resolve_dependencies(STAGES)
+    for stage in stages:
+        for rel in ([stage.script] if stage.script else []) + stage.inputs + stage.outputs:
+            dst = tmp_path / rel
+            if dst.exists():
+                continue
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            src = CODE_ROOT / rel
+            if rel == stage.script:
+                shutil.copyfile(src, dst)
+            else:
+                dst.write_text(rel, encoding="utf-8")
+    save_state({s.name: _record(s, fingerprint(s, tmp_path), tmp_path) for s in stages},
+               tmp_path)
+    return tmp_path
+
+
+def _stale(root):
+    ran, _ = run(dry_run=True, root=root, log=lambda *a: None)
+    return set(ran)
+
+
+def _edit(root, module):
+    path = root / PACKAGE / f"{module}.py"
+    path.write_text(path.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+
+
+def test_imported_modules_forms(tmp_path):
+    script = tmp_path / "script.py"
+    script.write_text(
+        "import os\n"
+        "import meteorite_eda.moments\n"
+        "from meteorite_eda.catalog import load_catalog\n"
+        "from meteorite_eda import density, hashing\n"
+        "from meteorite_edax import nothing\n"
+        "def f():\n"
+        "    from meteorite_eda.rolling import rolling_ols\n",
+        encoding="utf-8",
+    )
+    assert imported_modules(script) == {"moments", "catalog", "density", "hashing", "rolling"}
+
+
+def test_everything_up_to_date(tree):
+    assert _stale(tree) == set()
+
+
+def test_phase_iv_only_module_leaves_phase_i_to_iii_alone(tree):
+    _edit(tree, "rolling")
+    assert _stale(tree) == {"phase_iv.rolling_trend"}
+
+
+def test_module_edit_follows_indirect_imports(tree):
+    # grouped_trends imports grouped.py, which imports regression.py
+    _edit(tree, "regression")
+    stale = _stale(tree)
+    assert "phase_iv.grouped_trends" in stale
+    assert not any(name.startswith(("phase_i.", "phase_ii.", "phase_iii.")) for name in stale)
+
+
+def test_shared_module_edit_reruns_its_importers(tree):
+    _edit(tree, "transforms")
+    assert _stale(tree) >= {"phase_ii.df_maker", "phase_iii.data_transform"}
+    assert not any(name.startswith("phase_i.") for name in _stale(tree))
+
+
+
+def _state_stage(root, fail):
+    # appends to its state file, then optionally fails before finishing
+    (root / "phase").mkdir()
+    (root / "phase" / "step.py").write_text(
+        "from pathlib import Path\n"
+        "store = Path('store.txt')\n"
+        "old = store.read_text() if store.exists() else ''\n"
+        "store.write_text(old + 'x')\n"
+        f"raise SystemExit({int(fail)})\n",
+        encoding="utf-8",
+    )
+    return Stage("step", inputs=[], outputs=["phase/store.txt"], script="phase/step.py",
+                 state=["phase/store.txt"])
+
+
+def test_state_file_updated_on_success(tmp_path):
+    stage = _state_stage(tmp_path, fail=False)
+    (tmp_path / "phase" / "store.txt").write_text("x", encoding="utf-8")
+    execute(stage, tmp_path)
+    assert (tmp_path / "phase" / "store.txt").read_text(encoding="utf-8") == "xx"
+
+
+def test_failed_stage_leaves_state_file_untouched(tmp_path):
+    stage = _state_stage(tmp_path, fail=True)
+    (tmp_path / "phase" / "store.txt").write_text("x", encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        execute(stage, tmp_path)
+    assert (tmp_path / "phase" / "store.txt").read_text(encoding="utf-8") == "x"
+
+
+def test_model_store_is_compare_contrast_state():
+    stage = next(s for s in STAGES if s.name == "phase_iv.compare_contrast")
+    assert stage.state == ["0_EDA_Phase_IV/0_EDA_phase_IV_model_store.json"]
+    assert set(stage.state) <= set(stage.outputs)
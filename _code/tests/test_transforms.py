@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+test_transforms.py
+
+Box–Cox / Yeo–Johnson λ search of meteorite_eda/transforms.py against
+scipy's maximum-likelihood estimates, and the constant-sample rule.
+
+    python -m pytest -q _code/tests
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from meteorite_eda.transforms import (  # noqa: E402
+    boxcox, group_lambdas, phase_iii_frame, power_lambda, yeojohnson,
+)
+
+stats = pytest.importorskip("scipy.stats")
+
+
+def _samples(seed=0):
+    rng = np.random.default_rng(seed)
+    for _ in range(25):
+        n = int(rng.integers(8, 300))
+        yield rng.lognormal(rng.normal(), rng.uniform(0.2, 1.2), n)
+
+
+@pytest.mark.parametrize("value", [1.0, 2.0, 3.0, 7.0, 40.0])
+@pytest.mark.parametrize("method", ["boxcox", "yeojohnson"])
+def test_constant_sample_gets_lambda_one(value, method):
+    assert power_lambda(np.full(12, value), method) == 1.0
+
+
+def test_constant_groups_in_a_batch():
+    values = np.array([2.0] * 6 + [1, 3, 4, 8, 20, 2] + [7.0] * 3)
+    groups = np.array(["a"] * 6 + ["b"] * 6 + ["c"] * 3)
+    lams = group_lambdas(values, groups)
+    assert lams["a"] == 1.0 and lams["c"] == 1.0
+    assert lams["b"] == pytest.approx(stats.boxcox_normmax(values[6:12], method="mle"), abs=1e-6)
+
+
+def test_boxcox_lambda_matches_scipy():
+    for x in _samples():
+        expected = np.clip(stats.boxcox_normmax(x, method="mle"), -2, 2)
+        assert power_lambda(x) == pytest.approx(expected, abs=1e-6)
+
+
+def test_yeojohnson_lambda_matches_scipy():
+    for x in _samples(1):
+        x = np.log(x) * 3
+        expected = np.clip(stats.yeojohnson_normmax(x), -2, 2)
+        assert power_lambda(x, "yeojohnson") == pytest.approx(expected, abs=1e-6)
+
+
+def test_group_lambdas_match_one_at_a_time():
+    samples = list(_samples(2))
+    values = np.concatenate(samples)
+    groups = np.repeat(np.arange(len(samples)), [len(x) for x in samples])
+    lams = group_lambdas(values, groups)
+    for g, x in enumerate(samples):
+        assert lams[g] == pytest.approx(power_lambda(x), abs=1e-6)
+
+
+def test_transforms_match_scipy():
+    x = np.array([0.5, 1.0, 2.0, 13.0, 140.0])
+    for lam in (-1.3, 0.0, 0.42, 2.0):
+        np.testing.assert_allclose(boxcox(x, lam), stats.boxcox(x, lam), rtol=1e-12)
+        np.testing.assert_allclose(yeojohnson(x - 3, lam), stats.yeojohnson(x - 3, lam), rtol=1e-12)
+
+
+def test_phase_iii_count_boxcox():
+    counts = np.array([1, 1, 2, 3, 3, 5, 8, 13, 21, 30, 4, 2, 6])
+    phase_ii = pd.DataFrame({"year": np.arange(1900, 1900 + len(counts)), "count": counts})
+    out = phase_iii_frame(phase_ii)
+    kept = out["count"].to_numpy(dtype=float)
+    lam = stats.boxcox_normmax(kept, method="mle")
+    np.testing.assert_allclose(out["count_boxcox"], stats.boxcox(kept, lam), atol=1e-6)